@@ -1,10 +1,624 @@
 
 import sys, os
+import array
 import datetime
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import subprocess
+import tempfile
 import time
 import logging
 import multiprocessing
+import multiprocessing.connection
+import cvc5
 from cvc5.pythonic import *
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class _PoolCancellation:
+    #
+    # Stands in for the stop-event in a process of the worker pool
+    # Main cancels the job of a pool process with a message ('cancel', job) through its pipe
+    #
+    def __init__(self, m_conn):
+        self.conn = m_conn
+        self.cancelled = False
+    def is_set(self):
+        if not self.cancelled:
+            try:
+                while self.conn.poll():
+                    if self.conn.recv()[0] == 'cancel':
+                        self.cancelled = True
+            except (EOFError, OSError):
+                self.cancelled = True
+        return self.cancelled
+
+def _termFactory(m_ctx):
+    # Object that creates the terms of a pythonic context: its TermManager since cvc5 1.2, its Solver in cvc5 1.1
+    return m_ctx.tm if hasattr(m_ctx, 'tm') else m_ctx.solver
+
+class _ClauseSolver:
+    #
+    # Low-level backend of the clause encoder: variables are numbered 1, 2, ... like in DIMACS (-x is the negation of x)
+    # Every Boolean node is a gate variable with its definition (kind, child literals), the asserted literals are kept
+    # in an int array. It offers the part of the Solver interface used by the sequential versions (append, check,
+    # push, pop, set, last_result, model), solving is done by the backend (_Cvc5Backend or _ExternalBackend)
+    # toClauses() adds the clauses of the assertions to one int array with a 0 after each clause (e.g. for DIMACS),
+    # the clauses of a gate are only added for the polarity in which it is used (Plaisted-Greenbaum encoding)
+    # cvc5 expressions (structure constraints, starting guesses) are translated once by the names of their variables
+    #
+    def __init__(self, m_backend):
+        self.backend = m_backend
+        self.names = [None]
+        self.ids = {}
+        self.gates = {}
+        self.definitions = {}
+        self.assertions = array.array('i')
+        self.clauses = array.array('i')
+        self.no_clauses = 0
+        self.emitted = set()
+        self.undo = []
+        self.scopes = []
+        self.last_result = unknown
+        self.__converted = 0
+    def newVar(self, m_name=None):
+        # auxiliary variables of the gates have no name
+        self.names.append(m_name)
+        if m_name is not None:
+            self.ids[m_name] = len(self.names) - 1
+        return len(self.names) - 1
+    def var(self, m_name):
+        var = self.ids.get(m_name)
+        if var is None:
+            var = self.newVar(m_name)
+        return var
+    def addClause(self, m_literals):
+        self.clauses.extend(m_literals)
+        self.clauses.append(0)
+        self.no_clauses += 1
+    def gate(self, m_kind, m_items):
+        #
+        # Literal of the node (m_kind, m_items), the items are literals or Python bools
+        # Constants are folded, structurally equal nodes share their gate variable
+        #
+        if m_kind == Kind.NOT:
+            return (not m_items[0]) if isinstance(m_items[0], bool) else -m_items[0]
+        if m_kind == Kind.IMPLIES:
+            return self.gate(Kind.OR, [self.gate(Kind.NOT, [m_items[0]]), m_items[1]])
+        if m_kind == Kind.XOR:
+            return self.gate(Kind.NOT, [self.gate(Kind.EQUAL, m_items)])
+        if m_kind == Kind.AND or m_kind == Kind.OR:
+            absorbing = m_kind == Kind.OR
+            literals = set()
+            for item in m_items:
+                if isinstance(item, bool):
+                    if item == absorbing:
+                        return absorbing
+                else:
+                    literals.add(item)
+            if len(literals) == 0:
+                return not absorbing
+            if len(literals) == 1:
+                return literals.pop()
+            key = (m_kind,) + tuple(sorted(literals))
+        elif m_kind == Kind.EQUAL and len(m_items) == 2:
+            a, b = m_items
+            if isinstance(a, bool):
+                a, b = b, a
+            if isinstance(a, bool):
+                return a == b
+            if isinstance(b, bool):
+                return a if b else -a
+            if a == b or a == -b:
+                return a == b
+            # (a == b) == (-a == -b), the first literal is stored positive
+            if abs(a) > abs(b):
+                a, b = b, a
+            if a < 0:
+                a, b = -a, -b
+            key = (m_kind, a, b)
+        elif m_kind == Kind.ITE:
+            c, t, e = m_items
+            if isinstance(c, bool):
+                return t if c else e
+            if isinstance(t, bool) or isinstance(e, bool):
+                return self.gate(Kind.OR, [self.gate(Kind.AND, [c, t]), self.gate(Kind.AND, [-c, e])])
+            if t == e:
+                return t
+            if c < 0:
+                c, t, e = -c, e, t
+            key = (m_kind, c, t, e)
+        else:
+            raise ValueError("the clause encoder does not support %s" % m_kind)
+        g = self.gates.get(key)
+        if g is None:
+            g = self.newVar()
+            self.gates[key] = g
+            self.definitions[g] = key
+        return g
+    def require(self, m_literal):
+        #
+        # Add the clauses of the gates below m_literal that are needed to make m_literal imply its definition
+        # (for a negative literal: the negation of the definition), each gate and polarity is added once
+        #
+        stack = [m_literal]
+        while len(stack) > 0:
+            literal = stack.pop()
+            key = self.definitions.get(abs(literal))
+            if key is None or literal in self.emitted:
+                continue
+            self.emitted.add(literal)
+            if len(self.scopes) > 0:
+                self.undo.append(literal)
+            g = abs(literal)
+            children = key[1:]
+            if key[0] == Kind.AND and literal > 0:
+                for x in children:
+                    self.addClause((-g, x))
+                stack.extend(children)
+            elif key[0] == Kind.AND:
+                self.addClause([g] + [-x for x in children])
+                stack.extend([-x for x in children])
+            elif key[0] == Kind.OR and literal > 0:
+                self.addClause([-g] + list(children))
+                stack.extend(children)
+            elif key[0] == Kind.OR:
+                for x in children:
+                    self.addClause((g, -x))
+                stack.extend([-x for x in children])
+            elif key[0] == Kind.EQUAL:
+                a, b = children
+                if literal > 0:
+                    self.addClause((-g, -a, b))
+                    self.addClause((-g, a, -b))
+                else:
+                    self.addClause((g, a, b))
+                    self.addClause((g, -a, -b))
+                stack.extend((a, -a, b, -b))
+            else:
+                c, t, e = children
+                if literal > 0:
+                    self.addClause((-g, -c, t))
+                    self.addClause((-g, c, e))
+                    stack.extend((c, -c, t, e))
+                else:
+                    self.addClause((g, -c, -t))
+                    self.addClause((g, c, -e))
+                    stack.extend((c, -c, -t, -e))
+    def literal(self, m_term):
+        # translate a cvc5 term, its variables are numbered by name
+        if m_term.getKind() == Kind.CONSTANT:
+            return self.var(m_term.getSymbol())
+        if m_term.isBooleanValue():
+            return m_term.getBooleanValue()
+        return self.gate(m_term.getKind(), [self.literal(child) for child in m_term])
+    def append(self, m_item):
+        # m_item is a literal, a Python bool or a cvc5 expression, False is stored as literal 0
+        if isinstance(m_item, BoolRef):
+            m_item = self.literal(m_item.ast)
+        if m_item is not True:
+            self.assertions.append(0 if m_item is False else m_item)
+    def toClauses(self):
+        #
+        # Add the clauses of the assertions since the last call, asserted conjunctions are split into their parts
+        # and an asserted disjunction becomes one clause of its children
+        #
+        stack = list(reversed(self.assertions[self.__converted:]))
+        self.__converted = len(self.assertions)
+        while len(stack) > 0:
+            literal = stack.pop()
+            key = self.definitions.get(abs(literal))
+            if key is not None and (key[0] == Kind.AND or key[0] == Kind.OR):
+                children = list(key[1:]) if literal > 0 else [-x for x in key[1:]]
+                # And, Not(Or): conjunction of the children, Or, Not(And): disjunction of the children
+                if (key[0] == Kind.AND) == (literal > 0):
+                    stack.extend(children)
+                    continue
+                for x in children:
+                    self.require(x)
+                self.addClause(children)
+                continue
+            if literal != 0:
+                self.require(literal)
+            self.addClause(() if literal == 0 else (literal,))
+    def check(self, *m_assumptions):
+        #
+        # Solve the assertions with the backend, m_assumptions (literals or cvc5 expressions) only hold for this call
+        #
+        assumptions = []
+        for assumption in m_assumptions:
+            literal = self.literal(assumption.ast) if isinstance(assumption, BoolRef) else assumption
+            if literal is False:
+                self.last_result = unsat
+                return self.last_result
+            if literal is not True:
+                assumptions.append(literal)
+        try:
+            self.last_result = self.backend.check(self, assumptions)
+        except KeyboardInterrupt:
+            self.backend.cancel()
+            raise
+        return self.last_result
+    def push(self):
+        # backtracking point, pop() removes the assertions added after it and their clauses (the gates are kept)
+        # the gates whose clauses are emitted inside a scope are logged in undo, pop() marks only those as not emitted
+        self.backend.push(self)
+        self.scopes.append((len(self.assertions), len(self.clauses), self.no_clauses, self.__converted, len(self.undo)))
+    def pop(self):
+        no_assertions, no_literals, self.no_clauses, self.__converted, no_undo = self.scopes.pop()
+        for literal in self.undo[no_undo:]:
+            self.emitted.discard(literal)
+        del self.undo[no_undo:]
+        del self.assertions[no_assertions:]
+        del self.clauses[no_literals:]
+        self.backend.pop(self)
+    def set(self, m_option, m_value):
+        self.backend.set(m_option, m_value)
+    def model(self):
+        return _ClauseModel(self.backend.model(self))
+    def symbol(self, m_literal):
+        # SMT-LIB2 symbol of a literal, gates are named by their number
+        name = self.names[abs(m_literal)] or 'gate' + str(abs(m_literal))
+        return name if m_literal > 0 else '(not ' + name + ')'
+    def writeDimacs(self, m_path, m_assumptions=()):
+        # the names of the variables are written as comments 'c <id> <name>', the assumptions as unit clauses
+        self.toClauses()
+        with open(m_path, 'w') as file:
+            for name, var in self.ids.items():
+                file.write("c %s %s\n" % (var, name))
+            file.write("p cnf %s %s\n" % (len(self.names) - 1, self.no_clauses + len(m_assumptions)))
+            clause = []
+            for literal in self.clauses:
+                clause.append(str(literal))
+                if literal == 0:
+                    file.write(' '.join(clause) + '\n')
+                    clause = []
+            for literal in m_assumptions:
+                file.write("%s 0\n" % literal)
+    def writeSmtlib(self, m_path, m_assumptions=()):
+        #
+        # SMT-LIB2 script: the named variables are declared, the gates are defined in the order of their numbers
+        # (the children of a gate always have lower numbers) and the values of the named variables are asked for
+        #
+        operators = {Kind.AND: 'and', Kind.OR: 'or', Kind.EQUAL: '=', Kind.ITE: 'ite'}
+        with open(m_path, 'w') as file:
+            file.write("(set-logic QF_UF)\n(set-option :produce-models true)\n")
+            for var in range(1, len(self.names)):
+                key = self.definitions.get(var)
+                if key is None:
+                    file.write("(declare-const %s Bool)\n" % self.symbol(var))
+                else:
+                    file.write("(define-fun %s () Bool (%s %s))\n" % (self.symbol(var), operators[key[0]], ' '.join(self.symbol(x) for x in key[1:])))
+            for literal in self.assertions:
+                file.write("(assert %s)\n" % ('false' if literal == 0 else self.symbol(literal)))
+            if len(m_assumptions) > 0:
+                file.write("(check-sat-assuming (%s))\n" % ' '.join(self.symbol(literal) for literal in m_assumptions))
+            else:
+                file.write("(check-sat)\n")
+            if len(self.ids) > 0:
+                file.write("(get-value (%s))\n" % ' '.join(self.ids))
+
+class _ClauseModel:
+    #
+    # Model of the clause encoder, evaluates cvc5 expressions over the values of the named variables
+    # eval() and [] return BoolVal like the model of the Solver
+    #
+    def __init__(self, m_values):
+        self.values = m_values
+    def eval(self, m_expr):
+        return BoolVal(self.__evaluate(m_expr.ast))
+    def __getitem__(self, m_expr):
+        return self.eval(m_expr)
+    def __evaluate(self, m_term):
+        kind = m_term.getKind()
+        if kind == Kind.CONSTANT:
+            return self.values.get(m_term.getSymbol(), False)
+        if m_term.isBooleanValue():
+            return m_term.getBooleanValue()
+        children = [self.__evaluate(child) for child in m_term]
+        if kind == Kind.NOT:
+            return not children[0]
+        if kind == Kind.AND:
+            return all(children)
+        if kind == Kind.OR:
+            return any(children)
+        if kind == Kind.EQUAL:
+            return all(child == children[0] for child in children)
+        if kind == Kind.XOR:
+            return children[0] != children[1]
+        if kind == Kind.IMPLIES:
+            return not children[0] or children[1]
+        if kind == Kind.ITE:
+            return children[1] if children[0] else children[2]
+        raise ValueError("the clause encoder does not support %s" % kind)
+
+class _Cvc5Backend:
+    #
+    # Backend of the clause solver that runs cvc5 in this process through its base API
+    # The gates are built as terms, so cvc5 still sees the structure of the formulas, and new assertions are added incrementally
+    # cvc5 can not be interrupted from Python, cancel() has no effect
+    # Terms are created by a TermManager since cvc5 1.2, by the Solver itself in cvc5 1.1
+    #
+    def __init__(self):
+        if hasattr(cvc5, 'TermManager'):
+            self.tm = cvc5.TermManager()
+            self.sol = cvc5.Solver(self.tm)
+        else:
+            self.sol = cvc5.Solver()
+            self.tm = self.sol
+        self.sol.setOption('produce-models', 'true')
+        self.terms = [None]
+        self.fed = 0
+    def term(self, m_literal):
+        return self.terms[m_literal] if m_literal > 0 else self.tm.mkTerm(Kind.NOT, self.terms[-m_literal])
+    def check(self, m_solver, m_assumptions):
+        self.feed(m_solver)
+        if len(m_assumptions) > 0:
+            result = self.sol.checkSatAssuming(*[self.term(literal) for literal in m_assumptions])
+        else:
+            result = self.sol.checkSat()
+        return sat if result.isSat() else (unsat if result.isUnsat() else unknown)
+    def feed(self, m_solver):
+        #
+        # Hand the gates and assertions added since the last call to cvc5
+        # The children of a gate always have lower numbers, so the terms are built in the order of the variables
+        #
+        boolean = self.tm.getBooleanSort()
+        for var in range(len(self.terms), len(m_solver.names)):
+            key = m_solver.definitions.get(var)
+            if key is None:
+                self.terms.append(self.tm.mkConst(boolean, m_solver.names[var]))
+            else:
+                self.terms.append(self.tm.mkTerm(key[0], *[self.term(x) for x in key[1:]]))
+        for literal in m_solver.assertions[self.fed:]:
+            self.sol.assertFormula(self.tm.mkFalse() if literal == 0 else self.term(literal))
+        self.fed = len(m_solver.assertions)
+    def push(self, m_solver):
+        # the assertions before the backtracking point have to be in cvc5 before its scope is opened
+        self.feed(m_solver)
+        self.sol.push()
+    def pop(self, m_solver):
+        self.sol.pop()
+        self.fed = len(m_solver.assertions)
+    def set(self, m_option, m_value):
+        self.sol.setOption(m_option, str(m_value))
+    def model(self, m_solver):
+        # only the named variables are read back
+        names = list(m_solver.ids)
+        values = self.sol.getValue([self.terms[m_solver.ids[name]] for name in names])
+        return dict(zip(names, [value.getBooleanValue() for value in values]))
+    def cancel(self):
+        pass
+
+class _ExternalBackend:
+    #
+    # Backend of the clause solver that writes the problem as DIMACS or SMT-LIB2 and runs a solver binary on it
+    # The binary is called as m_command + [file] and has to print its answer to stdout:
+    # dimacs: 's SATISFIABLE' and 'v' lines (SAT competition format, e.g. kissat, cadical)
+    # smtlib: the answer to check-sat followed by the answer to get-value (e.g. cvc5, z3, yices-smt2)
+    # Binaries are not incremental, every check writes and solves the whole problem again (push and pop need no
+    # backend state) and solver options like time limits are not passed on
+    # Without a command nothing is solved and the result is unknown
+    #
+    def __init__(self, m_format, m_command):
+        self.format = m_format
+        self.command = list(m_command)
+        self.values = {}
+        self.process = None
+        self.cancelled = False
+    def check(self, m_solver, m_assumptions):
+        self.cancelled = False
+        if len(self.command) == 0:
+            return unknown
+        handle, path = tempfile.mkstemp(suffix='.cnf' if self.format == 'dimacs' else '.smt2')
+        os.close(handle)
+        try:
+            if self.format == 'dimacs':
+                m_solver.writeDimacs(path, m_assumptions)
+            else:
+                m_solver.writeSmtlib(path, m_assumptions)
+            self.process = subprocess.Popen(self.command + [path], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            output = self.process.communicate()[0]
+        except OSError as error:
+            logging.error("ERROR: the solver %s could not be run: %s", ' '.join(self.command), error)
+            return unknown
+        finally:
+            self.process = None
+            os.remove(path)
+        if self.cancelled:
+            return unknown
+        if self.format == 'dimacs':
+            return self.__readDimacsAnswer(m_solver, output)
+        return self.__readSmtlibAnswer(m_solver, output)
+    def __readDimacsAnswer(self, m_solver, m_output):
+        status = None
+        values = {}
+        for line in m_output.splitlines():
+            if line.startswith('s '):
+                status = line[2:].strip()
+            elif line.startswith('v '):
+                for literal in line[2:].split():
+                    if int(literal) != 0:
+                        values[abs(int(literal))] = int(literal) > 0
+        self.values = {name: values.get(var, False) for name, var in m_solver.ids.items()}
+        if status == 'SATISFIABLE':
+            return sat
+        if status == 'UNSATISFIABLE':
+            return unsat
+        logging.error("ERROR: no answer of the solver %s", ' '.join(self.command))
+        return unknown
+    def __readSmtlibAnswer(self, m_solver, m_output):
+        lines = [line.strip() for line in m_output.splitlines() if len(line.strip()) > 0]
+        status = lines[0] if len(lines) > 0 else None
+        self.values = {name: value == 'true' for name, value in re.findall(r'\(\s*([^\s()]+)\s+(true|false)\s*\)', m_output)}
+        if status == 'sat':
+            return sat
+        if status == 'unsat':
+            return unsat
+        if status != 'unknown':
+            logging.error("ERROR: no answer of the solver %s", ' '.join(self.command))
+        return unknown
+    def push(self, m_solver):
+        pass
+    def pop(self, m_solver):
+        pass
+    def set(self, m_option, m_value):
+        pass
+    def model(self, m_solver):
+        return self.values
+    def cancel(self):
+        # may be called from another thread while check() waits for the binary
+        self.cancelled = True
+        process = self.process
+        if process is not None:
+            process.kill()
+
+class LUT_Network:
+    #
+    # A found LUT-structure, decoded from the model of the solver (runSolver stores it in Logic_Generator.result)
+    # sources[lut][ins] = selected signal (0 ... no_inputs - 1 global inputs, then the LUT-outputs)
+    # tables[lut][outs] = truth table of the LUT-output, index with LUT-input 0 as MSB
+    # final[g_out] = LUT-output (lut * LUT_outputs + outs) that drives the global output
+    # It is evaluated bit-parallel: every signal is a Python int with bit 'case' holding its value in that case
+    #
+    def __init__(self, m_no_inputs, m_LUT_outputs, m_sources, m_tables, m_final):
+        self.no_inputs = m_no_inputs
+        self.LUT_outputs = m_LUT_outputs
+        self.sources = m_sources
+        self.tables = m_tables
+        self.final = m_final
+    @staticmethod
+    def inputBitsets(m_no_inputs):
+        #
+        # Bitsets over all cases for each global input, bit 'case' of inputs[i] is the value of input i in that case
+        # Input 0 is the MSB of the case, so inputs[i] alternates in blocks of 2 ** (no_inputs - 1 - i) cases
+        #
+        no_cases = 2 ** m_no_inputs
+        inputs = []
+        for i in range(0, m_no_inputs):
+            block = 2 ** (m_no_inputs - 1 - i)
+            bits = ((1 << block) - 1) << block
+            length = 2 * block
+            while length < no_cases:
+                bits |= bits << length
+                length *= 2
+            inputs.append(bits)
+        return inputs
+    def simulate(self):
+        #
+        # Evaluate the network on all 2 ** no_inputs cases at once, returns one bitset per global output
+        # Each LUT-output is a multiplexer tree over its truth table, selected by the LUT-inputs (input 0 = MSB)
+        #
+        mask = (1 << (2 ** self.no_inputs)) - 1
+        signals = self.inputBitsets(self.no_inputs)
+        for lut in range(0, len(self.sources)):
+            # a LUT-output of this or a later LUT is never driven, selecting it gives a constant False (as in the encoding)
+            ins = [signals[x] if x < len(signals) else 0 for x in self.sources[lut]]
+            for outs in range(0, self.LUT_outputs):
+                level = [mask if entry else 0 for entry in self.tables[lut][outs]]
+                for sel in reversed(ins):
+                    level = [level[i] if level[i] == level[i + 1] else (level[i] & ~sel) | (level[i + 1] & sel) for i in range(0, len(level), 2)]
+                signals.append(level[0])
+        return [signals[self.no_inputs + i] for i in self.final]
+    def mismatches(self, m_truth_table, m_limit=10):
+        #
+        # The first (lowest) m_limit cases in which a global output of the network differs from m_truth_table
+        # m_truth_table[g_out][case] is True, False or None (don't care, never a mismatch), as calcOutput returns it
+        # An empty list means the network implements the function
+        #
+        digits = bytes.maketrans(b'\x00\x01', b'01')
+        mask = (1 << (2 ** self.no_inputs)) - 1
+        wrong = 0
+        for g_out, simulated in enumerate(self.simulate()):
+            # bytes of 0 / 1 as a binary number, case 0 is the LSB (None counts as 0 and is masked out by care)
+            expected = int(bytes(map(bool, reversed(m_truth_table[g_out]))).translate(digits), 2)
+            care = mask
+            if None in m_truth_table[g_out]:
+                care = int(bytes(out is not None for out in reversed(m_truth_table[g_out])).translate(digits), 2)
+            wrong |= (simulated ^ expected) & care
+        cases = []
+        while wrong != 0 and len(cases) < m_limit:
+            low = wrong & -wrong
+            cases.append(low.bit_length() - 1)
+            wrong ^= low
+        return cases
+    def toSource(self, m_name='evaluate', m_chunk=2 ** 16):
+        #
+        # Python source of a NumPy function m_name(m_cases, m_out=None) that evaluates the network on a batch of cases
+        # m_cases holds case numbers (input 0 = MSB, e.g. a memory-mapped array), the result holds the packed outputs
+        # (output 0 = MSB) in the smallest unsigned type that fits, m_out can be a preallocated (memory-mapped) array
+        # Every LUT is one lookup in a precomputed array: its index is gathered from the bits of its sources, the entry
+        # packs all LUT-outputs (tab<lut>) and the global outputs the LUT drives (out<lut>)
+        # The cases are processed in chunks of m_chunk, so the intermediate arrays stay in the cache
+        #
+        no_outputs = len(self.final)
+        out_type = 'uint8' if no_outputs <= 8 else 'uint16' if no_outputs <= 16 else 'uint32' if no_outputs <= 32 else 'uint64'
+        case_type = 'uint32' if self.no_inputs <= 32 else 'uint64'
+        lut_type = 'uint8' if self.LUT_outputs <= 8 else 'uint16' if self.LUT_outputs <= 16 else 'uint32' if self.LUT_outputs <= 32 else 'uint64'
+        lines = ["# LUT-structure generated by the LogicGenerator: %s global inputs, %s global outputs, %s LUTs" % (self.no_inputs, no_outputs, len(self.sources)),
+                 "import numpy as np", ""]
+        # LUTs whose outputs feed a later LUT and LUTs that drive a global output, the others are not evaluated
+        internal = set((x - self.no_inputs) // self.LUT_outputs for lut in range(0, len(self.sources)) for x in self.sources[lut]
+                       if self.no_inputs <= x < self.no_inputs + lut * self.LUT_outputs)
+        drivers = set(out // self.LUT_outputs for out in self.final)
+        for lut in range(0, len(self.sources)):
+            size = 2 ** len(self.sources[lut])
+            if lut in internal:
+                packed = [sum(int(self.tables[lut][o][entry]) << (self.LUT_outputs - 1 - o) for o in range(0, self.LUT_outputs)) for entry in range(0, size)]
+                lines.append("_tab%s = np.array(%s, dtype=np.%s)" % (lut, packed, lut_type))
+            if lut in drivers:
+                drives = [g_out for g_out in range(0, no_outputs) if self.final[g_out] // self.LUT_outputs == lut]
+                packed = [sum(int(self.tables[lut][self.final[g_out] % self.LUT_outputs][entry]) << (no_outputs - 1 - g_out) for g_out in drives) for entry in range(0, size)]
+                lines.append("_out%s = np.array(%s, dtype=np.%s)" % (lut, packed, out_type))
+        lines += ["", "def %s(m_cases, m_out=None):" % m_name,
+                  "    if m_out is None:",
+                  "        m_out = np.empty(len(m_cases), dtype=np.%s)" % out_type,
+                  "    for start in range(0, len(m_cases), %s):" % m_chunk,
+                  "        c = np.asarray(m_cases[start:start + %s]).astype(np.%s, copy=False)" % (m_chunk, case_type),
+                  "        out = np.zeros(len(c), dtype=np.%s)" % out_type]
+        for lut in range(0, len(self.sources)):
+            if lut not in internal and lut not in drivers:
+                continue
+            terms = []
+            k = len(self.sources[lut])
+            for ins, x in enumerate(self.sources[lut]):
+                position = k - 1 - ins
+                if x < self.no_inputs:
+                    shift = self.no_inputs - 1 - x - position
+                    signal = 'c'
+                elif x < self.no_inputs + lut * self.LUT_outputs:
+                    # LUT-outputs of this or a later LUT are never driven and stay constant False
+                    shift = self.LUT_outputs - 1 - (x - self.no_inputs) % self.LUT_outputs - position
+                    signal = "l%s.astype(np.%s)" % ((x - self.no_inputs) // self.LUT_outputs, case_type)
+                else:
+                    continue
+                if shift > 0:
+                    terms.append("((%s >> %s) & %s)" % (signal, shift, 1 << position))
+                elif shift < 0:
+                    terms.append("((%s << %s) & %s)" % (signal, -shift, 1 << position))
+                else:
+                    terms.append("(%s & %s)" % (signal, 1 << position))
+            lines.append("        i%s = %s" % (lut, ' | '.join(terms) if len(terms) > 0 else "np.zeros(len(c), dtype=np.%s)" % case_type))
+            if lut in internal:
+                lines.append("        l%s = _tab%s.take(i%s)" % (lut, lut, lut))
+            if lut in drivers:
+                lines.append("        out |= _out%s.take(i%s)" % (lut, lut))
+        lines += ["        m_out[start:start + len(c)] = out", "    return m_out", ""]
+        return '\n'.join(lines)
+    def compile(self, m_name='evaluate'):
+        # the function of toSource, ready to be called (needs NumPy)
+        if np is None:
+            logging.error("ERROR: the evaluator of a LUT_Network needs NumPy, which could not be imported")
+            return None
+        namespace = {}
+        exec(self.toSource(m_name), namespace)
+        return namespace[m_name]
 
 class Logic_Generator:
     def __init__(self):
@@ -22,16 +636,57 @@ class Logic_Generator:
         #
         self.__version = 'parallel'
         self.__exe_mode = 'F'
+        self.__amo_encoding = 'auto'
+        self.__input_selection = 'onehot'
+        self.__lut_encoding = 'minterm'
+        self.__encoder = 'pythonic'
+        self.__backend = 'cvc5'
+        self.__case_order = 'ascending'
         self.printConfig = True
         self.benchmark = False
+        self.batchedOutput = False
+        self.symmetryBreaking = False
         self.no_processes = 4
         self.depth = 2
+        self.progressInterval = 1.0
+        self.dynamicCubes = False
+        self.cubeSplitTime = 1.0
+        self.cegisCounterexamples = 4
+        self.incBatchTime = 0.1
+        self.incBatchResources = 10 ** 5
+        self.caseOrderSeed = 0
+        self.decompositionGuesses = False
+        self.feasibilityCheck = True
+        self.feasibilityCheckBudget = 2 ** 20
+        self.portfolio = []
+        self.cancelTimeout = 1.0
+        self.cacheDir = None
+        self.cacheMaxSize = 256 * 2 ** 20
+        self.resultDatabase = False
+        self.npnBudget = 2 ** 12
+        self.dimacsFile = None
+        self.smtlibFile = None
+        self.evaluatorFile = None
+        self.solverCommand = None
+        self.result = None
         self.no_LUT = 2
         self.LUT_inputs = 4
         self.LUT_outputs = 1
         self.no_inputs = 6
         self.no_outputs = 1
         self.updateInputIndexLength()
+        self.__pool = None
+        self.__pool_job = 0
+        self.__pool_encodings = None
+        self.__nodes = {}
+        self.__no_internal = 0
+        self.__order = []
+        self.__case_hardness = {}
+        self.__excluded_inputs = []
+        self.__final_LUTs = []
+        self.__hint_sources = []
+        self.__hint_final = []
+        self.__verdict = unknown
     def testCvc5(self):
         x, y = Reals('x y')
         solve(0 < x, 0 < y, x + y < 1, x <= y)
@@ -43,6 +698,7 @@ class Logic_Generator:
     
     def updateInputIndexLength(self):
         self.input_index_length = self.no_inputs + ((self.no_LUT - 1) * self.LUT_outputs)
+        self.select_length = max(1, math.ceil(math.log2(self.input_index_length)))
     
     def log(self, m_message):
         logging.info(m_message)
@@ -51,27 +707,56 @@ class Logic_Generator:
         logging.info("Current configuration of the Logic_Generator")
         logging.info("version: %s", self.__version)
         logging.info("exe_mode: %s", self.__exe_mode)
+        logging.info("amo_encoding: %s", self.__amo_encoding)
+        logging.info("input_selection: %s", self.__input_selection)
+        logging.info("lut_encoding: %s", self.__lut_encoding)
+        logging.info("encoder: %s", self.__encoder)
+        logging.info("backend: %s", self.__backend)
+        logging.info("case_order: %s", self.__case_order)
         logging.info("printConfig: %s", self.printConfig)
         logging.info("benchmark: %s", self.benchmark)
+        logging.info("batchedOutput: %s", self.batchedOutput)
+        logging.info("symmetryBreaking: %s", self.symmetryBreaking)
         logging.info("no_processes: %s", self.no_processes)
         logging.info("depth: %s", self.depth)
+        logging.info("progressInterval: %s", self.progressInterval)
+        logging.info("dynamicCubes: %s", self.dynamicCubes)
+        logging.info("cubeSplitTime: %s", self.cubeSplitTime)
+        logging.info("cegisCounterexamples: %s", self.cegisCounterexamples)
+        logging.info("incBatchTime: %s", self.incBatchTime)
+        logging.info("incBatchResources: %s", self.incBatchResources)
+        logging.info("caseOrderSeed: %s", self.caseOrderSeed)
+        logging.info("decompositionGuesses: %s", self.decompositionGuesses)
+        logging.info("feasibilityCheck: %s", self.feasibilityCheck)
+        logging.info("feasibilityCheckBudget: %s", self.feasibilityCheckBudget)
+        logging.info("portfolio: %s", self.portfolio)
+        logging.info("cancelTimeout: %s", self.cancelTimeout)
+        logging.info("cacheDir: %s", self.cacheDir)
+        logging.info("cacheMaxSize: %s", self.cacheMaxSize)
+        logging.info("resultDatabase: %s", self.resultDatabase)
+        logging.info("npnBudget: %s", self.npnBudget)
+        logging.info("dimacsFile: %s", self.dimacsFile)
+        logging.info("smtlibFile: %s", self.smtlibFile)
+        logging.info("evaluatorFile: %s", self.evaluatorFile)
+        logging.info("solverCommand: %s", self.solverCommand)
         logging.info("self.no_LUT: %s", self.no_LUT)
         logging.info("LUT_inputs: %s", self.LUT_inputs)
         logging.info("LUT_outputs: %s", self.LUT_outputs)
         logging.info("self.no_inputs: %s", self.no_inputs)
         logging.info("no_outputs: %s", self.no_outputs)
         logging.info("input_index_length: %s", self.input_index_length)
+        logging.info("select_length: %s", self.select_length)
     def setVersion(self, m_version):
         #
-        # The version can only be changed by function to make sure a valid version is entered (basic, inc or parallel)
+        # The version can only be changed by function to make sure a valid version is entered (basic, inc, parallel, cegis or portfolio)
         #
-        if m_version == 'basic' or m_version == 'inc' or m_version == 'parallel':
+        if m_version == 'basic' or m_version == 'inc' or m_version == 'parallel' or m_version == 'cegis' or m_version == 'portfolio':
             self.__version = m_version
             if not self.benchmark:
                 logging.info("Version set to %s", self.__version)
         else:
             logging.error("ERROR: Invalid Version entered: '%s'", m_version)
-            logging.error("ERROR: Has to be 'basic', 'inc' or 'parallel'")
+            logging.error("ERROR: Has to be 'basic', 'inc', 'parallel', 'cegis' or 'portfolio'")
     def setExecutionMode(self, m_exe_mode):
         #
         # The execution mode can only be changed by function to make sure a valid execution mode is entered (F or ZV)
@@ -83,7 +768,224 @@ class Logic_Generator:
         else:
             logging.error("ERROR: Invalid Execution_mode entered: '%s'", m_exe_mode)
             logging.error("ERROR: Has to be 'F' or 'ZV'")
+    def setAmoEncoding(self, m_amo_encoding):
+        #
+        # The encoding of the at-most-one constraints for the LUT-input selection and the final output mapping
+        # can only be changed by function to make sure a valid encoding is entered (auto, pairwise, sequential, commander or product)
+        # auto chooses the encoding by the number of variables of each constraint
+        #
+        if m_amo_encoding == 'auto' or m_amo_encoding == 'pairwise' or m_amo_encoding == 'sequential' or m_amo_encoding == 'commander' or m_amo_encoding == 'product':
+            self.__amo_encoding = m_amo_encoding
+            if not self.benchmark:
+                logging.info("Amo_encoding set to %s", self.__amo_encoding)
+        else:
+            logging.error("ERROR: Invalid Amo_encoding entered: '%s'", m_amo_encoding)
+            logging.error("ERROR: Has to be 'auto', 'pairwise', 'sequential', 'commander' or 'product'")
+    def setInputSelection(self, m_input_selection):
+        #
+        # The selection of the LUT-inputs can only be changed by function to make sure a valid selection is entered (onehot or binary)
+        # onehot uses input_index_length variables per LUT-input, binary uses select_length bits driving a multiplexer tree
+        # Both selections can be combined with the execution modes F and ZV
+        #
+        if m_input_selection == 'onehot' or m_input_selection == 'binary':
+            self.__input_selection = m_input_selection
+            if not self.benchmark:
+                logging.info("Input_selection set to %s", self.__input_selection)
+        else:
+            logging.error("ERROR: Invalid Input_selection entered: '%s'", m_input_selection)
+            logging.error("ERROR: Has to be 'onehot' or 'binary'")
+    def setLutEncoding(self, m_lut_encoding):
+        #
+        # The evaluation of the LUT truth tables can only be changed by function to make sure a valid encoding is entered (minterm or mux)
+        # minterm is a sum of 2 ** LUT_inputs minterms, mux is a balanced If-tree over the Loutx bits driven by the LUT-inputs
+        # Both encodings can be combined with the execution modes F and ZV
+        #
+        if m_lut_encoding == 'minterm' or m_lut_encoding == 'mux':
+            self.__lut_encoding = m_lut_encoding
+            if not self.benchmark:
+                logging.info("Lut_encoding set to %s", self.__lut_encoding)
+        else:
+            logging.error("ERROR: Invalid Lut_encoding entered: '%s'", m_lut_encoding)
+            logging.error("ERROR: Has to be 'minterm' or 'mux'")
+    def setEncoder(self, m_encoder):
+        #
+        # The encoder can only be changed by function to make sure a valid encoder is entered (pythonic or clauses)
+        # pythonic builds the formulas as cvc5 expressions, clauses numbers the variables and Tseitin-encodes the
+        # formulas into integer clauses, which are handed to cvc5 by its base API (only for the versions basic and inc)
+        # The clauses are numbered per run, so the clause encoder does not use the encoding cache of cacheDir
+        #
+        if m_encoder == 'pythonic' or m_encoder == 'clauses':
+            self.__encoder = m_encoder
+            if not self.benchmark:
+                logging.info("Encoder set to %s", self.__encoder)
+        else:
+            logging.error("ERROR: Invalid Encoder entered: '%s'", m_encoder)
+            logging.error("ERROR: Has to be 'pythonic' or 'clauses'")
+    def setBackend(self, m_backend):
+        #
+        # The backend of the clause encoder can only be changed by function to make sure a valid backend is entered (cvc5, dimacs or smtlib)
+        # cvc5 solves in this process through the base API of cvc5, dimacs and smtlib write the problem in that format
+        # and run solverCommand (list of the binary and its arguments, the file is appended) as a subprocess
+        #
+        if m_backend == 'cvc5' or m_backend == 'dimacs' or m_backend == 'smtlib':
+            self.__backend = m_backend
+            if not self.benchmark:
+                logging.info("Backend set to %s", self.__backend)
+        else:
+            logging.error("ERROR: Invalid Backend entered: '%s'", m_backend)
+            logging.error("ERROR: Has to be 'cvc5', 'dimacs' or 'smtlib'")
+    def setCaseOrder(self, m_case_order):
+        #
+        # The order in which the inc and parallel versions add the cases can only be changed by function to make sure a valid
+        # order is entered: ascending, descending, gray (neighbouring cases differ in one input), random (caseOrderSeed),
+        # balanced (the combinations of output values take turns), diverse (every case as far from the previous ones as
+        # possible by Hamming distance) or hardest (the cases that refuted structures in previous runs of the same truth table first)
+        #
+        if m_case_order in ('ascending', 'descending', 'gray', 'random', 'balanced', 'diverse', 'hardest'):
+            self.__case_order = m_case_order
+            if not self.benchmark:
+                logging.info("Case_order set to %s", self.__case_order)
+        else:
+            logging.error("ERROR: Invalid Case_order entered: '%s'", m_case_order)
+            logging.error("ERROR: Has to be 'ascending', 'descending', 'gray', 'random', 'balanced', 'diverse' or 'hardest'")
 
+    def __enter__(self):
+        #
+        # Inside 'with Logic_Generator() as lg:' the processes of the parallel and the portfolio version are kept alive
+        # between the calls of runSolver() and receive the next problem through their pipe
+        # The processes are started on demand, when a run needs more of them than the pool has
+        #
+        self.__pool = []
+        return self
+    def __exit__(self, m_exc_type, m_exc_value, m_traceback):
+        #
+        # Tell all processes of the pool to exit, terminate the ones that do not end in time
+        #
+        for entry in self.__pool:
+            if entry is not None:
+                try:
+                    entry[1].send(('exit',))
+                except OSError:
+                    pass
+        for entry in self.__pool:
+            if entry is not None:
+                entry[0].join(self.cancelTimeout)
+                if entry[0].is_alive():
+                    entry[0].terminate()
+                    entry[0].join()
+                entry[1].close()
+        if not self.benchmark:
+            logging.info("Main: worker pool with %s processes has been closed", len(self.__pool))
+        self.__pool = None
+        return False
+    def __startPoolJob(self, m_tasks):
+        #
+        # Start missing or dead processes of the pool and send each of the first len(m_tasks) processes its task
+        # The problem is sent as a description: all plain settings including the truth table, and the starting-guesses
+        # as nested tuples (the functions given to runSolver can not be sent through a pipe)
+        #
+        while len(self.__pool) < len(m_tasks):
+            self.__pool.append(None)
+        for index in range(len(m_tasks)):
+            if self.__pool[index] is None or not self.__pool[index][0].is_alive():
+                main_conn, proc_conn = multiprocessing.Pipe()
+                proc = multiprocessing.Process(target=self.__poolWorkerFunction, args=(index, proc_conn), daemon=True)
+                proc.start()
+                proc_conn.close()
+                self.__pool[index] = (proc, main_conn)
+        self.__pool_job += 1
+        problem = self.__createProblemDescription()
+        for index in range(len(m_tasks)):
+            self.__pool[index][1].send(('solve', self.__pool_job, problem, m_tasks[index]))
+        return [self.__pool[i][0] for i in range(len(m_tasks))], [self.__pool[i][1] for i in range(len(m_tasks))]
+    def __cancelPoolJob(self, m_no_tasks):
+        #
+        # Cancel the job in the first m_no_tasks processes and wait for their ('done', job)
+        # Everything a process sends before that belongs to the cancelled job and is dropped
+        # Processes that do not answer within cancelTimeout are still inside the solver, they are terminated
+        # and replaced at the start of the next job
+        #
+        waiting = {}
+        for index in range(m_no_tasks):
+            try:
+                self.__pool[index][1].send(('cancel', self.__pool_job))
+            except OSError:
+                pass
+            waiting[self.__pool[index][1]] = index
+        deadline = time.perf_counter() + self.cancelTimeout
+        while len(waiting) > 0 and time.perf_counter() < deadline:
+            for conn in multiprocessing.connection.wait(list(waiting), max(0, deadline - time.perf_counter())):
+                try:
+                    while conn in waiting and conn.poll():
+                        message = conn.recv()
+                        if message[0] == 'done' and message[1] == self.__pool_job:
+                            del waiting[conn]
+                except (EOFError, OSError):
+                    del waiting[conn]
+        for conn, index in waiting.items():
+            self.__pool[index][0].terminate()
+            self.__pool[index][0].join()
+            conn.close()
+            self.__pool[index] = None
+        if not self.benchmark:
+            logging.info("Main: job %s cancelled, %s processes had to be terminated", self.__pool_job, len(waiting))
+    def __createProblemDescription(self):
+        #
+        # Plain settings (numbers, strings, lists, dicts) are copied, the starting-guesses are evaluated in Main
+        #
+        problem = {}
+        for key, value in self.__dict__.items():
+            if key not in ('_Logic_Generator__pool', '_Logic_Generator__pool_encodings', '_Logic_Generator__nodes') and (value is None or isinstance(value, (bool, int, float, str, list, dict))):
+                problem[key] = value
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+        guesses = self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, index_final_output, index_LUT_inputs, index_LUT_outputs)
+        problem['starting_guesses'] = [self.__serializeTerm(guess.ast) for guess in guesses]
+        return problem
+    def __serializeTerm(self, m_term):
+        # Boolean variable -> name, constant -> bool, everything else -> (kind, children...)
+        if m_term.getKind() == Kind.CONSTANT:
+            return m_term.getSymbol()
+        if m_term.isBooleanValue():
+            return m_term.getBooleanValue()
+        return (m_term.getKind().value,) + tuple(self.__serializeTerm(child) for child in m_term)
+    def __deserializeTerm(self, m_data):
+        if isinstance(m_data, str):
+            return Bool(m_data).ast
+        if isinstance(m_data, bool):
+            return BoolVal(m_data).ast
+        return _termFactory(main_ctx()).mkTerm(Kind(m_data[0]), *[self.__deserializeTerm(child) for child in m_data[1:]])
+    def __poolWorkerFunction(self, idx, m_conn):
+        #
+        # Loop of a pool process: wait for the next message of Main
+        # ('solve', job, problem, task) loads the problem and runs the task with the solving function of its version
+        # ('cancel', job) is answered with ('done', job), also if the job already ended; ('exit',) ends the process
+        # The encodings of the last problems are kept between the jobs (see poolEncoding)
+        #
+        self.__pool = None
+        self.__pool_encodings = {}
+        while True:
+            try:
+                message = m_conn.recv()
+            except (EOFError, OSError):
+                return
+            if message[0] == 'exit':
+                return
+            if message[0] == 'cancel':
+                m_conn.send(('done', message[1]))
+                continue
+            job, problem, task = message[1], message[2], message[3]
+            guesses = [BoolRef(self.__deserializeTerm(guess), main_ctx()) for guess in problem.pop('starting_guesses')]
+            self.__dict__.update(problem)
+            self.__nodes = {}
+            self.__no_internal = 0
+            self.__createStartingGuesses = lambda *args: guesses
+            cancellation = _PoolCancellation(m_conn)
+            if task[0] == 'parallel':
+                self.__parallelSolvingFunction(task[1], task[2], task[3], m_conn, cancellation)
+            else:
+                self.__portfolioSolvingFunction(task[1], task[2], m_conn, cancellation)
+            if cancellation.is_set():
+                m_conn.send(('done', job))
     def runDefault(self):
         def defaultStartingGuesses(m_no_LUT, m_LUT_inputs, m_LUT_outputs, m_no_inputs, m_no_outputs, m_input_index_length, m_index_final_output, m_index_LUT_inputs, m_index_LUT_outputs):
             # if no starting guesses should be implemented, return an empty list []
@@ -108,7 +1010,101 @@ class Logic_Generator:
         #
         self.__calcOutput = m_calcOutput
         self.__createStartingGuesses = m_createStartingGuesses
+        self.result = None
             
+        #
+        # Check the settings, calculate the truth table and check its feasibility (see prepareProblem)
+        #
+        if not self.__prepareProblem(self.__version):
+            return
+
+        #
+        # Look the function up in the result database (if resultDatabase): a function of the same NPN class was solved
+        # before with the same LUT-structure, its result is transformed to this function and the solver is not run
+        #
+        self.__verdict = unknown
+        database_key, transform = self.__resultDatabaseKey()
+        if database_key is not None:
+            start_lookup = time.perf_counter()
+            verdict = self.__loadResult(database_key, transform)
+            end_lookup = time.perf_counter()
+            if verdict is not None:
+                self.__verdict = verdict
+                logging.info("End Program %s with %s after %s s - Result database", os.path.basename(sys.argv[0]), verdict, end_lookup - start_lookup)
+                self.__finishResult()
+                return
+
+        #
+        # Find the starting hints on the truth table (if decompositionGuesses)
+        # Unlike the starting-guesses they are only assumptions of the solver and are dropped if they prevent a solution
+        #
+        self.__hint_sources, self.__hint_final = [], []
+        if self.decompositionGuesses:
+            self.__hint_sources, self.__hint_final = self.__analyseDecomposition()
+        self.__nodes = {}
+        self.__no_internal = 0
+        self.__order = self.__createCaseOrder(self.__case_order, self.caseOrderSeed)
+
+        #
+        # Check which version should be run and execute corresponding function
+        #
+        if self.__version == 'basic':
+            self.__runBasic()
+        elif self.__version == 'inc':
+            self.__runInc()
+        elif self.__version == 'parallel' and self.dynamicCubes:
+            self.__runCubeAndConquer()
+        elif self.__version == 'parallel':
+            self.__runParallel()
+        elif self.__version == 'cegis':
+            self.__runCegis()
+        elif self.__version == 'portfolio':
+            self.__runPortfolio()
+        else:
+            logging.error("ERROR: unexpected case in 'runSolver()'")
+
+        #
+        # Store the answer in the result database, for every function of the same NPN class (if resultDatabase)
+        #
+        if database_key is not None:
+            self.__storeResult(database_key, transform)
+        self.__finishResult()
+    def __finishResult(self):
+        #
+        # Check the found LUT-structure against the truth table outside the solver (if not benchmark)
+        #
+        if self.result is not None and not self.benchmark:
+            start_verify = time.perf_counter()
+            mismatches = self.verifyResult()
+            end_verify = time.perf_counter()
+            if len(mismatches) > 0:
+                logging.error("ERROR: the found LUT-structure is wrong in the cases %s", mismatches)
+            else:
+                logging.info("Verification of the found LUT-structure took:\t%s s", end_verify - start_verify)
+
+        #
+        # Write the found LUT-structure as a Python/NumPy module with the function evaluate (if evaluatorFile)
+        #
+        if self.result is not None and self.evaluatorFile is not None:
+            with open(self.evaluatorFile, 'w') as file:
+                file.write(self.result.toSource())
+            if not self.benchmark:
+                logging.info("Evaluator of the found LUT-structure written to %s", self.evaluatorFile)
+    def verifyResult(self, m_limit=10):
+        #
+        # Simulate the LUT-structure of the last runSolver on all cases, returns the first m_limit cases in which it
+        # differs from the truth table (don't cares excluded), an empty list if it is correct
+        #
+        if self.result is None:
+            logging.error("ERROR: there is no result to verify")
+            return None
+        return self.result.mismatches(self.__truth_table, m_limit)
+    def __prepareProblem(self, m_version):
+        #
+        # Everything the runners of m_version need before the encoding, returns False if the solver is not run
+        # (invalid settings or a LUT-structure that can not implement the truth table)
+        #
+
         #
         # Update InputIndexLength in case it has not been updated by the user
         #
@@ -119,28 +1115,107 @@ class Logic_Generator:
         #
         if self.no_inputs < self.LUT_inputs:
             logging.error("ERROR: Number of global Inputs can not be lower than the LUT Size")
-            return 0
+            return False
 
         #
         # In case of invalid version or exe_mode give Error (should not be able to happen)
         #
-        if self.__version != 'basic' and self.__version != 'inc' and self.__version != 'parallel':
-            logging.error("ERROR: unexpected version: %s", self.__version)
-            return 0
+        if m_version != 'basic' and m_version != 'inc' and m_version != 'parallel' and m_version != 'cegis' and m_version != 'portfolio':
+            logging.error("ERROR: unexpected version: %s", m_version)
+            return False
         elif self.__exe_mode != 'F' and self.__exe_mode != 'ZV':
             logging.error("ERROR: unexpected execution mode: %s", self.__exe_mode)
-            return 0
+            return False
+        elif self.__encoder == 'clauses' and m_version != 'basic' and m_version != 'inc':
+            logging.error("ERROR: the clause encoder is only available for the versions basic and inc")
+            return False
+        elif self.__backend != 'cvc5' and self.__encoder != 'clauses':
+            logging.error("ERROR: the backend %s needs the clause encoder", self.__backend)
+            return False
+        elif self.__backend != 'cvc5' and not self.solverCommand and (self.dimacsFile if self.__backend == 'dimacs' else self.smtlibFile) is None:
+            logging.error("ERROR: the backend %s needs a solverCommand (or the %sFile to only write the problem)", self.__backend, self.__backend)
+            return False
+        
         #
-        # Check which version should be run and execute corresponding function
+        # Calculate the expected outputs for all cases once, before any runner starts
+        # The truth table is shared by all runners (and all processes in the parallel version)
         #
-        elif self.__version == 'basic':
-            self.__runBasic()
-        elif self.__version == 'inc':
-            self.__runInc()
-        elif self.__version == 'parallel':
-            self.__runParallel()
-        else:
-            logging.error("ERROR: unexpected case in 'runSolver()'")
+        self.__truth_table = self.__createTruthTable()
+        if self.__truth_table is None:
+            return False
+
+        #
+        # Check on the truth table whether the LUT-structure can implement the function at all (if feasibilityCheck)
+        # An impossible structure ends the run without any solver call, otherwise the candidates may be narrowed
+        #
+        self.__excluded_inputs = []
+        self.__final_LUTs = [list(range(0, self.no_LUT)) for g_out in range(0, self.no_outputs)]
+        if self.feasibilityCheck:
+            start_check = time.perf_counter()
+            reason = self.__checkFeasibility()
+            end_check = time.perf_counter()
+            if not self.benchmark:
+                logging.info("Feasibility check took:\t%s s", end_check - start_check)
+            if reason is not None:
+                if not self.benchmark:
+                    logging.info("Result is: unsat")
+                logging.info("End Program %s with unsat after %s s - Feasibility check: %s", os.path.basename(sys.argv[0]), end_check - start_check, reason)
+                return False
+        return True
+    def enumerateSolutions(self, m_calcOutput, m_createStartingGuesses, m_max_solutions, m_modulo_symmetry=False):
+        #
+        # Generator of up to m_max_solutions different LUT-structures of the function as (LUT_Network, time of the solver call in s)
+        # The problem is encoded once like in the basic version and the solver is kept alive: after every solution a blocking
+        # clause over the structural variables (LUT-input selection and fOut) excludes its wiring and the solver is run again
+        # Only the connections that matter are blocked, LUT-inputs the truth table does not depend on and LUTs no global output
+        # depends on are free, so the next solution differs in a used connection (and does not only add connections)
+        # With m_modulo_symmetry the order of the inputs of a LUT does not count, swapping independent LUTs is only excluded
+        # by symmetryBreaking. The version is ignored, the other settings are the ones of runSolver
+        #
+        self.__calcOutput = m_calcOutput
+        self.__createStartingGuesses = m_createStartingGuesses
+        self.result = None
+        if not self.__prepareProblem('basic'):
+            return
+        start_process = time.perf_counter()
+        self.__hint_sources, self.__hint_final = [], []
+        self.__nodes = {}
+        self.__no_internal = 0
+
+        #
+        # Generate the constraints of the LUT-structure and the clauses of all cases once
+        #
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+        self.__sol, indices = self.__createSolver(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+        for constraint in self.__createStructureConstraints(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select):
+            self.__sol.append(constraint)
+        for case in range(0, 2 ** self.no_inputs):
+            for clause in self.__createCaseClauses(case, *indices):
+                self.__sol.append(clause)
+        if not self.benchmark:
+            logging.info("Clause Generation took:\t%s s", time.perf_counter() - start_process)
+
+        #
+        # Solve, hand out the solution and block its wiring until the solver finds no further one
+        #
+        no_solutions = 0
+        while no_solutions < m_max_solutions:
+            start_solve = time.perf_counter()
+            self.__sol.check()
+            end_solve = time.perf_counter()
+            if self.__sol.last_result != sat:
+                if not self.benchmark:
+                    logging.info("No further solution (%s) after %s s", self.__sol.last_result, end_solve - start_solve)
+                break
+            no_solutions += 1
+            self.result = self.__decodeLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
+            if not self.benchmark:
+                logging.info("Solution %s found after %s s", no_solutions, end_solve - start_solve)
+                if self.printConfig:
+                    self.__printResultingLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
+            self.__sol.append(self.__createBlockingClause(self.result, index_final_output, index_LUT_inputs, m_modulo_symmetry))
+            yield self.result, end_solve - start_solve
+        logging.info("End Program %s - Solutions: %s - Total: %s s", os.path.basename(sys.argv[0]), no_solutions, time.perf_counter() - start_process)
 
     def __runBasic(self):
         #
@@ -153,30 +1228,17 @@ class Logic_Generator:
         #
         # Generate all indices that are independent of F and ZV
         #
-        index_final_output = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * self.no_outputs):
-            index_final_output.append(Bool('fOut' + str(i)))
-        index_LUT_inputs = []
-        for i in range(0, (self.no_LUT * self.LUT_inputs * self.input_index_length)):
-            index_LUT_inputs.append(Bool('Linx' + str(i)))
-        index_LUT_outputs = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs)):
-            index_LUT_outputs.append(Bool('Loutx' + str(i)))
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
         #
         # Switch between F and ZV, generate the respective variables and output their sizes (if not benchmark)
         #
         if self.__exe_mode == 'F':
             if not self.benchmark:
-                logging.info("generated xout[%s], xin[%s], xfinal[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output))
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output))
         elif self.__exe_mode == 'ZV':
-            internal_inputs = []
-            for i in range(0, self.no_LUT * self.LUT_inputs * (2 ** self.no_inputs)):
-                internal_inputs.append(Bool('IntIn' + str(i)))
-            internal_outputs = []
-            for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.no_inputs)):
-                internal_outputs.append(Bool('IntOut' + str(i)))
+            # the internal variables are created per case when the clauses of the case are generated
             if not self.benchmark:
-                logging.info("generated xout[%s], xin[%s], xfinal[%s], intIn[%s], intOut[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output), len(internal_inputs), len(internal_outputs))
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s], intIn[%s], intOut[%s] per case", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output), self.no_LUT * self.LUT_inputs, self.no_LUT * self.LUT_outputs)
         else:
             logging.error("ERROR: unexpected execution mode")
             return 0
@@ -184,7 +1246,7 @@ class Logic_Generator:
         #
         # Instantiate Solver
         #
-        self.__sol = Solver()
+        self.__sol, indices = self.__createSolver(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
         
         #
         # Start timer for the generation of the clauses
@@ -192,81 +1254,37 @@ class Logic_Generator:
         start_generateClauses = time.perf_counter()
 
         #
-        # Generate the constraints for the final outputs for each final output
-        #
-        for g_out in range(0, self.no_outputs):
-            self.__sol.append(self.__createFinalOutputConstraints(index_final_output, g_out))
-        
-        #
-        # Generate the constraints for the Inputs of the LUTs for each LUT
+        # Load the constraints and the clauses of the cases from the encoding cache (if cacheDir is set)
         #
-        for lut in range(0, self.no_LUT):
-            self.__sol.append(self.__createLutInputConstraints(index_LUT_inputs, lut))
-        
+        cache_key = self.__encodingCacheKey(index_final_output, index_LUT_inputs, index_LUT_outputs)
+        structure, cases = self.__loadEncoding(cache_key)
+        no_cached = len(cases)
+
         #
-        # Generate Starting-Guesses
+        # Generate the constraints of the LUT-structure and the Starting-Guesses
         #
-        startingGuesses = self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, index_final_output, index_LUT_inputs, index_LUT_outputs)
-        for guess in startingGuesses:
-            self.__sol.append(guess)
+        if structure is None:
+            structure = self.__createStructureConstraints(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+        for constraint in structure:
+            self.__sol.append(constraint)
 
         #
         # Generate LUT-Clauses
         #
         for case in range(0, 2 ** self.no_inputs):
             #
-            # calculate the configuration of global inputs for each case
-            #
-            inputs = []
-            for exp in range(self.no_inputs - 1, -1, -1):
-                inputs.append((int)(case / (2 ** exp)) % 2)
-
-            #
-            # Switch between F and ZV
+            # Generate the clauses of the LUT-structure for this case (if not cached) and add them to the solver
             #
-            if self.__exe_mode == 'F':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # store all clauses in the corresponding 'internal_Xput_formulas' list
-                # in createInternalInputFormula only internal_output_formulas of previous LUTs need to be used (already in the list)
-                # in createInternalOutputFormular only internal_input_formulas of the same LUT need to be used (already in the list)
-                #
-                internal_input_formulas = []
-                internal_output_formulas = []
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        internal_input_formulas.append(self.__F_createLutInputFormula(index_LUT_inputs, inputs, internal_output_formulas, lut, ins))
-                    for outs in range(0, self.LUT_outputs):
-                        internal_output_formulas.append(self.__F_createLutOutputFormular(index_LUT_outputs, internal_input_formulas, lut, outs))
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    self.__sol.append(out == self.__F_createFinalOutputFormula(index_final_output, internal_output_formulas, g_out))
-                    
-            elif self.__exe_mode == 'ZV':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # add all clauses directly to the solver
-                #
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        self.__sol.append(self.__ZV_createLutInputFormula(index_LUT_inputs, internal_inputs, internal_outputs, inputs, lut, ins, case))
-                    for outs in range(0, self.LUT_outputs):
-                        self.__sol.append(self.__ZV_createLutOutputFormula(index_LUT_outputs, internal_inputs, internal_outputs, lut, outs, case))
-
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    self.__sol.append(out == self.__ZV_createFinalOutputFormula(index_final_output, internal_outputs, g_out, case))
-            else:
-                logging.error("ERROR: unexpected execution mode")
-                return 0
+            if case >= no_cached:
+                cases.append(self.__createCaseClauses(case, *indices))
+            for clause in cases[case]:
+                self.__sol.append(clause)
+        if len(cases) > no_cached:
+            self.__storeEncoding(cache_key, structure, cases)
+        if self.dimacsFile is not None and self.__encoder == 'clauses':
+            self.__sol.writeDimacs(self.dimacsFile)
+        if self.smtlibFile is not None and self.__encoder == 'clauses':
+            self.__sol.writeSmtlib(self.smtlibFile)
 
         #
         # Stop timer for the generation of the clauses and output it if not benchmark
@@ -279,8 +1297,10 @@ class Logic_Generator:
         # Run the Solver with the previous added clauses and time the duration of the execution (output if not benchmark)
         #
         start_solveClauses = time.perf_counter()
-        self.__sol.check()
+        self.__checkWithHints(self.__sol, self.__createHints(index_final_output, index_LUT_inputs))
         end_solveClauses = time.perf_counter()
+        if self.__sol.last_result == sat:
+            self.result = self.__decodeLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
         if not self.benchmark:
             logging.info("Solving took:\t\t%s s", end_solveClauses - start_solveClauses)
             logging.info("Result is: %s", self.__sol.last_result)
@@ -297,11 +1317,13 @@ class Logic_Generator:
             else:
                 logging.info("No solution was found")
             logging.info("Result is: %s", self.__sol.last_result)
+        self.__logInternalVariables()
         
         #
         # Stop timer for the whole process and output program-name, total time, time for clause-generation and time of solving
         #
         end_process = time.perf_counter()
+        self.__verdict = self.__sol.last_result
         logging.info("End Program %s - Gen: %s s - Solve: %s s - Total: %s s", os.path.basename(sys.argv[0]), end_generateClauses - start_generateClauses, end_solveClauses - start_solveClauses, end_process - start_process)
     def __runInc(self):
         #
@@ -315,30 +1337,17 @@ class Logic_Generator:
         #
         # Generate all indices that are independent of F and ZV
         #
-        index_final_output = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * self.no_outputs):
-            index_final_output.append(Bool('fOut' + str(i)))
-        index_LUT_inputs = []
-        for i in range(0, (self.no_LUT * self.LUT_inputs * self.input_index_length)):
-            index_LUT_inputs.append(Bool('Linx' + str(i)))
-        index_LUT_outputs = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs)):
-            index_LUT_outputs.append(Bool('Loutx' + str(i)))
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
         #
         # Switch between F and ZV, generate the respective variables and output their sizes (if not benchmark)
         #
         if self.__exe_mode == 'F':
             if not self.benchmark:
-                logging.info("generated xout[%s], xin[%s], xfinal[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output))
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output))
         elif self.__exe_mode == 'ZV':
-            internal_inputs = []
-            for i in range(0, self.no_LUT * self.LUT_inputs * (2 ** self.no_inputs)):
-                internal_inputs.append(Bool('IntIn' + str(i)))
-            internal_outputs = []
-            for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.no_inputs)):
-                internal_outputs.append(Bool('IntOut' + str(i)))
+            # the internal variables are created per case when the clauses of the case are generated
             if not self.benchmark:
-                logging.info("generated xout[%s], xin[%s], xfinal[%s], intIn[%s], intOut[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output), len(internal_inputs), len(internal_outputs))
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s], intIn[%s], intOut[%s] per case", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output), self.no_LUT * self.LUT_inputs, self.no_LUT * self.LUT_outputs)
         else:
             logging.error("ERROR: unexpected execution mode")
             return 0
@@ -346,104 +1355,112 @@ class Logic_Generator:
         #
         # Instantiate Solver
         #
-        self.__sol = Solver()
-        
-        #
-        # Generate the constraints for the final outputs for each final output
-        #
-        for g_out in range(0, self.no_outputs):
-            self.__sol.append(self.__createFinalOutputConstraints(index_final_output, g_out))
+        self.__sol, indices = self.__createSolver(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
         
         #
-        # Generate the constraints for the Inputs of the LUTs for each LUT
+        # Load the constraints and the clauses of the cases from the encoding cache (if cacheDir is set)
+        # The cache holds the clauses of the cases up to the one a previous run has reached
         #
-        for lut in range(0, self.no_LUT):
-            self.__sol.append(self.__createLutInputConstraints(index_LUT_inputs, lut))
-        
+        cache_key = self.__encodingCacheKey(index_final_output, index_LUT_inputs, index_LUT_outputs, self.__order)
+        structure, cases = self.__loadEncoding(cache_key)
+        no_cached = len(cases)
+
         #
-        # Generate Starting-Guesses
+        # Generate the constraints of the LUT-structure and the Starting-Guesses
         #
-        startingGuesses = self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, index_final_output, index_LUT_inputs, index_LUT_outputs)
-        for guess in startingGuesses:
-            self.__sol.append(guess)
+        if structure is None:
+            structure = self.__createStructureConstraints(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+        for constraint in structure:
+            self.__sol.append(constraint)
+        hints = self.__createHints(index_final_output, index_LUT_inputs)
 
         #
-        # Start Loop of generating LUT-clauses and running the solver
-        #
-        for case in range(0, 2 ** self.no_inputs):
+        # Start Loop of generating LUT-clauses and running the solver on batches of cases (in the order of setCaseOrder)
+        # Every batch is added in its own scope of the solver, which is kept if the batch is SAT
+        # The batch size doubles while a solver call takes at most incBatchTime and is halved if it takes longer,
+        # a call on more than one case is stopped after incBatchResources resource units of cvc5 and repeated with half of the cases
+        # (reproducible-resource-limit, the time limit tlimit-per can not be changed once the solver is initialized)
+        # A batch that is UNSAT is removed again and its cases are checked one by one up to the end of the batch (bound),
+        # so the first failing case is still found. UNSAT calls are the expensive ones, so they are not bisected
+        #
+        no_cases = 2 ** self.no_inputs
+        batch = 1
+        bound = None
+        case = 0
+        no_solver_calls = 0
+        if self.__encoder == 'clauses' and self.__backend != 'cvc5' and not self.solverCommand:
             #
-            # calculate the configuration of global inputs for each case
+            # Without solverCommand nothing is solved, all cases are added at once and the problem is only written (below)
             #
-            inputs = []
-            for exp in range(self.no_inputs - 1, -1, -1):
-                inputs.append((int)(case / (2 ** exp)) % 2)
-
+            for next_case in range(len(cases), no_cases):
+                cases.append(self.__createCaseClauses(self.__order[next_case], *indices))
+            for c in range(0, no_cases):
+                for clause in cases[c]:
+                    self.__sol.append(clause)
+            case = no_cases
+        while case < no_cases:
             #
-            # Switch between F and ZV
+            # Generate the clauses of the LUT-structure for the cases of this batch (if not cached)
             #
-            if self.__exe_mode == 'F':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # store all clauses in the corresponding 'internal_Xput_formulas' list
-                # in createInternalInputFormula only internal_output_formulas of previous LUTs need to be used (already in the list)
-                # in createInternalOutputFormular only internal_input_formulas of the same LUT need to be used (already in the list)
-                #
-                internal_input_formulas = []
-                internal_output_formulas = []
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        internal_input_formulas.append(self.__F_createLutInputFormula(index_LUT_inputs, inputs, internal_output_formulas, lut, ins))
-                    for outs in range(0, self.LUT_outputs):
-                        internal_output_formulas.append(self.__F_createLutOutputFormular(index_LUT_outputs, internal_input_formulas, lut, outs))
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    self.__sol.append(out == self.__F_createFinalOutputFormula(index_final_output, internal_output_formulas, g_out))
-                    
-            elif self.__exe_mode == 'ZV':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # add all clauses directly to the solver
-                #
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        self.__sol.append(self.__ZV_createLutInputFormula(index_LUT_inputs, internal_inputs, internal_outputs, inputs, lut, ins, case))
-                    for outs in range(0, self.LUT_outputs):
-                        self.__sol.append(self.__ZV_createLutOutputFormula(index_LUT_outputs, internal_inputs, internal_outputs, lut, outs, case))
-
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    self.__sol.append(out == self.__ZV_createFinalOutputFormula(index_final_output, internal_outputs, g_out, case))
-            else:
-                logging.error("ERROR: unexpected execution mode")
-                return 0
+            end = min(case + batch, no_cases)
+            for next_case in range(len(cases), end):
+                cases.append(self.__createCaseClauses(self.__order[next_case], *indices))
+            #
+            # A batch without clauses (don't care on every output) does not change the result, the solver is not run for it
+            # The last case is always checked, so there is a result if all cases are don't care
+            #
+            if all(len(cases[c]) == 0 for c in range(case, end)) and end < no_cases:
+                case = end
+                continue
             
             #
-            # Run the Solver with the constraint-clauses and the clauses from previous case-loops
-            # check the result of the solver. For UNSAT the execution can be stopped. For SAT a status is printed
+            # Run the Solver with the constraint-clauses, the clauses from previous batches and the clauses of the batch
+            # check the result of the solver. For UNSAT of a single case the execution can be stopped
+            # For SAT a status is printed and the size of the next batch is adapted to the time of the call
             #
-            self.__sol.check()
+            self.__sol.push()
+            for c in range(case, end):
+                for clause in cases[c]:
+                    self.__sol.append(clause)
+            self.__sol.set('reproducible-resource-limit', self.incBatchResources if end - case > 1 else 0)
+            start_check = time.perf_counter()
+            self.__checkWithHints(self.__sol, hints)
+            time_check = time.perf_counter() - start_check
+            no_solver_calls += 1
+            if self.__sol.last_result != sat and end - case > 1:
+                self.__sol.pop()
+                if self.__sol.last_result == unsat:
+                    bound = end
+                    batch = 1
+                else:
+                    batch = max(1, (end - case) // 2)
+                continue
             if self.__sol.last_result == unsat:
                 abort_process = time.perf_counter()    
                 if not self.benchmark:
-                    logging.info("Execution failed in step %s after %s s. No solution could be found", case, abort_process - start_process)
+                    logging.info("Execution failed in step %s (case %s) after %s s. No solution could be found", case, self.__order[case], abort_process - start_process)
+                self.__recordFailedCase(self.__order[case])
+                break
+            elif self.__sol.last_result != sat:
+                # a single case has no time limit, unknown comes from the backend (e.g. a solverCommand that fails)
+                logging.error("ERROR: solver returned %s in step %s (case %s), the execution is stopped", self.__sol.last_result, case, self.__order[case])
                 break
             else:
                 time2 = time.perf_counter()
                 if not self.benchmark:
-                    logging.info("[%s/%s]\tDelta: %s s", 2 ** self.no_inputs, case, time2 - time1)
+                    logging.info("[%s/%s]\tBatch: %s\tDelta: %s s", no_cases, end - 1, end - case, time2 - time1)
                 time1 = time2
+                case = end
+                if bound is not None and case < bound:
+                    continue
+                bound = None
+                batch = batch * 2 if time_check <= self.incBatchTime else max(1, batch // 2)
             
         #
-        # Print the found LUT configuration (if not benchmark)
+        # Keep the found LUT configuration and print it (if not benchmark)
         #
+        if self.__sol.last_result == sat:
+            self.result = self.__decodeLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
         if not self.benchmark:
             if self.__sol.last_result == sat:
                 if self.printConfig:
@@ -453,147 +1470,302 @@ class Logic_Generator:
             else:
                 logging.info("No solution was found")
             logging.info("Result is: %s", self.__sol.last_result)
+        if len(cases) > no_cached:
+            self.__storeEncoding(cache_key, structure, cases)
+        if self.dimacsFile is not None and self.__encoder == 'clauses':
+            self.__sol.writeDimacs(self.dimacsFile)
+        if self.smtlibFile is not None and self.__encoder == 'clauses':
+            self.__sol.writeSmtlib(self.smtlibFile)
+        self.__logInternalVariables()
         
         #
         # Stop timer for the whole process and output program-name, total time
         #
         end_process = time.perf_counter()
-        logging.info("End Program %s with %s after %s s", os.path.basename(sys.argv[0]), self.__sol.last_result, end_process - start_process)
-    def __runParallel(self):
+        self.__verdict = self.__sol.last_result
+        logging.info("End Program %s with %s after %s s - Solver calls: %s", os.path.basename(sys.argv[0]), self.__sol.last_result, end_process - start_process, no_solver_calls)
+    def __runCegis(self):
         #
         # Start timer and print parameters of the given problem (if not benchmark)
         #
-        start_main = time.perf_counter()
-        deltaT = start_main
+        start_process = time.perf_counter()
+        time1 = start_process
         if not self.benchmark:
-            logging.info("Main: Start Execution")
+            logging.info("Start Execution\tGlobal I / O: %s / %s\tLUTs / I / O: %s / %s / %s\tidx length: %s", self.no_inputs, self.no_outputs, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.input_index_length)
 
         #
-        # Setup empty lists that are needed to start the processes
+        # Generate all indices that are independent of F and ZV
         #
-        coms = []
-        steps = []
-        procs = []
-        for index in range(self.no_processes):
-            #
-            # Initialize shared variables for communication between Main and Processes
-            #
-            coms.append(multiprocessing.Value('i', 0))
-            steps.append(multiprocessing.Value('i', 0))
-            #
-            # Initialize Processes with function and pass parameters and shared Values
-            #
-            procs.append(multiprocessing.Process(target=self.__parallelSolvingFunction,
-                                                 args=(index, self.depth, self.no_processes, coms[index], steps[index])))
-            #
-            # Start Processes
-            #
-            procs[index].start()
-
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
         #
-        # Start Main-Control-Loop that supervises the running processes
-        # run the loop until running == False
-        # inside the loop keep iterating though all processes and check the status of each one
+        # Switch between F and ZV, generate the respective variables and output their sizes (if not benchmark)
         #
-        running = True
-        steps_mem = [0 for i in range(self.no_processes)]
-        while running:
-            stop = True
-            for i in range(self.no_processes):
-                #
-                # If the com-value of a process == 1, this process has ended with a found solution SAT
-                # in that case all processes are being terminated and running is stopped
-                #
-                if coms[i].value == 1:
-                    if not self.benchmark:
-                        logging.info("Main: P%s found a solution", i)
-                    for index in range(self.no_processes):
-                        procs[index].terminate()
-                    if not self.benchmark:
-                        logging.info("Main: all remaining processes have been terminated")
-                    running = False
-                    stop = False
-                    break
-                #
-                # If the com-value of a process == 0, this process is still running and trying
-                # to find a solution. Therefore the program needs to go on and the loop will
-                # not be stopped in the next iteration: stop is set False
-                #
-                if coms[i].value == 0:
-                    stop = False
-                #
-                # If the current step of a process does not fit to its last stored step, all
-                # steps are updated and the current status is printed to the console
-                #
-                if steps_mem[i] != steps[i].value:
-                    for k in range(0, self.no_processes):
-                        steps_mem[k] = steps[k].value
-                    current_main = time.perf_counter()
-                    if not self.benchmark:
-                        logging.info("Main: at %.8s: %s - %s D: %.8s", current_main - start_main, 2 ** self.no_inputs, steps_mem, current_main - deltaT)
-                    deltaT = current_main
-            #
-            # stop is only True, if none of the processes are in com == 1 (SAT) or com == 0 (running)
-            # Therefore all processes must be in com == -1, which means they terminated with UNSAT
-            # In that case all processes are being terminated and running is stopped
-            #
-            if stop:
-                if not self.benchmark:
-                    logging.info("Main: all processes ended without a valid solution")
-                for index in range(self.no_processes):
-                    procs[index].terminate()
-                if not self.benchmark:
-                    logging.info("Main: all processes have been terminated")
-                running = False
-                break
+        if self.__exe_mode == 'F':
+            if not self.benchmark:
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s]", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output))
+        elif self.__exe_mode == 'ZV':
+            # the internal variables are created per case when the clauses of the case are generated
+            if not self.benchmark:
+                logging.info("generated xout[%s], xin[%s], xsel[%s], xfinal[%s], intIn[%s], intOut[%s] per case", len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output), self.no_LUT * self.LUT_inputs, self.no_LUT * self.LUT_outputs)
+        else:
+            logging.error("ERROR: unexpected execution mode")
+            return 0
 
         #
-        # Wait until all Processes have ended and only then continue the program
+        # Instantiate Solver
         #
-        for index in range(self.no_processes):
-            procs[index].join()
+        self.__sol = Solver()
         
         #
-        # Stop timer for the whole process and output program-name, total time, time for clause-generation and time of solving
+        # Generate the constraints of the LUT-structure and the Starting-Guesses
         #
-        end_main = time.perf_counter()
-        logging.info("Main: End Program %s after %s s", os.path.basename(sys.argv[0]), end_main - start_main)
+        for constraint in self.__createStructureConstraints(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select):
+            self.__sol.append(constraint)
+        hints = self.__createHints(index_final_output, index_LUT_inputs)
 
-    def __parallelSolvingFunction(self, idx, m_depth, m_no_processes, m_com, m_steps):
         #
-        # Start timer and print parameters of the given problem (if not benchmark)
+        # The expected outputs of all cases as bitsets, bit 'case' of expected[g_out] is the output in that case
+        # Outputs that are don't care (bit of care[g_out] is 0) are never wrong
         #
-        start_process = time.perf_counter()
-        if not self.benchmark:
-            logging.info("P%s: Start Process\tGlobal I / O: %s / %s\tLUTs / I / O: %s / %s / %s\tidx length: %s", idx, self.no_inputs, self.no_outputs, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.input_index_length)
+        expected = self.__createTruthTableBitsets()
+        care = self.__createCareBitsets()
 
         #
-        # Generate all indices that are independent of F and ZV
-        #
-        index_final_output = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * self.no_outputs):
-            index_final_output.append(Bool('fOut' + str(i)))
-        index_LUT_inputs = []
-        for i in range(0, (self.no_LUT * self.LUT_inputs * self.input_index_length)):
-            index_LUT_inputs.append(Bool('Linx' + str(i)))
-        index_LUT_outputs = []
-        for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs)):
-            index_LUT_outputs.append(Bool('Loutx' + str(i)))
+        # Start Loop of solving the working set of cases and verifying the candidate on all cases
+        # The working set starts with case 0 and only grows by cases the previous candidate got wrong
+        #
+        working_set = []
+        new_cases = [0]
+        solver_calls = 0
+        while True:
+            for case in new_cases:
+                for clause in self.__createCaseClauses(case, index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select):
+                    self.__sol.append(clause)
+            working_set += new_cases
+
+            #
+            # Run the Solver on the working set. For UNSAT the execution can be stopped, as the full problem is UNSAT too
+            #
+            self.__checkWithHints(self.__sol, hints)
+            solver_calls += 1
+            if self.__sol.last_result != sat:
+                abort_process = time.perf_counter()
+                if not self.benchmark:
+                    logging.info("Execution failed with %s of %s cases after %s solver calls and %s s. No solution could be found", len(working_set), 2 ** self.no_inputs, solver_calls, abort_process - start_process)
+                break
+
+            #
+            # Simulate the candidate on all cases and collect the cases where any global output is wrong
+            #
+            network = self.__decodeLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
+            simulated = network.simulate()
+            wrong = 0
+            for g_out in range(0, self.no_outputs):
+                wrong |= (simulated[g_out] ^ expected[g_out]) & care[g_out]
+            time2 = time.perf_counter()
+            if not self.benchmark:
+                logging.info("[%s/%s]\tcases: %s\twrong: %s\tDelta: %s s", 2 ** self.no_inputs, solver_calls, len(working_set), wrong.bit_count(), time2 - time1)
+            time1 = time2
+            if wrong == 0:
+                self.result = network
+                break
+            new_cases = self.__selectCounterexamples(wrong)
+            
+        #
+        # Print the found LUT configuration (if not benchmark)
+        #
+        if not self.benchmark:
+            if self.__sol.last_result == sat:
+                if self.printConfig:
+                    self.__printResultingLutConfiguration(self.__sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)
+                else:
+                    logging.info("Printing of resulting Config is turned off")
+            else:
+                logging.info("No solution was found")
+            logging.info("Result is: %s", self.__sol.last_result)
+        self.__logInternalVariables()
+        
+        #
+        # Stop timer for the whole process and output program-name, total time, solver calls and size of the working set
+        #
+        end_process = time.perf_counter()
+        self.__verdict = self.__sol.last_result
+        logging.info("End Program %s with %s after %s s - Solver calls: %s - Cases: %s / %s", os.path.basename(sys.argv[0]), self.__sol.last_result, end_process - start_process, solver_calls, len(working_set), 2 ** self.no_inputs)
+    def __selectCounterexamples(self, m_wrong):
+        #
+        # Choose up to cegisCounterexamples of the wrong cases, spread over the whole case range:
+        # the range is split into windows and the first wrong case of each window is taken
+        #
+        no_cases = 2 ** self.no_inputs
+        no_windows = max(1, min(self.cegisCounterexamples, no_cases))
+        window = -(-no_cases // no_windows)
+        cases = []
+        for w in range(0, no_windows):
+            bits = (m_wrong >> (w * window)) & ((1 << window) - 1)
+            if bits:
+                cases.append(w * window + (bits & -bits).bit_length() - 1)
+        return cases
+    def __runParallel(self):
+        #
+        # Start timer and print parameters of the given problem (if not benchmark)
+        #
+        start_main = time.perf_counter()
+        if not self.benchmark:
+            logging.info("Main: Start Execution")
+
+        #
+        # Inside a worker pool (with Logic_Generator() as lg:) the warm processes of the pool solve the problem
+        #
+        if self.__pool is not None:
+            procs, conns = self.__startPoolJob([('parallel', index, self.depth, self.no_processes) for index in range(self.no_processes)])
+            result, winner = self.__superviseProcesses(procs, conns, start_main)
+            self.__cancelPoolJob(len(procs))
+        else:
+            #
+            # Setup empty lists that are needed to start the processes
+            # Each process gets the sending end of a pipe to report its progress and result to Main
+            # and the stop-event, that tells it to end early once the answer is known
+            #
+            stop = multiprocessing.Event()
+            conns = []
+            procs = []
+            for index in range(self.no_processes):
+                recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+                conns.append(recv_conn)
+                #
+                # Initialize Processes with function and pass parameters, pipe and stop-event
+                #
+                procs.append(multiprocessing.Process(target=self.__parallelSolvingFunction,
+                                                     args=(index, self.depth, self.no_processes, send_conn, stop)))
+                #
+                # Start Processes and close the sending end in Main, so a dead process closes its pipe
+                #
+                procs[index].start()
+                send_conn.close()
+
+            #
+            # Supervise the running processes until one finds a solution or all end without one
+            #
+            result, winner = self.__superviseProcesses(procs, conns, start_main)
+            self.__stopProcesses(procs, conns, stop)
+        if not self.benchmark:
+            if result == sat:
+                logging.info("Main: P%s found a solution", winner)
+            else:
+                logging.info("Main: all processes ended without a valid solution")
+        
+        #
+        # Stop timer for the whole process and output program-name, total time, time for clause-generation and time of solving
+        #
+        end_main = time.perf_counter()
+        self.__verdict = result
+        logging.info("Main: End Program %s after %s s", os.path.basename(sys.argv[0]), end_main - start_main)
+    def __superviseProcesses(self, m_procs, m_conns, m_start, m_first_answer=False):
+        #
+        # Main-Control-Loop that supervises the running processes
+        # Main blocks in wait() on the pipes and the sentinels of the processes, so it uses no CPU while they solve
+        # A process sends ('step', idx, step) and finally ('result', idx, 'sat' / 'unsat' / 'unknown') through its pipe,
+        # before an 'unsat' it can send ('failed', idx, case) with the case that refuted its part (for the case order hardest),
+        # before a 'sat' it sends ('network', idx, LUT_Network), the network of the winner is kept in self.result
+        # The first 'sat' ends the supervision, with m_first_answer also the first 'unsat' (all processes solve the same problem)
+        # A process that dies without a result (sentinel ready, pipe empty) counts as ended without a solution
+        # The progress is printed at most every progressInterval seconds
+        #
+        results = [None for i in range(len(m_procs))]
+        networks = [None for i in range(len(m_procs))]
+        steps_mem = [0 for i in range(len(m_procs))]
+        open_conns = {m_conns[i]: i for i in range(len(m_procs))}
+        sentinels = {m_procs[i].sentinel: i for i in range(len(m_procs))}
+        winner = None
+        progress_pending = False
+        next_progress = time.perf_counter()
+        deltaT = m_start
+        while winner is None and None in results:
+            timeout = None
+            if progress_pending:
+                timeout = max(0, next_progress - time.perf_counter())
+            for ready in multiprocessing.connection.wait(list(open_conns) + list(sentinels), timeout):
+                i = open_conns[ready] if ready in open_conns else sentinels[ready]
+                #
+                # Read everything the process has sent so far
+                #
+                while m_conns[i] in open_conns and m_conns[i].poll():
+                    try:
+                        message = m_conns[i].recv()
+                    except EOFError:
+                        del open_conns[m_conns[i]]
+                        break
+                    if message[0] == 'step':
+                        steps_mem[i] = message[2]
+                        progress_pending = True
+                    elif message[0] == 'failed':
+                        self.__recordFailedCase(message[2])
+                    elif message[0] == 'network':
+                        networks[i] = message[2]
+                    elif message[0] == 'result':
+                        results[i] = message[2]
+                        if (message[2] == 'sat' or (m_first_answer and message[2] == 'unsat')) and winner is None:
+                            winner = i
+                            self.result = networks[i]
+                #
+                # If the process is dead and has not sent a result, it ended without a solution
+                #
+                if ready in sentinels:
+                    del sentinels[ready]
+                    if results[i] is None:
+                        m_procs[i].join()
+                        logging.error("Main: P%s ended with exit code %s without a result", i, m_procs[i].exitcode)
+                        results[i] = 'unknown'
+            current_main = time.perf_counter()
+            if progress_pending and current_main >= next_progress:
+                if not self.benchmark:
+                    logging.info("Main: at %.8s: %s - %s D: %.8s", current_main - m_start, 2 ** self.no_inputs, steps_mem, current_main - deltaT)
+                deltaT = current_main
+                progress_pending = False
+                next_progress = current_main + self.progressInterval
+
+        if winner is not None:
+            return (sat if results[winner] == 'sat' else unsat), winner
+        if 'unknown' in results:
+            return unknown, None
+        return unsat, None
+    def __stopProcesses(self, m_procs, m_conns, m_stop):
+        #
+        # Tell all remaining processes to stop, terminate the ones still inside the solver
+        # and wait until all Processes have ended and only then continue the program
+        #
+        m_stop.set()
+        for proc in m_procs:
+            proc.terminate()
+        for proc in m_procs:
+            proc.join()
+        for conn in m_conns:
+            conn.close()
+        if not self.benchmark:
+            logging.info("Main: all processes have been terminated")
+
+    def __parallelSolvingFunction(self, idx, m_depth, m_no_processes, m_conn, m_stop):
+        #
+        # Start timer and print parameters of the given problem (if not benchmark)
+        #
+        start_process = time.perf_counter()
+        if not self.benchmark:
+            logging.info("P%s: Start Process\tGlobal I / O: %s / %s\tLUTs / I / O: %s / %s / %s\tidx length: %s", idx, self.no_inputs, self.no_outputs, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.input_index_length)
+
+        #
+        # Generate all indices that are independent of F and ZV
+        #
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
         #
         # Switch between F and ZV, generate the respective variables and output their sizes (if not benchmark)
         #
         if self.__exe_mode == 'F':
             if not self.benchmark:
-                logging.info("P%s: generated xout[%s], xin[%s], xfinal[%s]", idx, len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output))
+                logging.info("P%s: generated xout[%s], xin[%s], xsel[%s], xfinal[%s]", idx, len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output))
         elif self.__exe_mode == 'ZV':
-            internal_inputs = []
-            for i in range(0, self.no_LUT * self.LUT_inputs * (2 ** self.no_inputs)):
-                internal_inputs.append(Bool('IntIn' + str(i)))
-            internal_outputs = []
-            for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.no_inputs)):
-                internal_outputs.append(Bool('IntOut' + str(i)))
+            # the internal variables are created per case when the clauses of the case are generated
             if not self.benchmark:
-                logging.info("P%s: generated xout[%s], xin[%s], xfinal[%s], intIn[%s], intOut[%s]", idx, len(index_LUT_outputs), len(index_LUT_inputs), len(index_final_output), len(internal_inputs), len(internal_outputs))
+                logging.info("P%s: generated xout[%s], xin[%s], xsel[%s], xfinal[%s], intIn[%s], intOut[%s] per case", idx, len(index_LUT_outputs), len(index_LUT_inputs), len(index_LUT_select), len(index_final_output), self.no_LUT * self.LUT_inputs, self.no_LUT * self.LUT_outputs)
         else:
             logging.error("P%s: ERROR: unexpected execution mode", idx)
             return 0
@@ -604,23 +1776,12 @@ class Logic_Generator:
         sol = Solver()
         
         #
-        # Generate the constraints for the final outputs for each final output
-        #
-        for g_out in range(0, self.no_outputs):
-            sol.append(self.__createFinalOutputConstraints(index_final_output, g_out))
-        
-        #
-        # Generate the constraints for the Inputs of the LUTs for each LUT
+        # Generate the constraints of the LUT-structure and the Starting-Guesses (kept by a pool process, see poolEncoding)
         #
-        for lut in range(0, self.no_LUT):
-            sol.append(self.__createLutInputConstraints(index_LUT_inputs, lut))
-        
-        #
-        # Generate Starting-Guesses
-        #
-        startingGuesses = self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, index_final_output, index_LUT_inputs, index_LUT_outputs)
-        for guess in startingGuesses:
-            sol.append(guess)
+        encoding = self.__poolEncoding(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select, idx)
+        for constraint in encoding['structure']:
+            sol.append(constraint)
+        hints = self.__createHints(index_final_output, index_LUT_inputs)
 
         #
         # Calculate a set of parameters, that are unique for each process
@@ -642,72 +1803,38 @@ class Logic_Generator:
             logging.info("P%s: Parameters %s", idx, param)
 
         #
-        # Start Loop of generating LUT-clauses and running the solver
+        # Start Loop of generating LUT-clauses and running the solver (the cases in the order of setCaseOrder)
         #
-        for case in range(0, 2 ** self.no_inputs):
+        last_step = 0
+        for step in range(0, len(self.__order)):
+            case = self.__order[step]
             #
-            # calculate the configuration of global inputs for each case
+            # Stop early if Main already knows the answer
             #
-            inputs = []
-            for exp in range(self.no_inputs - 1, -1, -1):
-                inputs.append((int)(case / (2 ** exp)) % 2)
+            if m_stop.is_set():
+                return False
 
             #
-            # Switch between F and ZV
+            # Generate the clauses of the LUT-structure for this case and add them to the solver
             #
-            if self.__exe_mode == 'F':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # store all clauses in the corresponding 'internal_Xput_formulas' list
-                # in createInternalInputFormula only internal_output_formulas of previous LUTs need to be used (already in the list)
-                # in createInternalOutputFormular only internal_input_formulas of the same LUT need to be used (already in the list)
-                #
-                internal_input_formulas = []
-                internal_output_formulas = []
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        internal_input_formulas.append(self.__F_createLutInputFormula(index_LUT_inputs, inputs, internal_output_formulas, lut, ins))
-                    for outs in range(0, self.LUT_outputs):
-                        internal_output_formulas.append(self.__F_createLutOutputFormular(index_LUT_outputs, internal_input_formulas, lut, outs))
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    sol.append(out == self.__F_createFinalOutputFormula(index_final_output, internal_output_formulas, g_out))
-                    
-            elif self.__exe_mode == 'ZV':
-                #
-                # for each LUT, create the input-clauses for each input and the output-clauses for each output
-                # add all clauses directly to the solver
-                #
-                for lut in range(0, self.no_LUT):
-                    for ins in range(0, self.LUT_inputs):
-                        sol.append(self.__ZV_createLutInputFormula(index_LUT_inputs, internal_inputs, internal_outputs, inputs, lut, ins, case))
-                    for outs in range(0, self.LUT_outputs):
-                        sol.append(self.__ZV_createLutOutputFormula(index_LUT_outputs, internal_inputs, internal_outputs, lut, outs, case))
-
-                #
-                # for each global Output, calculate the expected value with calcOutput
-                # create the final-output-clauses, set equal to the expected value and add to the solver
-                #
-                for g_out in range(0, self.no_outputs):
-                    out = self.__calcOutput(inputs, g_out)
-                    sol.append(out == self.__ZV_createFinalOutputFormula(index_final_output, internal_outputs, g_out, case))
-            else:
-                logging.error("P%s: ERROR: unexpected execution mode", idx)
-                return 0
+            clauses = self.__encodedCaseClauses(encoding, case, index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+            for clause in clauses:
+                sol.append(clause)
             
             #
-            # Update the current case of the process to communicate it to Main
+            # Communicate the current step of the process to Main (at most every progressInterval seconds)
             #
-            m_steps.value = case
+            if time.perf_counter() - last_step >= self.progressInterval:
+                m_conn.send(('step', idx, step))
+                last_step = time.perf_counter()
+            if len(clauses) == 0 and step < len(self.__order) - 1:
+                # don't care on every output, the result can not change
+                continue
             
             #
             # Run the Solver with the constraint-clauses and the clauses from previous case-loops
             #
-            sol.check()
+            self.__checkWithHints(sol, hints, m_process=idx)
             
             #
             # check the result of the solver
@@ -717,10 +1844,11 @@ class Logic_Generator:
             if sol.last_result == unsat:
                 abort_process = time.perf_counter()
                 if not self.benchmark:
-                    logging.info("P%s: [%s/%s]\tend with %s after %s s", idx, 2 ** self.no_inputs, case, sol.last_result, abort_process - start_process)
+                    logging.info("P%s: [%s/%s]\tend with %s on case %s after %s s", idx, 2 ** self.no_inputs, step, sol.last_result, case, abort_process - start_process)
                     logging.info("P%s: Solving the problem with LUT-Output-Indices %s not possible", idx, param)
-                    logging.info("P%s: set com Value to -1 and exit", idx)
-                m_com.value = -1
+                    logging.info("P%s: send result to Main and exit", idx)
+                m_conn.send(('failed', idx, case))
+                m_conn.send(('result', idx, 'unsat'))
                 return False
 
         #
@@ -731,152 +1859,1693 @@ class Logic_Generator:
                 self.__printResultingLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs, idx)
             else:
                 logging.info("P%s: Printing of resulting Config is turned off")
+        self.__logInternalVariables(idx)
         #
         # Stop timer and output result and total time
         #
         end_process = time.perf_counter()
         logging.info("P%s: End Process with %s after %s s", idx, sol.last_result, end_process - start_process)
         #
-        # Communicate the result to Main and stop the process
+        # Communicate the result to Main, the process ends with the function and so its pipe is closed
         #
+        logging.debug("P%s: send result to Main and exit", idx)
         if sol.last_result == sat:
-            logging.debug("P%s: set com Value to 1 and exit", idx)
-            m_com.value = 1
+            m_conn.send(('network', idx, self.__decodeLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)))
+        m_conn.send(('result', idx, str(sol.last_result)))
+        return True
+
+    def __runPortfolio(self):
+        #
+        # Start timer and print parameters of the given problem (if not benchmark)
+        #
+        start_main = time.perf_counter()
+        if not self.benchmark:
+            logging.info("Main: Start Execution with a portfolio")
+
+        #
+        # Every process solves the whole problem with its own configuration, the first answer is taken
+        # Main reuses the pipes, the stop-event and the supervision of the parallel version (or the worker pool)
+        #
+        configs = self.__createPortfolioConfigs()
+        if not self.benchmark:
+            for index in range(len(configs)):
+                logging.info("Main: P%s uses configuration %s", index, configs[index])
+        if self.__pool is not None:
+            procs, conns = self.__startPoolJob([('portfolio', index, configs[index]) for index in range(len(configs))])
+            result, winner = self.__superviseProcesses(procs, conns, start_main, True)
+            self.__cancelPoolJob(len(procs))
+        else:
+            stop = multiprocessing.Event()
+            conns = []
+            procs = []
+            for index in range(len(configs)):
+                recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+                conns.append(recv_conn)
+                procs.append(multiprocessing.Process(target=self.__portfolioSolvingFunction, args=(index, configs[index], send_conn, stop)))
+                procs[index].start()
+                send_conn.close()
+            result, winner = self.__superviseProcesses(procs, conns, start_main, True)
+            self.__stopProcesses(procs, conns, stop)
+
+        #
+        # Report the winning configuration also in benchmark mode, so the defaults can be tuned
+        #
+        end_main = time.perf_counter()
+        if winner is not None:
+            logging.info("Main: P%s won with %s using configuration %s", winner, result, configs[winner])
         else:
-            logging.debug("P%s: set com Value to -1 and exit", idx)
-            m_com.value = -1
+            logging.info("Main: all processes ended without an answer")
+        self.__verdict = result
+        logging.info("Main: End Program %s with %s after %s s", os.path.basename(sys.argv[0]), result, end_main - start_main)
+    def __createPortfolioConfigs(self):
+        #
+        # A configuration is a dict with the execution mode ('exe_mode'), the order of the cases ('case_order', see
+        # setCaseOrder), the seed of the random case order ('seed') and cvc5 options ('options')
+        # Missing keys take the settings of the Logic_Generator, the user can give the list in self.portfolio
+        # Otherwise no_processes configurations are created, that differ in as many of these as possible
+        #
+        default = {'exe_mode': self.__exe_mode, 'case_order': self.__case_order, 'seed': self.caseOrderSeed, 'options': {}}
+        if len(self.portfolio) > 0:
+            return [dict(default, **config) for config in self.portfolio]
+        other_mode = 'ZV' if self.__exe_mode == 'F' else 'F'
+        variations = [
+            {},
+            {'case_order': 'random', 'options': {'sat-random-seed': 1, 'random-freq': 0.05}},
+            {'exe_mode': other_mode, 'options': {'decision': 'justification'}},
+            {'case_order': 'descending', 'options': {'sat-solver': 'cadical'}},
+            {'exe_mode': other_mode, 'case_order': 'random', 'options': {'sat-solver': 'cadical'}},
+            {'options': {'decision': 'justification', 'restart-int-base': 50}},
+        ]
+        configs = []
+        for index in range(self.no_processes):
+            config = dict(default, **variations[index % len(variations)])
+            config['seed'] = index
+            if index >= len(variations):
+                config['case_order'] = 'random'
+                config['options'] = dict(config['options'], **{'seed': index, 'sat-random-seed': index})
+            configs.append(config)
+        return configs
+    def __portfolioSolvingFunction(self, idx, m_config, m_conn, m_stop):
+        #
+        # Start timer, the process works on its own copy of the Logic_Generator, so the execution mode can be replaced
+        #
+        start_process = time.perf_counter()
+        self.__exe_mode = m_config['exe_mode']
+        if not self.benchmark:
+            logging.info("P%s: Start Process with configuration %s", idx, m_config)
+
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+
+        #
+        # Instantiate the Solver with the options of the configuration and generate the constraints of the LUT-structure
+        #
+        sol = Solver()
+        for option, value in m_config['options'].items():
+            sol.set(option, value)
+        encoding = self.__poolEncoding(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select, idx)
+        for constraint in encoding['structure']:
+            sol.append(constraint)
+        hints = self.__createHints(index_final_output, index_LUT_inputs)
+
+        #
+        # Order the cases as given in the configuration
+        #
+        cases = self.__createCaseOrder(m_config['case_order'], m_config['seed'])
+
+        #
+        # Loop of generating the clauses of a case and running the solver, like in the parallel version
+        #
+        last_step = 0
+        for step in range(0, len(cases)):
+            if m_stop.is_set():
+                return False
+            clauses = self.__encodedCaseClauses(encoding, cases[step], index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+            for clause in clauses:
+                sol.append(clause)
+            if time.perf_counter() - last_step >= self.progressInterval:
+                m_conn.send(('step', idx, step))
+                last_step = time.perf_counter()
+            if len(clauses) == 0 and step < len(cases) - 1:
+                # don't care on every output, the result can not change
+                continue
+            self.__checkWithHints(sol, hints, m_process=idx)
+            if sol.last_result != sat:
+                break
+
+        end_process = time.perf_counter()
+        if not self.benchmark:
+            logging.info("P%s: [%s/%s]\tend with %s after %s s", idx, len(cases), step, sol.last_result, end_process - start_process)
+            if sol.last_result == sat:
+                if self.printConfig:
+                    self.__printResultingLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs, idx)
+                else:
+                    logging.info("P%s: Printing of resulting Config is turned off", idx)
+        self.__logInternalVariables(idx)
+        if sol.last_result == unsat:
+            m_conn.send(('failed', idx, cases[step]))
+        if sol.last_result == sat:
+            m_conn.send(('network', idx, self.__decodeLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)))
+        m_conn.send(('result', idx, str(sol.last_result)))
         return True
 
+    def __runCubeAndConquer(self):
+        #
+        # Start timer and print parameters of the given problem (if not benchmark)
+        #
+        start_main = time.perf_counter()
+        if not self.benchmark:
+            logging.info("Main: Start Execution with dynamic cubes")
+            if self.__pool is not None:
+                logging.info("Main: dynamic cubes do not use the worker pool, %s processes are started for this run", self.no_processes)
+
+        #
+        # The search space is split into cubes: lists of (split candidate, value) that are solved as assumptions
+        # Main starts with all cubes over the first split candidates, enough to give every process one
+        #
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+        no_candidates = len(self.__createSplitCandidates(index_LUT_inputs, index_LUT_outputs, index_LUT_select))
+        depth = min(no_candidates, max(0, math.ceil(math.log2(self.no_processes))))
+        queue = []
+        for i in range(0, 2 ** depth):
+            queue.append([(d, bool((i >> (depth - 1 - d)) & 1)) for d in range(0, depth)])
+
+        #
+        # Start the processes, each one gets one end of a duplex pipe and the stop-event
+        # They are daemonic, as they wait for cubes forever and must not outlive Main
+        #
+        stop = multiprocessing.Event()
+        conns = []
+        procs = []
+        for index in range(self.no_processes):
+            main_conn, proc_conn = multiprocessing.Pipe()
+            conns.append(main_conn)
+            procs.append(multiprocessing.Process(target=self.__cubeSolvingFunction, args=(index, proc_conn, stop), daemon=True))
+            procs[index].start()
+            proc_conn.close()
+
+        #
+        # Main-Control-Loop: hand out cubes to processes that ask for the next one ('next')
+        # If the queue is empty while a process is idle, the process that works on its current cube the longest is asked
+        # to split it ('split') once it is working on it for cubeSplitTime
+        # It keeps one half and sends the other one back ('cube'), or answers 'nosplit'
+        # The problem is UNSAT once the queue is empty and all processes are idle
+        #
+        cubes = [None for i in range(self.no_processes)]
+        started = [0 for i in range(self.no_processes)]
+        splitting = [False for i in range(self.no_processes)]
+        idle = []
+        alive = {procs[i].sentinel: i for i in range(self.no_processes)}
+        open_conns = {conns[i]: i for i in range(self.no_processes)}
+        refuted = 0
+        result = None
+        winner = None
+        next_progress = time.perf_counter() + self.progressInterval
+        deltaT = start_main
+        next_split = None
+        while result is None:
+            timeout = max(0, min(next_progress, next_split or next_progress) - time.perf_counter())
+            for ready in multiprocessing.connection.wait(list(open_conns) + list(alive), timeout):
+                i = open_conns[ready] if ready in open_conns else alive[ready]
+                while conns[i] in open_conns and conns[i].poll():
+                    try:
+                        message = conns[i].recv()
+                    except (EOFError, OSError):
+                        # closed by the process, possibly with an unanswered split request left in its pipe
+                        del open_conns[conns[i]]
+                        break
+                    if message[0] == 'next':
+                        if cubes[i] is not None:
+                            refuted += 1
+                        cubes[i] = None
+                        splitting[i] = False
+                        idle.append(i)
+                    elif message[0] == 'cube':
+                        cubes[i] = message[3]
+                        started[i] = time.perf_counter()
+                        splitting[i] = False
+                        queue.append(message[2])
+                    elif message[0] == 'nosplit':
+                        # the cube of this process can not be split any further, do not ask again
+                        splitting[i] = None
+                    elif message[0] == 'network' and self.result is None:
+                        self.result = message[2]
+                    elif message[0] == 'result':
+                        if message[2] == 'sat':
+                            result = sat
+                            winner = i
+                        else:
+                            result = unknown
+                #
+                # A process died: put its cube back into the queue
+                #
+                if ready in alive:
+                    del alive[ready]
+                    if result is None:
+                        procs[i].join()
+                        logging.error("Main: P%s ended with exit code %s without a result", i, procs[i].exitcode)
+                        if cubes[i] is not None:
+                            queue.append(cubes[i])
+                        cubes[i] = None
+                        if i in idle:
+                            idle.remove(i)
+                        if len(alive) == 0:
+                            result = unknown
+            if result is not None:
+                break
+            #
+            # Give the queued cubes to the idle processes
+            #
+            while len(idle) > 0 and len(queue) > 0:
+                i = idle.pop(0)
+                cubes[i] = queue.pop(0)
+                started[i] = time.perf_counter()
+                conns[i].send(('cube', cubes[i]))
+            if len(queue) == 0 and len(idle) == len(alive):
+                result = unsat
+                break
+            #
+            # Still idle processes: ask the process on the oldest cube to split it, once it runs for cubeSplitTime
+            # Cubes that are refuted quickly are not split, as every split cube has to be solved again from the start
+            #
+            next_split = None
+            if len(idle) > 0:
+                busy = [i for i in range(self.no_processes) if cubes[i] is not None and splitting[i] is False]
+                if len(busy) > 0:
+                    i = min(busy, key=lambda k: started[k])
+                    if time.perf_counter() - started[i] >= self.cubeSplitTime:
+                        splitting[i] = True
+                        conns[i].send(('split',))
+                    else:
+                        next_split = started[i] + self.cubeSplitTime
+            current_main = time.perf_counter()
+            if current_main >= next_progress:
+                if not self.benchmark:
+                    logging.info("Main: at %.8s: queued %s - refuted %s - cubes %s D: %.8s", current_main - start_main, len(queue), refuted, [len(c) if c is not None else '-' for c in cubes], current_main - deltaT)
+                deltaT = current_main
+                next_progress = current_main + self.progressInterval
+
+        #
+        # Stop and terminate all processes and wait until they have ended
+        #
+        stop.set()
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.join()
+        for conn in conns:
+            conn.close()
+        if not self.benchmark:
+            logging.info("Main: all processes have been terminated")
+            if result == sat:
+                logging.info("Main: P%s found a solution", winner)
+            else:
+                logging.info("Main: all cubes ended without a valid solution (%s refuted)", refuted)
+        end_main = time.perf_counter()
+        self.__verdict = result
+        logging.info("Main: End Program %s with %s after %s s", os.path.basename(sys.argv[0]), result, end_main - start_main)
+    def __cubeSolvingFunction(self, idx, m_conn, m_stop):
+        #
+        # Start timer and print parameters of the given problem (if not benchmark)
+        #
+        start_process = time.perf_counter()
+        if not self.benchmark:
+            logging.info("P%s: Start Process\tGlobal I / O: %s / %s\tLUTs / I / O: %s / %s / %s\tidx length: %s", idx, self.no_inputs, self.no_outputs, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.input_index_length)
+
+        #
+        # Generate the indices and the constraints of the LUT-structure once
+        # The cubes are only passed to the solver as assumptions, so the same solver serves all cubes of this process
+        # The clauses of the cases are valid for every cube, they are added on demand and stay in the solver
+        #
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+        candidates = self.__createSplitCandidates(index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+        sol = Solver()
+        for constraint in self.__createStructureConstraints(index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select):
+            sol.append(constraint)
+        hints = self.__createHints(index_final_output, index_LUT_inputs)
+        no_cases = 2 ** self.no_inputs
+        added = 0
+
+        #
+        # Ask Main for cubes until the process is stopped or terminated
+        # A cube is solved like in the static parallel mode: after every new case the solver is run under the cube
+        # Between two runs of the solver a split request of Main is answered
+        #
+        m_conn.send(('next', idx))
+        while not m_stop.is_set():
+            message = m_conn.recv()
+            if message[0] != 'cube':
+                # split request for a cube that has already been refuted
+                continue
+            cube = message[1]
+            start_cube = time.perf_counter()
+            # hints that fail in one cube may still work in the next one
+            cube_hints = list(hints)
+            while True:
+                self.__checkWithHints(sol, cube_hints, [candidates[c] if value else Not(candidates[c]) for c, value in cube], idx)
+                if sol.last_result == unsat:
+                    if not self.benchmark:
+                        logging.info("P%s: [%s/%s]\tcube %s unsat after %s s", idx, no_cases, added, cube, time.perf_counter() - start_cube)
+                    m_conn.send(('next', idx))
+                    break
+                if sol.last_result != sat:
+                    logging.error("P%s: ERROR: solver returned unknown (%s)", idx, sol.reason_unknown())
+                    m_conn.send(('result', idx, 'unknown'))
+                    m_conn.close()
+                    return False
+                if added == no_cases:
+                    end_process = time.perf_counter()
+                    if not self.benchmark:
+                        if self.printConfig:
+                            self.__printResultingLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs, idx)
+                        else:
+                            logging.info("P%s: Printing of resulting Config is turned off", idx)
+                    self.__logInternalVariables(idx)
+                    logging.info("P%s: End Process with sat on cube %s after %s s", idx, cube, end_process - start_process)
+                    m_conn.send(('network', idx, self.__decodeLutConfiguration(sol.model(), index_final_output, index_LUT_inputs, index_LUT_outputs)))
+                    m_conn.send(('result', idx, 'sat'))
+                    m_conn.close()
+                    return True
+                #
+                # Split the cube if Main asked for it, then add the clauses of the next case
+                #
+                if m_conn.poll() and m_conn.recv()[0] == 'split':
+                    cube, split = self.__splitCube(sol, candidates, cube)
+                    if split is None:
+                        m_conn.send(('nosplit', idx))
+                    else:
+                        m_conn.send(('cube', idx, split, cube))
+                # cases that are don't care on every output add no clauses and are passed over
+                clauses = []
+                while len(clauses) == 0 and added < no_cases:
+                    clauses = self.__createCaseClauses(self.__order[added], index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select)
+                    added += 1
+                for clause in clauses:
+                    sol.append(clause)
+        m_conn.close()
+        return False
+    def __createSplitCandidates(self, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel):
+        #
+        # Variables the search space can be split on: the bits of the LUT truth tables (like the static split)
+        # followed by the LUT-input selection (Linx, or the selector bits with binary input selection)
+        #
+        selection = m_idx_LUT_sel if self.__input_selection == 'binary' else m_idx_LUT_in
+        return list(m_idx_LUT_out) + list(selection)
+    def __splitCube(self, m_sol, m_candidates, m_cube):
+        #
+        # Choose the split variable for a cube: the next free candidates are probed with a small resource limit
+        # (reproducible-resource-limit, tlimit-per can not be changed any more on the initialized solver)
+        # A value that is refuted by the probe is fixed to the other value in the cube without splitting
+        # The first candidate that can not be fixed is split, the cube with value True is kept, the one with False is returned
+        #
+        cube = list(m_cube)
+        assigned = set(c for c, value in cube)
+        probes = 0
+        for c in range(0, len(m_candidates)):
+            if c in assigned:
+                continue
+            assumptions = [m_candidates[k] if value else Not(m_candidates[k]) for k, value in cube]
+            fixed = None
+            if probes < 4:
+                probes += 1
+                m_sol.set('reproducible-resource-limit', 1000)
+                for value in [True, False]:
+                    m_sol.check(*(assumptions + [m_candidates[c] if value else Not(m_candidates[c])]))
+                    if m_sol.last_result == unsat:
+                        fixed = not value
+                        break
+            if fixed is not None:
+                cube.append((c, fixed))
+                assigned.add(c)
+                continue
+            m_sol.set('reproducible-resource-limit', 0)
+            return cube + [(c, True)], cube + [(c, False)]
+        m_sol.set('reproducible-resource-limit', 0)
+        return cube, None
+    def __encodingCacheKey(self, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_order=None):
+        #
+        # The encoding depends on the size of the problem, the settings of the encoding, the truth table, the starting-guesses and the feasibility check
+        # The clauses of the cases are stored in the order they are added (m_order, None for basic)
+        #
+        # the clauses of the clause encoder are numbered per run and are not cached
+        if self.cacheDir is None or self.__encoder == 'clauses':
+            return None
+        return hashlib.sha256(repr(self.__encodingDescription(m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_order)).encode()).hexdigest()
+    def __encodingDescription(self, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_order=None):
+        # everything the encoding depends on as plain data (see encodingCacheKey)
+        guesses = self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out)
+        # the ascending order is stored as None, so basic and inc share their entries
+        order = None if m_order is None or m_order == list(range(0, 2 ** self.no_inputs)) else m_order
+        return (2, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs,
+                self.__exe_mode, self.__amo_encoding, self.__input_selection, self.__lut_encoding, self.symmetryBreaking,
+                self.__truth_table, [self.__serializeTerm(guess.ast) for guess in guesses], order,
+                self.__excluded_inputs, self.__final_LUTs)
+    def __poolEncoding(self, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel, m_process):
+        #
+        # Encoding of the problem that a pool process keeps for its next jobs: the constraints of the LUT-structure and the
+        # clauses of the cases generated so far ({case: (clauses, number of internal variables)}, see encodedCaseClauses)
+        # The encodings of the last 4 problems are kept, outside of the worker pool a new encoding is returned every time
+        #
+        if self.__pool_encodings is None:
+            return {'structure': self.__createStructureConstraints(m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel), 'cases': {}}
+        key = hashlib.sha256(repr(self.__encodingDescription(m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out)).encode()).hexdigest()
+        encoding = self.__pool_encodings.pop(key, None)
+        if encoding is None:
+            encoding = {'structure': self.__createStructureConstraints(m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel), 'cases': {}}
+        elif not self.benchmark:
+            logging.info("P%s: encoding with %s cases reused from a previous job", m_process, len(encoding['cases']))
+        # the most recently used encoding is the last one
+        self.__pool_encodings[key] = encoding
+        while len(self.__pool_encodings) > 4:
+            del self.__pool_encodings[next(iter(self.__pool_encodings))]
+        return encoding
+    def __encodedCaseClauses(self, m_encoding, m_case, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel):
+        # clauses of a case from an encoding of poolEncoding, generated on first use, the internal variables are counted in both cases
+        if m_case in m_encoding['cases']:
+            clauses, no_internal = m_encoding['cases'][m_case]
+            self.__no_internal += no_internal
+            return clauses
+        no_internal = self.__no_internal
+        clauses = self.__createCaseClauses(m_case, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel)
+        m_encoding['cases'][m_case] = (clauses, self.__no_internal - no_internal)
+        return clauses
+    def __loadEncoding(self, m_key):
+        #
+        # Return the constraints of the LUT-structure and the list of the clauses of each case stored under m_key
+        # (None, []) if there is no such entry, the entry is then generated by the runner and stored afterwards
+        #
+        if m_key is None:
+            return None, []
+        path = os.path.join(self.cacheDir, m_key + '.lgc')
+        start_load = time.perf_counter()
+        try:
+            entry = self.__readCacheFile(path)
+            terms = []
+            no_internal = 0
+            for node in entry['nodes']:
+                if node[0] == 'var':
+                    terms.append(Bool(node[1]).ast)
+                    # ZV: the internal variables of the cached cases are created here instead of in createInternalVariables
+                    if node[1].startswith('IntIn') or node[1].startswith('IntOut'):
+                        no_internal += 1
+                elif node[0] == 'val':
+                    terms.append(BoolVal(node[1]).ast)
+                else:
+                    terms.append(_termFactory(main_ctx()).mkTerm(Kind[node[0]], *[terms[child] for child in node[1:]]))
+            structure = [BoolRef(terms[root], main_ctx()) for root in entry['structure']]
+            cases = [[BoolRef(terms[root], main_ctx()) for root in case] for case in entry['cases']]
+        except FileNotFoundError:
+            return None, []
+        except (OSError, ValueError, TypeError, AttributeError, KeyError, IndexError, RuntimeError):
+            logging.error("ERROR: cache entry %s is damaged and is generated again", path)
+            return None, []
+        self.__no_internal += no_internal
+        # the entry is used, keep it from being evicted
+        os.utime(path)
+        if not self.benchmark:
+            logging.info("Encoding with %s cases loaded from cache %s in %s s", len(cases), path, time.perf_counter() - start_load)
+        return structure, cases
+    def __storeEncoding(self, m_key, m_structure, m_cases):
+        #
+        # Store the encoding as a table of nodes: ('var', name), ('val', bool) or (kind, child nodes...)
+        # Sub-formulas that are shared are stored only once, the constraints and cases are lists of root nodes
+        #
+        if m_key is None:
+            return
+        nodes = []
+        ids = {}
+        def node(m_term):
+            # children are numbered before their parents, without recursion (formulas can be deep)
+            stack = [m_term]
+            while len(stack) > 0:
+                term = stack[-1]
+                if term in ids:
+                    stack.pop()
+                    continue
+                if term.getKind() == Kind.CONSTANT:
+                    entry = ('var', term.getSymbol())
+                elif term.isBooleanValue():
+                    entry = ('val', term.getBooleanValue())
+                else:
+                    missing = [child for child in term if child not in ids]
+                    if len(missing) > 0:
+                        stack += missing
+                        continue
+                    entry = (term.getKind().name,) + tuple(ids[child] for child in term)
+                stack.pop()
+                ids[term] = len(nodes)
+                nodes.append(entry)
+            return ids[m_term]
+        entry = {'nodes': nodes,
+                 'structure': [node(c.ast) for c in m_structure],
+                 'cases': [[node(c.ast) for c in case] for case in m_cases]}
+        path = os.path.join(self.cacheDir, m_key + '.lgc')
+        self.__writeCacheFile(path, entry)
+        if not self.benchmark:
+            logging.info("Encoding with %s cases stored in cache %s", len(m_cases), path)
+        self.__evictEncodings()
+    def __readCacheFile(self, m_path):
+        with open(m_path, 'r') as file:
+            return json.load(file)
+    def __writeCacheFile(self, m_path, m_data):
+        #
+        # The files in cacheDir hold plain data as JSON, they may be shared with other users and are never unpickled
+        # They are written to a temporary file first, so a parallel run never reads half an entry
+        #
+        os.makedirs(self.cacheDir, exist_ok=True)
+        with open(m_path + '.tmp' + str(os.getpid()), 'w') as file:
+            json.dump(m_data, file, separators=(',', ':'))
+        os.replace(m_path + '.tmp' + str(os.getpid()), m_path)
+    def __evictEncodings(self):
+        #
+        # Remove the least recently used entries (encodings and results) until the cache is not larger than cacheMaxSize bytes
+        #
+        entries = []
+        for name in os.listdir(self.cacheDir):
+            if name.endswith('.lgc') or name.endswith('.lgr'):
+                path = os.path.join(self.cacheDir, name)
+                entries.append((os.path.getmtime(path), os.path.getsize(path), path))
+        total = sum(size for mtime, size, path in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.cacheMaxSize:
+                break
+            os.remove(path)
+            total -= size
+            if not self.benchmark:
+                logging.info("Entry %s evicted from cache", path)
+    def __caseInputs(self, m_case):
+        # [A, B, C, ...] = bits of the case, MSB first
+        return [(m_case >> exp) & 1 for exp in range(self.no_inputs - 1, -1, -1)]
+    def __createCaseOrder(self, m_case_order, m_seed):
+        #
+        # List of all cases in the order they are added to the solver (see setCaseOrder), needs the truth table
+        #
+        no_cases = 2 ** self.no_inputs
+        if m_case_order == 'descending':
+            return list(range(no_cases - 1, -1, -1))
+        if m_case_order == 'gray':
+            return [step ^ (step >> 1) for step in range(0, no_cases)]
+        if m_case_order == 'random':
+            order = list(range(0, no_cases))
+            random.Random(m_seed).shuffle(order)
+            return order
+        if m_case_order == 'balanced':
+            #
+            # The cases are grouped by their output values, the groups take turns (the largest first)
+            # Cases that are don't care on every output add no clauses, they come last
+            #
+            groups = {}
+            for case in range(0, no_cases):
+                groups.setdefault(tuple(self.__truth_table[g_out][case] for g_out in range(0, self.no_outputs)), []).append(case)
+            dont_care = groups.pop((None,) * self.no_outputs, [])
+            groups = sorted(groups.values(), key=len, reverse=True)
+            order = []
+            for position in range(0, len(groups[0]) if len(groups) > 0 else 0):
+                for group in groups:
+                    if position < len(group):
+                        order.append(group[position])
+            return order + dont_care
+        if m_case_order == 'diverse':
+            #
+            # Greedy farthest-point order: the next case has the largest Hamming distance to its closest previous case
+            # Every chosen case updates the distance of all cases, so only the first (about 2 ** 20 / no_cases) cases
+            # are chosen this way, they are the ones that matter for an early UNSAT. The rest follows ascending
+            #
+            distance = [self.no_inputs + 1] * no_cases
+            chosen = [False] * no_cases
+            order = []
+            case = 0
+            for step in range(0, min(no_cases, max(1, 2 ** 20 // no_cases))):
+                order.append(case)
+                chosen[case] = True
+                farthest = -1
+                for other in range(0, no_cases):
+                    distance[other] = min(distance[other], (other ^ case).bit_count())
+                    if not chosen[other] and distance[other] > farthest:
+                        farthest = distance[other]
+                        next_case = other
+                case = next_case
+            return order + [case for case in range(0, no_cases) if not chosen[case]]
+        if m_case_order == 'hardest':
+            #
+            # The cases that refuted the most structures in previous runs first, the rest ascending
+            #
+            hardness = self.__loadCaseHardness()
+            return sorted(range(0, no_cases), key=lambda case: -hardness.get(case, 0))
+        return list(range(0, no_cases))
+    def __caseHardnessKey(self):
+        # the cases that refute a structure depend only on the truth table, so they are shared by all LUT sizes and settings
+        return hashlib.sha256(repr((self.no_inputs, self.no_outputs, self.__truth_table)).encode()).hexdigest()
+    def __loadCaseHardness(self):
+        #
+        # Number of structures each case has refuted in previous runs with the same truth table (case -> count)
+        # Kept for the runs of this Logic_Generator and in cacheDir (if set) for later programs
+        #
+        key = self.__caseHardnessKey()
+        if key not in self.__case_hardness:
+            hardness = {}
+            if self.cacheDir is not None:
+                path = os.path.join(self.cacheDir, key + '.lgh')
+                try:
+                    # JSON keys are strings
+                    hardness = {int(case): int(count) for case, count in self.__readCacheFile(path).items()}
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError, TypeError, AttributeError):
+                    hardness = {}
+                    logging.error("ERROR: case statistics %s are damaged and are started again", path)
+            self.__case_hardness[key] = hardness
+        return self.__case_hardness[key]
+    def __recordFailedCase(self, m_case):
+        #
+        # m_case refuted a structure (the solver was UNSAT right after its clauses were added)
+        #
+        hardness = self.__loadCaseHardness()
+        hardness[m_case] = hardness.get(m_case, 0) + 1
+        if self.cacheDir is not None:
+            self.__writeCacheFile(os.path.join(self.cacheDir, self.__caseHardnessKey() + '.lgh'), hardness)
+    def __resultDatabaseKey(self):
+        #
+        # Key of the result database entry of the NPN class of the truth table together with the LUT-structure and the
+        # transformation of the truth table to the representative of its class, (None, None) if the database is not used
+        # Starting-guesses restrict the search, so a run with guesses neither reads nor writes the database
+        #
+        if not self.resultDatabase or self.cacheDir is None:
+            return None, None
+        if self.__hasStartingGuesses():
+            if not self.benchmark:
+                logging.info("Result database is not used, as there are starting-guesses")
+            return None, None
+        start_canonical = time.perf_counter()
+        representative, transform = self.__npnCanonical(self.__createTruthTableBitsets(), self.__createCareBitsets())
+        if not self.benchmark:
+            logging.info("NPN canonicalization took:\t%s s", time.perf_counter() - start_canonical)
+        description = (2, self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, representative)
+        return hashlib.sha256(repr(description).encode()).hexdigest(), transform
+    def __hasStartingGuesses(self):
+        # True if createStartingGuesses returns any constraint for the current LUT-structure
+        index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select = self.__createStructureIndices()
+        return len(self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, index_final_output, index_LUT_inputs, index_LUT_outputs)) > 0
+    def __loadResult(self, m_key, m_transform):
+        #
+        # Answer of the result database for this truth table: sat (the transformed LUT-structure is kept in self.result),
+        # unsat, or None if there is no (usable) entry
+        #
+        path = os.path.join(self.cacheDir, m_key + '.lgr')
+        try:
+            entry = self.__readCacheFile(path)
+            verdict = entry['result']
+            if verdict == 'sat':
+                sources, tables, final = self.__npnTransformNetwork(entry['sources'], entry['tables'], entry['final'], m_transform, True)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            logging.error("ERROR: result database entry %s is damaged and is solved again", path)
+            return None
+        os.utime(path)
+        if verdict == 'sat':
+            self.result = LUT_Network(self.no_inputs, self.LUT_outputs, sources, tables, final)
+        if not self.benchmark:
+            logging.info("Result is: %s (from result database %s)", verdict, path)
+        return sat if verdict == 'sat' else unsat
+    def __storeResult(self, m_key, m_transform):
+        #
+        # Store the answer of the run for the representative of the NPN class, an unknown answer is not stored
+        #
+        if self.__verdict == sat and self.result is not None:
+            sources, tables, final = self.__npnTransformNetwork(self.result.sources, self.result.tables, self.result.final, m_transform, False)
+            entry = {'result': 'sat', 'sources': sources, 'tables': tables, 'final': final}
+        elif self.__verdict == unsat:
+            entry = {'result': 'unsat'}
+        else:
+            return
+        path = os.path.join(self.cacheDir, m_key + '.lgr')
+        self.__writeCacheFile(path, entry)
+        if not self.benchmark:
+            logging.info("Result %s stored in result database %s", entry['result'], path)
+        self.__evictEncodings()
+    def __npnCanonical(self, m_expected, m_care):
+        #
+        # Representative of the NPN class of the truth table (bitsets over the cases, see createTruthTableBitsets) and the
+        # transformation to it: (neg, perm, flags, order), canonical input k is original input perm[k] negated if
+        # neg[perm[k]], canonical output c is original output order[c] negated if flags[order[c]]
+        # Outputs that one LUT-output could drive (equal or complementary on the common cared cases) are negated together,
+        # so a LUT-structure of the representative maps to one of the function and the other way round
+        # Negations and the order of the inputs follow their cofactor counts, only ties are tried out (at most npnBudget
+        # candidates, the smallest truth table wins). A representative found within the budget is always correct,
+        # equivalent functions just may not meet in the same entry
+        #
+        n = self.no_inputs
+        mask = (1 << (2 ** n)) - 1
+        inputs = self.__createInputBitsets()
+        #
+        # Groups of outputs that have to be negated together, the polarity of a group follows its number of ones
+        #
+        group = list(range(0, self.no_outputs))
+        def root(m_g):
+            while group[m_g] != m_g:
+                m_g = group[m_g]
+            return m_g
+        for g1 in range(0, self.no_outputs):
+            for g2 in range(g1 + 1, self.no_outputs):
+                common = m_care[g1] & m_care[g2]
+                if (m_expected[g1] ^ m_expected[g2]) & common == 0 or (m_expected[g1] ^ m_expected[g2] ^ mask) & common == 0:
+                    group[root(g2)] = root(g1)
+        balance = {}
+        for g in range(0, self.no_outputs):
+            balance[root(g)] = balance.get(root(g), 0) + 2 * m_expected[g].bit_count() - m_care[g].bit_count()
+        flag_options = [[balance[r] > 0] if balance[r] != 0 else [False, True] for r in sorted(balance)]
+        roots = sorted(balance)
+        best = None
+        tried = 0
+        for choice in itertools.product(*flag_options):
+            flags = [choice[roots.index(root(g))] for g in range(0, self.no_outputs)]
+            expected = [m_expected[g] ^ m_care[g] if flags[g] else m_expected[g] for g in range(0, self.no_outputs)]
+            #
+            # Negate an input if the function has more ones (then more cared cases) where it is 1, ties are tried out
+            # The inputs are ordered by their cofactor counts, inputs with equal counts are permuted
+            #
+            neg_options = []
+            signature = []
+            for i in range(0, n):
+                ones1 = sum((e & inputs[i]).bit_count() for e in expected)
+                ones0 = sum((e & ~inputs[i]).bit_count() for e in expected)
+                care1 = sum((c & inputs[i]).bit_count() for c in m_care)
+                care0 = sum((c & ~inputs[i] & mask).bit_count() for c in m_care)
+                if (ones1, care1) == (ones0, care0):
+                    neg_options.append([False, True])
+                else:
+                    neg_options.append([(ones1, care1) > (ones0, care0)])
+                signature.append(max((ones1, ones0, care1, care0), (ones0, ones1, care0, care1)))
+            ranked = sorted(range(0, n), key=lambda i: signature[i], reverse=True)
+            ties = [list(members) for key, members in itertools.groupby(ranked, key=lambda i: signature[i])]
+            for neg in itertools.product(*neg_options):
+                for parts in itertools.product(*[itertools.permutations(members) for members in ties]):
+                    perm = [i for part in parts for i in part]
+                    columns = []
+                    for g in range(0, self.no_outputs):
+                        columns.append((self.__npnApply(m_care[g], neg, perm, inputs), self.__npnApply(expected[g], neg, perm, inputs), g))
+                    columns.sort()
+                    candidate = tuple((c, e) for c, e, g in columns)
+                    if best is None or candidate < best[0]:
+                        best = (candidate, (list(neg), perm, flags, [g for c, e, g in columns]))
+                    tried += 1
+                    if tried >= self.npnBudget:
+                        return best
+        return best
+    def __npnApply(self, m_bits, m_neg, m_perm, m_inputs):
+        #
+        # Truth table (bitset) of the function in the canonical inputs: the inputs with m_neg are negated, then the
+        # inputs are moved to their positions by swaps (position k gets original input m_perm[k])
+        #
+        n = self.no_inputs
+        for i in range(0, n):
+            if m_neg[i]:
+                shift = 2 ** (n - 1 - i)
+                m_bits = ((m_bits & m_inputs[i]) >> shift) | ((m_bits & ~m_inputs[i]) << shift & ((1 << (2 ** n)) - 1))
+        current = list(range(0, n))
+        for k in range(0, n):
+            j = current.index(m_perm[k])
+            if j != k:
+                # swap positions k < j: the cases with k = 1, j = 0 and with k = 0, j = 1 change places
+                shift = 2 ** (n - 1 - k) - 2 ** (n - 1 - j)
+                high = m_inputs[k] & ~m_inputs[j]
+                low = m_inputs[j] & ~m_inputs[k]
+                m_bits = (m_bits & ~(high | low)) | ((m_bits & high) >> shift) | ((m_bits & low) << shift)
+                current[k], current[j] = current[j], current[k]
+        return m_bits
+    def __npnTransformNetwork(self, m_sources, m_tables, m_final, m_transform, m_to_function):
+        #
+        # Map a LUT-structure of the function to one of the representative of its NPN class (m_to_function = False) or
+        # the other way round: a global input source is renamed, a negated input or LUT-output flips its bit in the
+        # index of the reading LUTs, a LUT-output that drives negated global outputs gets a negated truth table
+        #
+        neg, perm, flags, order = m_transform
+        if m_to_function:
+            rename = {k: perm[k] for k in range(0, self.no_inputs)}
+            final = [None] * self.no_outputs
+            for c in range(0, self.no_outputs):
+                final[order[c]] = m_final[c]
+        else:
+            rename = {perm[k]: k for k in range(0, self.no_inputs)}
+            final = [m_final[order[c]] for c in range(0, self.no_outputs)]
+        negated = set()
+        for g in range(0, self.no_outputs):
+            if flags[g]:
+                negated.add(final[g] if m_to_function else m_final[g])
+        sources = []
+        tables = []
+        for lut in range(0, len(m_sources)):
+            flip = 0
+            for ins, x in enumerate(m_sources[lut]):
+                if (x < self.no_inputs and neg[rename[x] if m_to_function else x]) or (x >= self.no_inputs and x - self.no_inputs in negated):
+                    flip |= 2 ** (len(m_sources[lut]) - 1 - ins)
+            sources.append([rename[x] if x < self.no_inputs else x for x in m_sources[lut]])
+            tables.append([[m_tables[lut][outs][index ^ flip] != (lut * self.LUT_outputs + outs in negated) for index in range(0, len(m_tables[lut][outs]))]
+                           for outs in range(0, len(m_tables[lut]))])
+        return sources, tables, final
+    def __createTruthTable(self):
+        #
+        # Returns the expected value of every global output for every case as truth_table[g_out][case]
+        # calcOutput may return None for an output that does not matter in that case (don't care), the entry is then None
+        # If batchedOutput is set, calcOutput is called only once with a (2 ** no_inputs, no_inputs) NumPy-array
+        # holding the input-configuration of every case (row = case, MSB first) and has to return a boolean
+        # matrix of shape (2 ** no_inputs, no_outputs) (or a vector of length 2 ** no_inputs for one output)
+        # Don't cares are None in an object matrix or NaN in a float matrix
+        #
+        start_truthTable = time.perf_counter()
+        no_cases = 2 ** self.no_inputs
+        if self.batchedOutput:
+            if np is None:
+                logging.error("ERROR: batchedOutput needs NumPy, which could not be imported")
+                return None
+            cases = np.arange(no_cases, dtype=np.int64)
+            inputs = ((cases[:, np.newaxis] >> np.arange(self.no_inputs - 1, -1, -1, dtype=np.int64)) & 1).astype(np.uint8)
+            outputs = np.asarray(self.__calcOutput(inputs))
+            if outputs.ndim == 1:
+                outputs = outputs.reshape(-1, 1)
+            if outputs.shape != (no_cases, self.no_outputs):
+                logging.error("ERROR: batched calcOutput returned shape %s, expected (%s, %s)", outputs.shape, no_cases, self.no_outputs)
+                return None
+            if outputs.dtype == object:
+                care = np.not_equal(outputs, None)
+            elif outputs.dtype.kind == 'f':
+                care = ~np.isnan(outputs)
+            else:
+                care = np.ones(outputs.shape, dtype=bool)
+            values = np.where(care, outputs, 0).astype(bool)
+            truth_table = [[value if cared else None for value, cared in zip(column, care_column)]
+                           for column, care_column in zip(values.T.tolist(), care.T.tolist())]
+        else:
+            truth_table = [[] for g_out in range(0, self.no_outputs)]
+            for case in range(0, no_cases):
+                inputs = self.__caseInputs(case)
+                for g_out in range(0, self.no_outputs):
+                    out = self.__calcOutput(inputs, g_out)
+                    truth_table[g_out].append(None if out is None else bool(out))
+        end_truthTable = time.perf_counter()
+        if not self.benchmark:
+            logging.info("Truth table generation took:\t%s s", end_truthTable - start_truthTable)
+            no_dont_care = sum(column.count(None) for column in truth_table)
+            if no_dont_care > 0:
+                logging.info("Truth table has %s don't care outputs, %s of %s cases are don't care on every output", no_dont_care, sum(1 for case in range(0, no_cases) if not self.__isCared(truth_table, case)), no_cases)
+        return truth_table
+    def __isCared(self, m_truth_table, m_case):
+        # False if the case is don't care on every global output, such a case adds no clauses
+        for g_out in range(0, self.no_outputs):
+            if m_truth_table[g_out][m_case] is not None:
+                return True
+        return False
+    def __checkFeasibility(self):
+        #
+        # Necessary conditions of the LUT-structure, checked on the truth table only
+        # Returns the reason if the structure can not implement the function (UNSAT), otherwise None
+        # The LUTs that can drive each global output are stored in final_LUTs, the global inputs no output
+        # depends on in excluded_inputs (both are turned into constraints by createNarrowingConstraints)
+        #
+        mask = (1 << (2 ** self.no_inputs)) - 1
+        inputs = self.__createInputBitsets()
+        expected = self.__createTruthTableBitsets()
+        care = self.__createCareBitsets()
+        supports = [self.__functionalSupport(inputs, expected[g_out], care[g_out], mask) for g_out in range(0, self.no_outputs)]
+        #
+        # Outputs that differ in a case both care about need different LUT-outputs
+        #
+        distinct = []
+        for g_out in range(0, self.no_outputs):
+            if all((expected[g_out] ^ expected[other]) & care[g_out] & care[other] for other in distinct):
+                distinct.append(g_out)
+        if len(distinct) > self.no_LUT * self.LUT_outputs:
+            return "outputs %s are pairwise different, but there are only %s LUT-outputs" % (distinct, self.no_LUT * self.LUT_outputs)
+        #
+        # All inputs some output depends on have to be connected to a LUT
+        #
+        used = sorted(set().union(*supports))
+        if len(used) > self.no_LUT * self.LUT_inputs:
+            return "the outputs depend on %s global inputs, but the LUTs have only %s inputs" % (len(used), self.no_LUT * self.LUT_inputs)
+        #
+        # The LUT that drives an output has to see its whole support (directly or through earlier LUTs)
+        # and has to tell its cofactors apart, see decomposable. Both only get easier for later LUTs
+        #
+        for g_out in range(0, self.no_outputs):
+            first = 0
+            while first < self.no_LUT and not self.__decomposable(supports[g_out], expected[g_out], care[g_out] == mask, first):
+                first += 1
+            if first == self.no_LUT and len(supports[g_out]) > self.no_LUT * (self.LUT_inputs - 1) + 1:
+                return "output %s depends on %s global inputs, but a LUT can see at most %s" % (g_out, len(supports[g_out]), self.no_LUT * (self.LUT_inputs - 1) + 1)
+            if first == self.no_LUT:
+                return "output %s has more cofactors than any LUT can tell apart" % g_out
+            self.__final_LUTs[g_out] = list(range(first, self.no_LUT))
+            if first > 0 and not self.benchmark:
+                logging.info("Feasibility check: output %s can only be driven by LUT %s or later", g_out, first)
+        #
+        # Without don't cares an input no output depends on is never needed, a LUT that is connected to it
+        # can be connected to any other input instead (needs at least LUT_inputs remaining global inputs)
+        # Starting guesses may connect such an input, so nothing is excluded if there are any
+        #
+        if all(care[g_out] == mask for g_out in range(0, self.no_outputs)) and len(used) >= self.LUT_inputs and not self.__hasStartingGuesses():
+            self.__excluded_inputs = [i for i in range(0, self.no_inputs) if i not in used]
+            if len(self.__excluded_inputs) > 0 and not self.benchmark:
+                logging.info("Feasibility check: no output depends on the global inputs %s, they are not connected", [chr(65 + i) for i in self.__excluded_inputs])
+        return None
+    def __functionalSupport(self, m_inputs, m_expected, m_care, m_mask):
+        #
+        # Global inputs the output depends on: two cases that differ only in the input, both cared for, with different values
+        # With don't cares this is the smallest possible support, every implementation depends on at least these inputs
+        #
+        support = []
+        for i in range(0, self.no_inputs):
+            block = 2 ** (self.no_inputs - 1 - i)
+            if (m_expected ^ (m_expected >> block)) & m_care & (m_care >> block) & ~m_inputs[i] & m_mask:
+                support.append(i)
+        return support
+    def __decomposable(self, m_support, m_expected, m_complete, m_lut):
+        #
+        # Can LUT m_lut implement the output (support m_support) with the help of the LUTs before it?
+        # The LUT connects a set D of the support directly and gets k signals from the earlier LUTs
+        # The earlier LUTs have m_lut * LUT_inputs inputs, at least m_lut - k of them connect earlier LUTs to each other,
+        # the remaining ones have to cover the rest B of the support and the part O of D that they also use
+        # For every value of O the k signals have to tell apart all columns of the function (value of B -> function
+        # of the rest of D), so there must be at most 2 ** k different columns (column multiplicity, Roth-Karp)
+        # The columns are only counted for an output without don't cares and within feasibilityCheckBudget steps
+        #
+        if len(m_support) <= self.LUT_inputs:
+            return True
+        for k in range(1, min(self.LUT_inputs, m_lut * self.LUT_outputs) + 1):
+            direct = self.LUT_inputs - k
+            shared = m_lut * self.LUT_inputs - max(0, m_lut - k) - (len(m_support) - direct)
+            if shared < 0:
+                continue
+            if shared >= direct:
+                return True
+            if not m_complete:
+                return True
+            no_subsets = math.comb(len(m_support), direct) * math.comb(direct, shared)
+            if no_subsets * 2 ** len(m_support) > self.feasibilityCheckBudget:
+                if not self.benchmark:
+                    logging.info("Feasibility check: %s decompositions exceed feasibilityCheckBudget, not checked", no_subsets)
+                return True
+            if self.__hasFewColumns(m_support, m_expected, direct, shared, k):
+                return True
+        return False
+    def __hasFewColumns(self, m_support, m_expected, m_direct, m_shared, m_k):
+        #
+        # Try all sets D (m_direct inputs of the support) and O (m_shared of them)
+        #
+        values = self.__restrictTruthTable(m_support, m_expected)
+        for direct in itertools.combinations(range(0, len(m_support)), m_direct):
+            for shared in itertools.combinations(direct, m_shared):
+                bound = [j for j in range(0, len(m_support)) if j not in direct]
+                if self.__countColumns(values, bound, shared, [j for j in direct if j not in shared]) <= 2 ** m_k:
+                    return True
+        return False
+    def __restrictTruthTable(self, m_support, m_expected):
+        #
+        # Values of the output for all assignments of its support, the other inputs are set to 0
+        # Position j of an assignment is input m_support[j], the value of the output is bit 'case' of m_expected
+        #
+        weight = [2 ** (self.no_inputs - 1 - i) for i in m_support]
+        cases = [0] * 2 ** len(m_support)
+        for a in range(1, 2 ** len(m_support)):
+            low = (a & -a).bit_length() - 1
+            cases[a] = cases[a & (a - 1)] + weight[low]
+        return [(m_expected >> case) & 1 for case in cases]
+    def __countColumns(self, m_values, m_bound, m_shared, m_free):
+        #
+        # Column multiplicity of the restricted truth table m_values: the largest number of different columns
+        # (value of the bound set -> function of the free set) for one value of the shared set
+        # column[a] = number of the column (value of shared, value of bound), row[a] = value of the free set
+        #
+        size = len(m_bound) + len(m_shared) + len(m_free)
+        step_column = [0] * size
+        step_row = [0] * size
+        for n, j in enumerate(m_bound):
+            step_column[j] = 2 ** n
+        for n, j in enumerate(m_shared):
+            step_column[j] = 2 ** (len(m_bound) + n)
+        for n, j in enumerate(m_free):
+            step_row[j] = 2 ** n
+        column = [0] * 2 ** size
+        row = [0] * 2 ** size
+        for a in range(1, 2 ** size):
+            low = (a & -a).bit_length() - 1
+            column[a] = column[a & (a - 1)] + step_column[low]
+            row[a] = row[a & (a - 1)] + step_row[low]
+        columns = [0] * 2 ** (len(m_bound) + len(m_shared))
+        for a in range(0, 2 ** size):
+            columns[column[a]] |= m_values[a] << row[a]
+        distinct = {}
+        for number in range(0, len(columns)):
+            distinct.setdefault(number >> len(m_bound), set()).add(columns[number])
+        return max(len(group) for group in distinct.values())
+    def __analyseDecomposition(self):
+        #
+        # Starting hints of decompositionGuesses: a LUT-structure that is likely to work, found on the truth table
+        # An output with a support of at most LUT_inputs inputs gets a LUT of its own, for a larger support the best
+        # bound set B (Ashenhurst / Roth-Karp) is connected to an earlier LUT and the free set F together with the
+        # outputs of that LUT to the LUT that drives the output: f = h(F, g(B)) with 2 ** k >= column multiplicity of B
+        # The LUTs are given to the outputs from the last one backwards, outputs that do not fit get no hints
+        # With symmetryBreaking the inputs of a LUT have to select ascending sources, so the free inputs of a hinted LUT
+        # are hinted as well (the smallest other sources, the LUT does not need them) and the sources are sorted
+        # Returns the hinted sources [lut, ins, x] and the hinted LUT-output [g_out, lut_out] of each output
+        #
+        inputs = self.__createInputBitsets()
+        expected = self.__createTruthTableBitsets()
+        care = self.__createCareBitsets()
+        mask = (1 << (2 ** self.no_inputs)) - 1
+        remaining = list(range(0, self.no_LUT))
+        lut_sources = {}
+        final = []
+        for g_out in range(0, self.no_outputs):
+            support = self.__functionalSupport(inputs, expected[g_out], care[g_out], mask)
+            if len(support) <= self.LUT_inputs and len(remaining) > 0:
+                lut = remaining.pop()
+                lut_sources[lut] = support
+                final.append([g_out, lut * self.LUT_outputs])
+                continue
+            if len(remaining) < 2:
+                continue
+            decomposition = self.__findBoundSet(support, expected[g_out])
+            if decomposition is None:
+                continue
+            bound, free, k = decomposition
+            lut = remaining.pop()
+            bound_lut = remaining.pop()
+            lut_sources[bound_lut] = [support[j] for j in bound]
+            lut_sources[lut] = [support[j] for j in free] + [self.no_inputs + bound_lut * self.LUT_outputs + o for o in range(0, k)]
+            final.append([g_out, lut * self.LUT_outputs])
+            if not self.benchmark:
+                logging.info("Decomposition of output %s: bound set %s on LUT %s, free set %s on LUT %s", g_out,
+                             [chr(65 + support[j]) for j in bound], bound_lut, [chr(65 + support[j]) for j in free], lut)
+        sources = []
+        for lut, hinted in sorted(lut_sources.items()):
+            if self.symmetryBreaking:
+                others = [x for x in range(0, self.no_inputs + lut * self.LUT_outputs) if x not in hinted and x not in self.__excluded_inputs]
+                hinted = sorted(hinted + others[:self.LUT_inputs - len(hinted)])
+            sources += [[lut, ins, x] for ins, x in enumerate(hinted)]
+        return sources, final
+    def __findBoundSet(self, m_support, m_expected):
+        #
+        # Bound set B of at most LUT_inputs inputs of the support with the fewest columns, so the k = log2(columns)
+        # outputs of its LUT (at most LUT_outputs) and the free set fit into one LUT: |F| + k <= LUT_inputs
+        # Returns (B, F, k) as positions in m_support, the smallest k and then the largest B, None if there is no such B
+        # The search stops after feasibilityCheckBudget steps with the best bound set found so far
+        #
+        values = self.__restrictTruthTable(m_support, m_expected)
+        best = None
+        steps = 0
+        for size in range(min(self.LUT_inputs, len(m_support) - 1), max(1, len(m_support) - self.LUT_inputs + 1) - 1, -1):
+            for bound in itertools.combinations(range(0, len(m_support)), size):
+                steps += 2 ** len(m_support)
+                if steps > self.feasibilityCheckBudget:
+                    return best
+                free = [j for j in range(0, len(m_support)) if j not in bound]
+                k = max(1, (self.__countColumns(values, bound, [], free) - 1).bit_length())
+                if k <= self.LUT_outputs and len(free) + k <= self.LUT_inputs and (best is None or k < best[2]):
+                    best = (list(bound), free, k)
+        return best
+    def __createCaseClauses(self, m_case, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel):
+        #
+        # A case that is don't care on every global output adds no clauses (and in ZV no internal variables)
+        #
+        if not self.__isCared(self.__truth_table, m_case):
+            return []
+        #
+        # calculate the configuration of global inputs for the case
+        #
+        inputs = self.__caseInputs(m_case)
+        c = []
+        #
+        # Switch between F and ZV
+        #
+        if self.__exe_mode == 'F':
+            #
+            # for each LUT, create the input-clauses for each input and the output-clauses for each output
+            # store all clauses in the corresponding 'internal_Xput_formulas' list
+            # in createInternalInputFormula only internal_output_formulas of previous LUTs need to be used (already in the list)
+            # in createInternalOutputFormular only internal_input_formulas of the same LUT need to be used (already in the list)
+            #
+            internal_input_formulas = []
+            internal_output_formulas = []
+            for lut in range(0, self.no_LUT):
+                for ins in range(0, self.LUT_inputs):
+                    internal_input_formulas.append(self.__F_createLutInputFormula(m_idx_LUT_in, m_idx_LUT_sel, inputs, internal_output_formulas, lut, ins))
+                for outs in range(0, self.LUT_outputs):
+                    internal_output_formulas.append(self.__F_createLutOutputFormular(m_idx_LUT_out, internal_input_formulas, lut, outs))
+            #
+            # for each global Output, look up the expected value in the truth table
+            # create the final-output-clauses and set them equal to the expected value (none for a don't care)
+            #
+            for g_out in range(0, self.no_outputs):
+                out = self.__truth_table[g_out][m_case]
+                if out is not None:
+                    c.append(self.__foldEq(out, self.__F_createFinalOutputFormula(m_idx_final_out, internal_output_formulas, g_out)))
+        elif self.__exe_mode == 'ZV':
+            #
+            # create the internal variables of this case
+            # for each LUT, create the input-clauses for each input and the output-clauses for each output
+            #
+            internal_in, internal_out = self.__createInternalVariables(m_case)
+            for lut in range(0, self.no_LUT):
+                for ins in range(0, self.LUT_inputs):
+                    c.append(self.__ZV_createLutInputFormula(m_idx_LUT_in, m_idx_LUT_sel, internal_in, internal_out, inputs, lut, ins))
+                for outs in range(0, self.LUT_outputs):
+                    c.append(self.__ZV_createLutOutputFormula(m_idx_LUT_out, internal_in, internal_out, lut, outs))
+            #
+            # for each global Output, look up the expected value in the truth table
+            # create the final-output-clauses and set them equal to the expected value (none for a don't care)
+            #
+            for g_out in range(0, self.no_outputs):
+                out = self.__truth_table[g_out][m_case]
+                if out is not None:
+                    c.append(self.__foldEq(out, self.__ZV_createFinalOutputFormula(m_idx_final_out, internal_out, g_out)))
+        else:
+            logging.error("ERROR: unexpected execution mode")
+        #
+        # Clauses that are folded to True are dropped, a clause folded to False makes the problem UNSAT
+        #
+        return [BoolVal(clause) if isinstance(clause, bool) else clause for clause in c if clause is not True]
+
+    def __createStructureIndices(self):
+        #
+        # Generate the variables describing the LUT-structure: final output mapping, LUT-input selection and LUT truth tables
+        # With binary input selection each LUT-input is selected by select_length bits 'Lselx' and the entries of
+        # index_LUT_inputs are the decoded selections (Selector == x), so starting guesses can still use them
+        #
+        index_final_output = []
+        for i in range(0, self.no_LUT * self.LUT_outputs * self.no_outputs):
+            index_final_output.append(Bool('fOut' + str(i)))
+        index_LUT_select = []
+        index_LUT_inputs = []
+        if self.__input_selection == 'binary':
+            for i in range(0, self.no_LUT * self.LUT_inputs * self.select_length):
+                index_LUT_select.append(Bool('Lselx' + str(i)))
+            for lut in range(0, self.no_LUT):
+                for ins in range(0, self.LUT_inputs):
+                    bits = self.__selectBits(index_LUT_select, lut, ins)
+                    for x in range(0, self.input_index_length):
+                        index_LUT_inputs.append(And([bits[b] if (x >> (len(bits) - 1 - b)) & 1 else Not(bits[b]) for b in range(0, len(bits))]))
+        else:
+            for i in range(0, (self.no_LUT * self.LUT_inputs * self.input_index_length)):
+                index_LUT_inputs.append(Bool('Linx' + str(i)))
+        index_LUT_outputs = []
+        for i in range(0, self.no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs)):
+            index_LUT_outputs.append(Bool('Loutx' + str(i)))
+        return index_final_output, index_LUT_inputs, index_LUT_outputs, index_LUT_select
+    def __createSolver(self, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel):
+        #
+        # Returns the solver of the sequential versions and the indices the clauses of the cases are built on
+        # With the clause encoder the indices are translated to the literals of the clause solver once,
+        # so the cases never build cvc5 expressions (the decoded binary selections become gates)
+        #
+        indices = (m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel)
+        if self.__encoder != 'clauses':
+            return Solver(), indices
+        if self.__backend == 'cvc5':
+            sol = _ClauseSolver(_Cvc5Backend())
+        else:
+            # without solverCommand the problem is only written (e.g. to be solved on another machine), the result stays unknown
+            if not self.solverCommand and not self.benchmark:
+                logging.info("No solverCommand set, the problem is only written to %s", self.dimacsFile if self.__backend == 'dimacs' else self.smtlibFile)
+            sol = _ClauseSolver(_ExternalBackend(self.__backend, self.solverCommand or []))
+        return sol, tuple([sol.literal(var.ast) for var in index] for index in indices)
+    def __createInternalVariables(self, m_case):
+        #
+        # ZV: one variable for each LUT-input and LUT-output of the case, created when the clauses of the case are generated
+        # The variables are numbered over all cases (IntIn = case * no_LUT * LUT_inputs + i), so every case has its own variables
+        #
+        internal_inputs = []
+        for i in range(m_case * self.no_LUT * self.LUT_inputs, (m_case + 1) * self.no_LUT * self.LUT_inputs):
+            internal_inputs.append(self.__createVariable('IntIn' + str(i)))
+        internal_outputs = []
+        for i in range(m_case * self.no_LUT * self.LUT_outputs, (m_case + 1) * self.no_LUT * self.LUT_outputs):
+            internal_outputs.append(self.__createVariable('IntOut' + str(i)))
+        self.__no_internal += len(internal_inputs) + len(internal_outputs)
+        return internal_inputs, internal_outputs
+    def __createVariable(self, m_name):
+        # with the clause encoder the variable is a number of the clause solver
+        if self.__encoder == 'clauses':
+            return self.__sol.var(m_name)
+        return Bool(m_name)
+    def __logInternalVariables(self, m_process='-'):
+        # ZV: report how many of the internal variables of all cases were actually created
+        if self.__exe_mode == 'ZV' and not self.benchmark:
+            logging.info("P%s: %s of %s internal variables created", m_process, self.__no_internal, self.no_LUT * (self.LUT_inputs + self.LUT_outputs) * 2 ** self.no_inputs)
+    def __createStructureConstraints(self, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_idx_LUT_sel):
+        c = []
+        #
+        # Generate the constraints for the final outputs for each final output
+        #
+        for g_out in range(0, self.no_outputs):
+            c.append(self.__createFinalOutputConstraints(m_idx_final_out, g_out))
+        #
+        # Generate the constraints for the Inputs of the LUTs for each LUT
+        #
+        for lut in range(0, self.no_LUT):
+            c.append(self.__createLutInputConstraints(m_idx_LUT_in, m_idx_LUT_sel, lut))
+        #
+        # Generate the symmetry-breaking constraints for each LUT (if symmetryBreaking)
+        #
+        if self.symmetryBreaking:
+            for lut in range(0, self.no_LUT):
+                c.append(self.__createSymmetryBreakingConstraints(m_idx_LUT_in, lut))
+        #
+        # Generate the constraints found by the feasibility check (if feasibilityCheck)
+        #
+        c += self.__createNarrowingConstraints(m_idx_final_out, m_idx_LUT_in)
+        #
+        # Generate Starting-Guesses
+        #
+        c += self.__createStartingGuesses(self.no_LUT, self.LUT_inputs, self.LUT_outputs, self.no_inputs, self.no_outputs, self.input_index_length, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out)
+        return c
+    def __selectBits(self, m_idx_LUT_sel, m_no_LUT, m_no_input):
+        # selector bits of one LUT-input, MSB first
+        offset = (m_no_LUT * self.LUT_inputs + m_no_input) * self.select_length
+        return m_idx_LUT_sel[offset : offset + self.select_length]
+    def __createMuxTree(self, m_bits, m_sources, m_offset):
+        #
+        # Balanced multiplexer over m_sources[m_offset : m_offset + 2 ** len(m_bits)], m_bits MSB first
+        # Used for the binary LUT-input selection and the mux LUT encoding (bits = LUT-inputs, sources = Loutx)
+        # Selector values >= input_index_length are excluded by createLutSelectConstraints, so such branches are left out
+        # Outputs of the same or later LUTs are passed as constant False, like in the onehot selection
+        #
+        if len(m_bits) == 0:
+            return m_sources[m_offset]
+        half = 2 ** (len(m_bits) - 1)
+        if m_offset + half >= len(m_sources):
+            return self.__createMuxTree(m_bits[1:], m_sources, m_offset)
+        return self.__foldIf(m_bits[0], self.__createMuxTree(m_bits[1:], m_sources, m_offset + half), self.__createMuxTree(m_bits[1:], m_sources, m_offset))
+
+    #
+    # Constant folding for the formulas of the cases: the global inputs of a case are Python bools
+    # The fold-functions take Python bools and cvc5 expressions and return a Python bool if the result is constant,
+    # so And(False, x), Or with False elements and And / Or with one element never reach cvc5
+    # The remaining terms are built by the term manager directly, the operands are known to be Boolean expressions
+    #
+    def __foldAnd(self, m_list):
+        c = []
+        for item in m_list:
+            if item is False:
+                return False
+            if item is not True:
+                c.append(item)
+        if len(c) == 0:
+            return True
+        if len(c) == 1:
+            return c[0]
+        return self.__mkBool(Kind.AND, c)
+    def __foldOr(self, m_list):
+        c = []
+        for item in m_list:
+            if item is True:
+                return True
+            if item is not False:
+                c.append(item)
+        if len(c) == 0:
+            return False
+        if len(c) == 1:
+            return c[0]
+        return self.__mkBool(Kind.OR, c)
+    def __foldNot(self, m_item):
+        if isinstance(m_item, bool):
+            return not m_item
+        if isinstance(m_item, int):
+            return -m_item
+        return self.__mkBool(Kind.NOT, [m_item])
+    def __foldIf(self, m_cond, m_then, m_else):
+        if isinstance(m_cond, bool):
+            return m_then if m_cond else m_else
+        if isinstance(m_then, bool) and isinstance(m_else, bool):
+            return m_then if m_then == m_else else (m_cond if m_then else self.__foldNot(m_cond))
+        if isinstance(m_then, bool):
+            return self.__foldOr([m_cond, m_else]) if m_then else self.__foldAnd([self.__foldNot(m_cond), m_else])
+        if isinstance(m_else, bool):
+            return self.__foldOr([self.__foldNot(m_cond), m_then]) if m_else else self.__foldAnd([m_cond, m_then])
+        return self.__mkBool(Kind.ITE, [m_cond, m_then, m_else])
+    def __foldEq(self, m_value, m_item):
+        # m_value is the expected (Python bool) value of the formula m_item
+        if isinstance(m_item, bool):
+            return m_item == bool(m_value)
+        return m_item if m_value else self.__foldNot(m_item)
+    def __foldIff(self, m_left, m_right):
+        if isinstance(m_left, bool):
+            return self.__foldEq(m_left, m_right)
+        if isinstance(m_right, bool):
+            return self.__foldEq(m_right, m_left)
+        return self.__mkBool(Kind.EQUAL, [m_left, m_right])
+    def __mkBool(self, m_kind, m_items):
+        #
+        # With the clause encoder the items are integer literals and the node is a gate of the clause solver
+        # Hash-consing: structurally equal nodes (same kind, same children) are built once and shared by all cases
+        #
+        if isinstance(m_items[0], int):
+            return self.__sol.gate(m_kind, m_items)
+        key = (m_kind,) + tuple(item.ast for item in m_items)
+        node = self.__nodes.get(key)
+        if node is None:
+            node = BoolRef(_termFactory(m_items[0].ctx).mkTerm(m_kind, *key[1:]), m_items[0].ctx)
+            self.__nodes[key] = node
+        return node
+
     def __createFinalOutputConstraints(self, m_idx_final_out, m_no_output):
         offset = self.no_LUT * self.LUT_outputs
         c = []
-        temp = []
+        # At Least One LUT-Output for each global output
         c.append(Or(m_idx_final_out[offset * m_no_output : offset * (m_no_output + 1)]))
-        for i in range(0, offset):
-            for k in range(0, offset):
-                if i != k and not [i, k] in temp and not [k, i] in temp:
-                    temp.append([i, k])
-                    c.append(True == Or(Not(m_idx_final_out[m_no_output * offset + i]),
-                                        Not(m_idx_final_out[m_no_output * offset + k])))
+        # At Most One LUT-Output for each global output
+        c += self.__createAtMostOne(m_idx_final_out[offset * m_no_output : offset * (m_no_output + 1)], 'F' + str(m_no_output))
         if len(c) > 1:
             return And(c)
         else:
-            if len(c) < 1:
-                c.append(True == m_idx_final_out[0])
             return c[0]
-    def __createLutInputConstraints(self, m_idx_LUT_in, m_no_LUT):
+    def __createLutInputConstraints(self, m_idx_LUT_in, m_idx_LUT_sel, m_no_LUT):
+        if self.__input_selection == 'binary':
+            return self.__createLutSelectConstraints(m_idx_LUT_sel, m_no_LUT)
         index_offset = m_no_LUT * self.LUT_inputs * self.input_index_length
         c = []
         for no_in in range(0, self.LUT_inputs):
             # At Least One of each LUT-Input
             c.append(Or(m_idx_LUT_in[index_offset + no_in * self.input_index_length
                                    : index_offset + (no_in + 1) * self.input_index_length]))
-            temp = []
-            for i in range(0, self.input_index_length):
-                for k in range(0, self.input_index_length):
-                    if i != k and not [i, k] in temp and not [k, i] in temp:
-                        temp.append([i, k])
-                        # At Most One of each LUT-Input
-                        c.append(Or(Not(m_idx_LUT_in[index_offset + no_in * self.input_index_length + i]),
-                                    Not(m_idx_LUT_in[index_offset + no_in * self.input_index_length + k])))
+            # At Most One of each LUT-Input
+            c += self.__createAtMostOne(m_idx_LUT_in[index_offset + no_in * self.input_index_length
+                                                     : index_offset + (no_in + 1) * self.input_index_length],
+                                        'L' + str(m_no_LUT) + 'i' + str(no_in))
         for x in range(0, self.input_index_length):
-            temp = []
-            for i in range(0, self.LUT_inputs):
-                for k in range(0, self.LUT_inputs):
-                    if i != k and not [i, k] in temp and not [k, i] in temp:
-                        temp.append([i, k])
-                        # At Most One of each Signal in self.input_index_length
-                        c.append(Or(Not(m_idx_LUT_in[index_offset + i * self.input_index_length + x]),
-                                    Not(m_idx_LUT_in[index_offset + k * self.input_index_length + x])))
+            # At Most One of each Signal in self.input_index_length
+            c += self.__createAtMostOne([m_idx_LUT_in[index_offset + i * self.input_index_length + x] for i in range(0, self.LUT_inputs)],
+                                        'L' + str(m_no_LUT) + 's' + str(x))
         return And(c)
+    def __createLutSelectConstraints(self, m_idx_LUT_sel, m_no_LUT):
+        # binary selection: no ALO / AMO needed, only the range of each selector and distinct selectors per LUT
+        c = []
+        for no_in in range(0, self.LUT_inputs):
+            # Selector < input_index_length: if all higher 1-bits of the bound are set, no 0-bit of the bound may be set
+            bits = self.__selectBits(m_idx_LUT_sel, m_no_LUT, no_in)
+            bound = self.input_index_length - 1
+            for i in range(0, len(bits)):
+                if not (bound >> (len(bits) - 1 - i)) & 1:
+                    c.append(Or([Not(bits[i])] + [Not(bits[j]) for j in range(0, i) if (bound >> (len(bits) - 1 - j)) & 1]))
+        for i in range(0, self.LUT_inputs):
+            for k in range(i + 1, self.LUT_inputs):
+                # Each Signal at most once per LUT: the selectors of two inputs differ in at least one bit
+                bits_i = self.__selectBits(m_idx_LUT_sel, m_no_LUT, i)
+                bits_k = self.__selectBits(m_idx_LUT_sel, m_no_LUT, k)
+                c.append(Or([Xor(bits_i[b], bits_k[b]) for b in range(0, len(bits_i))]))
+        if len(c) > 1:
+            return And(c)
+        elif len(c) == 1:
+            return c[0]
+        return BoolVal(True)
+    def __createSymmetryBreakingConstraints(self, m_idx_LUT_in, m_no_LUT):
+        #
+        # Permuting the inputs of a LUT (together with its truth table) or swapping two neighbouring LUTs that do not
+        # feed one another gives the same network. Only one ordering of each is allowed:
+        # - the inputs of a LUT select their sources in strictly ascending order
+        # - if LUT n does not use an output of LUT n-1, the first source of LUT n-1 is not above the first source of LUT n
+        # Starting guesses have to connect the inputs of a LUT in ascending order (like defaultStartingGuesses) to stay compatible
+        #
+        index_offset = m_no_LUT * self.LUT_inputs * self.input_index_length
+        c = []
+        for no_in in range(0, self.LUT_inputs - 1):
+            for x in range(0, self.input_index_length):
+                # Input no_in selects x -> Input no_in + 1 selects a source above x
+                c.append(self.__createOr([Not(m_idx_LUT_in[index_offset + no_in * self.input_index_length + x])]
+                                         + m_idx_LUT_in[index_offset + (no_in + 1) * self.input_index_length + x + 1
+                                                        : index_offset + (no_in + 2) * self.input_index_length]))
+        if m_no_LUT > 0:
+            prev_offset = (m_no_LUT - 1) * self.LUT_inputs * self.input_index_length
+            # the outputs of the previous LUT are the sources no_inputs + (m_no_LUT - 1) * LUT_outputs + o
+            feeds = []
+            for no_in in range(0, self.LUT_inputs):
+                for o in range(0, self.LUT_outputs):
+                    feeds.append(m_idx_LUT_in[index_offset + no_in * self.input_index_length + self.no_inputs + (m_no_LUT - 1) * self.LUT_outputs + o])
+            for x in range(0, self.input_index_length):
+                # previous LUT starts with x and is not used -> this LUT starts with a source not below x
+                c.append(self.__createOr(feeds + [Not(m_idx_LUT_in[prev_offset + x])]
+                                         + m_idx_LUT_in[index_offset + x : index_offset + self.input_index_length]))
+        if len(c) > 1:
+            return And(c)
+        elif len(c) == 1:
+            return c[0]
+        return BoolVal(True)
+    def __createNarrowingConstraints(self, m_idx_final_out, m_idx_LUT_in):
+        #
+        # A global output is only driven by the LUTs in final_LUTs, no LUT-input is connected to an excluded global input
+        # (inputs are only excluded without starting guesses, see checkFeasibility)
+        #
+        c = []
+        for g_out in range(0, self.no_outputs):
+            for lut in range(0, self.no_LUT):
+                if lut not in self.__final_LUTs[g_out]:
+                    for outs in range(0, self.LUT_outputs):
+                        c.append(Not(m_idx_final_out[g_out * self.no_LUT * self.LUT_outputs + lut * self.LUT_outputs + outs]))
+        for lut in range(0, self.no_LUT):
+            for ins in range(0, self.LUT_inputs):
+                for x in self.__excluded_inputs:
+                    c.append(Not(m_idx_LUT_in[lut * self.LUT_inputs * self.input_index_length + ins * self.input_index_length + x]))
+        return c
+    def __createHints(self, m_idx_final_out, m_idx_LUT_in):
+        # the starting hints of decompositionGuesses as assumptions of the solver (see checkWithHints)
+        c = []
+        for lut, ins, x in self.__hint_sources:
+            c.append(m_idx_LUT_in[lut * self.LUT_inputs * self.input_index_length + ins * self.input_index_length + x])
+        for g_out, lut_out in self.__hint_final:
+            c.append(m_idx_final_out[g_out * self.no_LUT * self.LUT_outputs + lut_out])
+        return c
+    def __createBlockingClause(self, m_network, m_idx_final_out, m_idx_LUT_in, m_modulo_symmetry):
+        #
+        # Clause that excludes the wiring of m_network (see enumerateSolutions): a global output is driven by another
+        # LUT-output or a used LUT-input selects another source (with m_modulo_symmetry: a used LUT reads none of its
+        # inputs anymore on any of its LUT-inputs)
+        # A LUT-input is used if the truth table of its LUT depends on it, a LUT if a global output depends on it
+        #
+        relevant = []
+        for lut in range(0, self.no_LUT):
+            size = 2 ** len(m_network.sources[lut])
+            relevant.append([ins for ins in range(0, len(m_network.sources[lut]))
+                             if any(table[index] != table[index ^ 2 ** (len(m_network.sources[lut]) - 1 - ins)] for table in m_network.tables[lut] for index in range(0, size))])
+        used = set()
+        stack = [out // self.LUT_outputs for out in m_network.final]
+        while len(stack) > 0:
+            lut = stack.pop()
+            if lut not in used:
+                used.add(lut)
+                stack += [(m_network.sources[lut][ins] - self.no_inputs) // self.LUT_outputs for ins in relevant[lut] if m_network.sources[lut][ins] >= self.no_inputs]
+        c = []
+        for g_out in range(0, self.no_outputs):
+            c.append(Not(m_idx_final_out[g_out * self.no_LUT * self.LUT_outputs + m_network.final[g_out]]))
+        for lut in sorted(used):
+            offset = lut * self.LUT_inputs * self.input_index_length
+            if m_modulo_symmetry:
+                for x in sorted(set(m_network.sources[lut][ins] for ins in relevant[lut])):
+                    c.append(Not(self.__createOr([m_idx_LUT_in[offset + ins * self.input_index_length + x] for ins in range(0, self.LUT_inputs)])))
+            else:
+                for ins in relevant[lut]:
+                    c.append(Not(m_idx_LUT_in[offset + ins * self.input_index_length + m_network.sources[lut][ins]]))
+        return self.__createOr(c)
+    def __checkWithHints(self, m_sol, m_hints, m_assumptions=(), m_process='-'):
+        #
+        # Check with the starting hints as additional assumptions, so the solver starts near the hinted structure
+        # If there is no solution with the hints (unsat), they are removed from m_hints and the check is repeated without them
+        # The result is always the one of the problem without hints, unknown (e.g. the batch limit of inc) keeps the hints
+        #
+        if len(m_hints) > 0:
+            result = m_sol.check(*(list(m_assumptions) + m_hints))
+            if result != unsat:
+                return result
+            m_hints.clear()
+            if not self.benchmark:
+                logging.info("P%s: No solution with the starting hints, they are dropped", m_process)
+        return m_sol.check(*m_assumptions)
+    def __createOr(self, m_list):
+        # cvc5 needs at least two children for Or
+        if len(m_list) > 1:
+            return Or(m_list)
+        return m_list[0]
+    def __createAtMostOne(self, m_vars, m_name):
+        #
+        # Returns the clauses that allow at most one of m_vars to be True, encoded as selected by amoEncoding
+        # m_name has to be unique for every call, it is used to name the auxiliary variables of the encoding
+        #
+        encoding = self.__amo_encoding
+        if encoding == 'auto':
+            # pairwise is smallest for few variables, the sequential counter stays linear
+            # and the product encoding needs the fewest auxiliary variables for wide selections
+            if len(m_vars) <= 6:
+                encoding = 'pairwise'
+            elif len(m_vars) <= 32:
+                encoding = 'sequential'
+            else:
+                encoding = 'product'
+        c = []
+        if encoding == 'pairwise' or len(m_vars) < 3:
+            # Not(x_i) or Not(x_k) for every pair of variables
+            for i in range(0, len(m_vars)):
+                for k in range(i + 1, len(m_vars)):
+                    c.append(Or(Not(m_vars[i]), Not(m_vars[k])))
+        elif encoding == 'sequential':
+            # s_i is True if any of x_0 ... x_i is True (Sinz sequential counter)
+            s = [Bool('amo' + m_name + 's' + str(i)) for i in range(0, len(m_vars) - 1)]
+            c.append(Or(Not(m_vars[0]), s[0]))
+            for i in range(1, len(m_vars) - 1):
+                c.append(Or(Not(m_vars[i]), s[i]))
+                c.append(Or(Not(s[i - 1]), s[i]))
+                c.append(Or(Not(m_vars[i]), Not(s[i - 1])))
+            c.append(Or(Not(m_vars[-1]), Not(s[-1])))
+        elif encoding == 'commander':
+            # groups of three variables, each group sets its commander, at most one commander may be True
+            commanders = []
+            for g in range(0, (len(m_vars) + 2) // 3):
+                group = m_vars[3 * g : 3 * (g + 1)]
+                commanders.append(Bool('amo' + m_name + 'c' + str(g)))
+                for i in range(0, len(group)):
+                    c.append(Or(Not(group[i]), commanders[-1]))
+                    for k in range(i + 1, len(group)):
+                        c.append(Or(Not(group[i]), Not(group[k])))
+            c += self.__createAtMostOne(commanders, m_name + 'c')
+        elif encoding == 'product':
+            # the variables are placed on a grid, each variable sets its row and column (Chen 2-product)
+            rows = math.ceil(math.sqrt(len(m_vars)))
+            cols = math.ceil(len(m_vars) / rows)
+            u = [Bool('amo' + m_name + 'u' + str(i)) for i in range(0, rows)]
+            v = [Bool('amo' + m_name + 'v' + str(j)) for j in range(0, cols)]
+            for idx in range(0, len(m_vars)):
+                c.append(Or(Not(m_vars[idx]), u[idx // cols]))
+                c.append(Or(Not(m_vars[idx]), v[idx % cols]))
+            c += self.__createAtMostOne(u, m_name + 'u')
+            c += self.__createAtMostOne(v, m_name + 'v')
+        else:
+            logging.error("ERROR: unexpected amo encoding: %s", encoding)
+        return c
     
-    def __F_createLutInputFormula(self, m_idx_LUT_in, m_global_inputs, m_int_output_formulas, m_no_LUT, m_no_input):
-        # I = Or((A and X1), (B and X2), ... , (O0 and Xi), ...)
+    def __F_createLutInputFormula(self, m_idx_LUT_in, m_idx_LUT_sel, m_global_inputs, m_int_output_formulas, m_no_LUT, m_no_input):
+        if self.__input_selection == 'binary':
+            # I = If(S0, If(S1, ...), If(S1, ...)) over [A, B, ... , O0, ...]
+            sources = [bool(i) for i in m_global_inputs] + m_int_output_formulas[0 : m_no_LUT * self.LUT_outputs]
+            sources += [False] * (self.input_index_length - len(sources))
+            return self.__createMuxTree(self.__selectBits(m_idx_LUT_sel, m_no_LUT, m_no_input), sources, 0)
+        # I = Or((A and X1), (B and X2), ... , (O0 and Xi), ...), the global inputs are constants: Or(X of the inputs that are 1, ...)
         index_offset = m_no_LUT * self.LUT_inputs * self.input_index_length + m_no_input * self.input_index_length
         c = []
         for i in range(0, len(m_global_inputs)):
-            c.append(And(bool(m_global_inputs[i]), m_idx_LUT_in[index_offset + i]))
+            c.append(self.__foldAnd([bool(m_global_inputs[i]), m_idx_LUT_in[index_offset + i]]))
         for i in range(0, m_no_LUT * self.LUT_outputs):
-            c.append(And(m_int_output_formulas[i], m_idx_LUT_in[index_offset + len(m_global_inputs) + i]))
-        return Or(c)
+            c.append(self.__foldAnd([m_int_output_formulas[i], m_idx_LUT_in[index_offset + len(m_global_inputs) + i]]))
+        return self.__foldOr(c)
     def __F_createLutOutputFormular(self, m_idx_LUT_out, m_int_input_formulas, m_no_LUT, m_no_output):
+        table_offset = m_no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs) + m_no_output * (2 ** self.LUT_inputs)
+        if self.__lut_encoding == 'mux':
+            # O = If(I0, If(I1, ...), If(I1, ...)) over [Ox0, Ox1, ...]
+            return self.__createMuxTree(m_int_input_formulas[m_no_LUT * self.LUT_inputs : (m_no_LUT + 1) * self.LUT_inputs], m_idx_LUT_out[table_offset : table_offset + 2 ** self.LUT_inputs], 0)
         # O = Or((not_I0 and not_I1 and Ox0), (not_I0 and I1 and Ox1), ...)
+        # the literals [not_Ik, Ik] are built once and shared by all minterms
+        literals = []
+        for k in range(0, self.LUT_inputs):
+            formula = m_int_input_formulas[m_no_LUT * self.LUT_inputs + k]
+            literals.append([self.__foldNot(formula), formula])
         c = []
         for i in range(0, 2 ** self.LUT_inputs):
-            m_temp_bool = []
             m_temp_in = []
-            for j in range(self.LUT_inputs - 1, -1, -1):
-                m_temp_bool.append((int)(i / (2 ** j)) % 2)
             for k in range(0, self.LUT_inputs):
-                if bool(m_temp_bool[k]):
-                    m_temp_in.append(m_int_input_formulas[m_no_LUT * self.LUT_inputs + k])
-                else:
-                    m_temp_in.append(Not(m_int_input_formulas[m_no_LUT * self.LUT_inputs + k]))
-            m_temp_in.append(m_idx_LUT_out[m_no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs) + m_no_output * (2 ** self.LUT_inputs) + i])
-            c.append(And(m_temp_in))
-        return Or(c)
+                m_temp_in.append(literals[k][(i >> (self.LUT_inputs - 1 - k)) & 1])
+            m_temp_in.append(m_idx_LUT_out[table_offset + i])
+            c.append(self.__foldAnd(m_temp_in))
+        return self.__foldOr(c)
     def __F_createFinalOutputFormula(self, m_idx_final_out, m_int_output_formulas, m_no_out):
         offset = self.no_LUT * self.LUT_outputs
         c = []
         for i in range(0, offset):
-            c.append(And(m_int_output_formulas[i], m_idx_final_out[m_no_out * offset + i]))
-        if len(c) > 1:
-            return Or(c)
-        else:
-            return c[0]
+            c.append(self.__foldAnd([m_int_output_formulas[i], m_idx_final_out[m_no_out * offset + i]]))
+        return self.__foldOr(c)
     
-    def __ZV_createLutInputFormula(self, m_idx_LUT_in, m_internal_in, m_internal_out, m_global_inputs, m_no_LUT, m_no_input, m_case):
+    def __ZV_createLutInputFormula(self, m_idx_LUT_in, m_idx_LUT_sel, m_internal_in, m_internal_out, m_global_inputs, m_no_LUT, m_no_input):
+        # m_internal_in / m_internal_out are the internal variables of the case
+        if self.__input_selection == 'binary':
+            # I = If(S0, If(S1, ...), If(S1, ...)) over [A, B, C, ... , O0, ...]
+            sources = [bool(i) for i in m_global_inputs] + m_internal_out[0 : m_no_LUT * self.LUT_outputs]
+            sources += [False] * (self.input_index_length - len(sources))
+            return self.__foldIff(m_internal_in[m_no_LUT * self.LUT_inputs + m_no_input], self.__createMuxTree(self.__selectBits(m_idx_LUT_sel, m_no_LUT, m_no_input), sources, 0))
         # I = Or((A and X1), (B and X2), (C and X3), ...)
         index_offset = m_no_LUT * self.LUT_inputs * self.input_index_length + m_no_input * self.input_index_length
-        case_in_offset = m_case * self.no_LUT * self.LUT_inputs
-        case_out_offset = m_case * self.no_LUT * self.LUT_outputs
         c = []
         for i in range(0, len(m_global_inputs)):
-            c.append(And(bool(m_global_inputs[i]),
-                         m_idx_LUT_in[index_offset + i]))
+            c.append(self.__foldAnd([bool(m_global_inputs[i]),
+                                     m_idx_LUT_in[index_offset + i]]))
         for i in range(0, m_no_LUT * self.LUT_outputs):
-            c.append(And(m_internal_out[case_out_offset + i],
-                         m_idx_LUT_in[index_offset + len(m_global_inputs) + i]))
-        return m_internal_in[case_in_offset + m_no_LUT * self.LUT_inputs + m_no_input] == Or(c)
-    def __ZV_createLutOutputFormula(self, m_idx_LUT_out, m_internal_in, m_internal_out, m_no_LUT, m_no_output, m_case):
+            c.append(self.__foldAnd([m_internal_out[i],
+                                     m_idx_LUT_in[index_offset + len(m_global_inputs) + i]]))
+        return self.__foldIff(m_internal_in[m_no_LUT * self.LUT_inputs + m_no_input], self.__foldOr(c))
+    def __ZV_createLutOutputFormula(self, m_idx_LUT_out, m_internal_in, m_internal_out, m_no_LUT, m_no_output):
+        table_offset = m_no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs) + m_no_output * (2 ** self.LUT_inputs)
+        if self.__lut_encoding == 'mux':
+            # O0 = If(I0, If(I1, ...), If(I1, ...)) over [Ox0, Ox1, ...]
+            return self.__foldIff(m_internal_out[m_no_LUT * self.LUT_outputs + m_no_output], self.__createMuxTree(m_internal_in[m_no_LUT * self.LUT_inputs : (m_no_LUT + 1) * self.LUT_inputs], m_idx_LUT_out[table_offset : table_offset + 2 ** self.LUT_inputs], 0))
         # O0 = Or((not_I0 and not_I1 and Ox0), (not_I0 and I1 and Ox1), ...)
-        case_in_offset = m_case * self.no_LUT * self.LUT_inputs
-        case_out_offset = m_case * self.no_LUT * self.LUT_outputs
+        literals = []
+        for k in range(0, self.LUT_inputs):
+            internal_in = m_internal_in[m_no_LUT * self.LUT_inputs + k]
+            literals.append([self.__foldNot(internal_in), internal_in])
         c = []
         for i in range(0, 2 ** self.LUT_inputs):
-            config = []
             c2 = []
-            for j in range(0, self.LUT_inputs):
-                config.append((int)(i / (2 ** (self.LUT_inputs - 1 - j))) % 2)
             for k in range(0, self.LUT_inputs):
-                if bool(config[k]):
-                    c2.append(m_internal_in[m_no_LUT * self.LUT_inputs + k + case_in_offset])
-                else:
-                    c2.append(Not(m_internal_in[m_no_LUT * self.LUT_inputs + k + case_in_offset]))
-            c2.append(m_idx_LUT_out[m_no_LUT * self.LUT_outputs * (2 ** self.LUT_inputs)
-                                  + m_no_output * (2 ** self.LUT_inputs) + i])
-            c.append(And(c2))
-        return m_internal_out[case_out_offset + m_no_LUT * self.LUT_outputs + m_no_output] == Or(c)
-    def __ZV_createFinalOutputFormula(self, m_idx_final_out, m_internal_out, m_no_out, m_case):
+                c2.append(literals[k][(i >> (self.LUT_inputs - 1 - k)) & 1])
+            c2.append(m_idx_LUT_out[table_offset + i])
+            c.append(self.__foldAnd(c2))
+        return self.__foldIff(m_internal_out[m_no_LUT * self.LUT_outputs + m_no_output], self.__foldOr(c))
+    def __ZV_createFinalOutputFormula(self, m_idx_final_out, m_internal_out, m_no_out):
         # fO0 = Or((O0 and Fx0), (O1 and Fx1), (O2 and Fx2), ...)
         output_offset = self.no_LUT * self.LUT_outputs
-        case_out_offset = m_case * self.no_LUT * self.LUT_outputs
         c = []
         for i in range(0, output_offset):
-            c.append(And(m_internal_out[case_out_offset + i],
-                         m_idx_final_out[m_no_out * output_offset + i]))
-        if len(c) > 1:
-            return Or(c)
-        else:
-            return c[0]
+            c.append(self.__foldAnd([m_internal_out[i],
+                                     m_idx_final_out[m_no_out * output_offset + i]]))
+        return self.__foldOr(c)
     
+    def __createInputBitsets(self):
+        # bit 'case' of inputs[i] is the value of global input i in that case (see LUT_Network.inputBitsets)
+        return LUT_Network.inputBitsets(self.no_inputs)
+    def __createTruthTableBitsets(self):
+        # bit 'case' of expected[g_out] is the expected value of global output g_out in that case (0 for a don't care)
+        expected = []
+        for g_out in range(0, self.no_outputs):
+            expected.append(int(''.join('1' if out else '0' for out in reversed(self.__truth_table[g_out])), 2))
+        return expected
+    def __createCareBitsets(self):
+        # bit 'case' of care[g_out] is 0 if global output g_out is don't care in that case
+        care = []
+        for g_out in range(0, self.no_outputs):
+            care.append(int(''.join('0' if out is None else '1' for out in reversed(self.__truth_table[g_out])), 2))
+        return care
+    def __decodeLutConfiguration(self, m, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out):
+        # Read the LUT-structure from a model as a LUT_Network
+        sources = []
+        tables = []
+        for lut in range(0, self.no_LUT):
+            sources.append([])
+            for ins in range(0, self.LUT_inputs):
+                for x in range(0, self.input_index_length):
+                    if is_true(m.eval(m_idx_LUT_in[lut * self.LUT_inputs * self.input_index_length + ins * self.input_index_length + x])):
+                        sources[lut].append(x)
+                        break
+            tables.append([])
+            for outs in range(0, self.LUT_outputs):
+                tables[lut].append([is_true(m.eval(m_idx_LUT_out[lut * self.LUT_outputs * (2 ** self.LUT_inputs) + outs * (2 ** self.LUT_inputs) + case]))
+                                    for case in range(0, 2 ** self.LUT_inputs)])
+        final = []
+        for g_out in range(0, self.no_outputs):
+            for i in range(0, self.no_LUT * self.LUT_outputs):
+                if is_true(m.eval(m_idx_final_out[g_out * self.no_LUT * self.LUT_outputs + i])):
+                    final.append(i)
+                    break
+        return LUT_Network(self.no_inputs, self.LUT_outputs, sources, tables, final)
     def __printResultingLutConfiguration(self, m, m_idx_final_out, m_idx_LUT_in, m_idx_LUT_out, m_process='-'):
         logging.info("P%s: Printing resulting LUT configuration", m_process)
         for lut in range(0, self.no_LUT):
             s_ins = ''
             for ins in range(0, self.LUT_inputs):
                 for x in range(0, self.input_index_length):
-                    if m[m_idx_LUT_in[lut * self.LUT_inputs * self.input_index_length + ins * self.input_index_length + x]]:
+                    if is_true(m.eval(m_idx_LUT_in[lut * self.LUT_inputs * self.input_index_length + ins * self.input_index_length + x])):
                         if x > self.no_inputs - 1:
                             if len(s_ins) > 0:
                                 s_ins += ', '
@@ -13,6 +13,7 @@ if __name__ == '__main__':
     lg.setVersion('inc')
     lg.setExecutionMode('F')
     lg.printConfig = True
+    lg.feasibilityCheck = False
 
     lg.no_LUT = 2
     lg.LUT_inputs = 5
@@ -13,6 +13,7 @@ if __name__ == '__main__':
     lg.setVersion('parallel')
     lg.setExecutionMode('F')
     lg.printConfig = True
+    lg.feasibilityCheck = False
     lg.no_processes = 4
     lg.depth = 2
     
@@ -15,6 +15,7 @@ if __name__ == '__main__':
     lg.benchmark = False
     lg.no_processes = 4
     lg.depth = 2
+    lg.decompositionGuesses = True
     
     lg.no_LUT = 2
     lg.LUT_inputs = 5
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import sys, os
+import random
+import pytest
+
+pytest.importorskip('cvc5')
+# Add the path to the SAT_core folder in order to import the Logic_Generator:
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from SAT_core.core import *
+
+#
+# Behaviour tests of the parts of the Logic_Generator that work on the truth table (no solver is needed for them),
+# the private methods are reached by their mangled names
+#
+
+def createGenerator(m_truth_table, m_no_LUT, m_LUT_inputs, m_LUT_outputs=1):
+    #
+    # Logic_Generator for the function given as truth_table[g_out][case], prepared like runSolver does it
+    # but without running the solver (truth table, feasibility check with feasibilityCheck = False)
+    #
+    no_inputs = (len(m_truth_table[0]) - 1).bit_length()
+    lg = Logic_Generator()
+    lg.benchmark = True
+    lg.feasibilityCheck = False
+    lg.no_LUT = m_no_LUT
+    lg.LUT_inputs = m_LUT_inputs
+    lg.LUT_outputs = m_LUT_outputs
+    lg.no_inputs = no_inputs
+    lg.no_outputs = len(m_truth_table)
+    def calcOutput(m_list_in, m_no_out=0):
+        case = sum(int(bit) << (no_inputs - 1 - i) for i, bit in enumerate(m_list_in))
+        return m_truth_table[m_no_out][case]
+    lg._Logic_Generator__calcOutput = calcOutput
+    lg._Logic_Generator__createStartingGuesses = lambda *args: []
+    assert lg._Logic_Generator__prepareProblem('basic')
+    return lg
+
+def randomNetwork(m_rng, m_no_inputs, m_no_LUT, m_LUT_inputs, m_LUT_outputs, m_no_outputs):
+    # LUT_Network with random connections (global inputs or outputs of earlier LUTs) and random truth tables
+    sources = [m_rng.sample(range(0, m_no_inputs + lut * m_LUT_outputs), m_LUT_inputs) for lut in range(0, m_no_LUT)]
+    tables = [[[m_rng.random() < 0.5 for index in range(0, 2 ** m_LUT_inputs)] for outs in range(0, m_LUT_outputs)] for lut in range(0, m_no_LUT)]
+    final = [m_rng.randrange(0, m_no_LUT * m_LUT_outputs) for g_out in range(0, m_no_outputs)]
+    return LUT_Network(m_no_inputs, m_LUT_outputs, sources, tables, final)
+
+def truthTable(m_network, m_rng=None, m_dont_care=0.0):
+    # truth table of the network, with m_dont_care of the entries replaced by None
+    no_cases = 2 ** m_network.no_inputs
+    return [[None if m_rng is not None and m_rng.random() < m_dont_care else bool((bits >> case) & 1) for case in range(0, no_cases)]
+            for bits in m_network.simulate()]
+
+STRUCTURES = [(5, 2, 3, 1, 1), (6, 2, 4, 1, 1), (6, 3, 3, 1, 2), (6, 2, 3, 2, 2), (7, 3, 4, 1, 3)]
+
+def npnVariant(m_rng, m_function):
+    #
+    # Function equivalent to m_function for every LUT-structure: the inputs permuted and negated, the outputs permuted
+    # and all of them negated or none (negating single outputs is no equivalence: (A, A) needs one LUT-output, (A, !A) two)
+    #
+    no_inputs = (len(m_function[0]) - 1).bit_length()
+    perm = m_rng.sample(range(0, no_inputs), no_inputs)
+    neg = [m_rng.random() < 0.5 for i in range(0, no_inputs)]
+    order = m_rng.sample(range(0, len(m_function)), len(m_function))
+    flip = m_rng.random() < 0.5
+    variant = [[] for g_out in range(0, len(m_function))]
+    for case in range(0, 2 ** no_inputs):
+        source = 0
+        for i in range(0, no_inputs):
+            bit = ((case >> (no_inputs - 1 - i)) & 1) ^ neg[i]
+            source |= bit << (no_inputs - 1 - perm[i])
+        for g_out in range(0, len(m_function)):
+            out = m_function[order[g_out]][source]
+            variant[g_out].append(None if out is None else out != flip)
+    return variant
+
+def npnCanonical(m_lg):
+    return m_lg._Logic_Generator__npnCanonical(m_lg._Logic_Generator__createTruthTableBitsets(), m_lg._Logic_Generator__createCareBitsets())
+
+@pytest.mark.parametrize('m_structure', STRUCTURES)
+def test_npnRoundTrip(m_structure):
+    #
+    # A network of a function mapped to the representative of its NPN class (as the result database stores it) and from
+    # there to an NPN variant of the function (as a database hit returns it) implements that variant
+    # All ties of the canonicalization are tried, so both functions meet in the same representative
+    #
+    no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs = m_structure
+    rng = random.Random(repr(m_structure))
+    for trial in range(0, 20):
+        network = randomNetwork(rng, no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs)
+        function = truthTable(network, rng, 0.1 if trial % 2 else 0.0)
+        variant = npnVariant(rng, function)
+        lg_function = createGenerator(function, no_LUT, LUT_inputs, LUT_outputs)
+        lg_variant = createGenerator(variant, no_LUT, LUT_inputs, LUT_outputs)
+        lg_function.npnBudget = lg_variant.npnBudget = 2 ** 20
+        representative, transform = npnCanonical(lg_function)
+        representative_variant, transform_variant = npnCanonical(lg_variant)
+        assert representative == representative_variant
+        stored = lg_function._Logic_Generator__npnTransformNetwork(network.sources, network.tables, network.final, transform, False)
+        sources, tables, final = lg_variant._Logic_Generator__npnTransformNetwork(*stored, transform_variant, True)
+        assert LUT_Network(no_inputs, LUT_outputs, sources, tables, final).mismatches(variant) == []
+
+def test_npnBudgetKeepsTheTransformationCorrect():
+    # with a small npnBudget equivalent functions may miss each other, but the transformation to the representative stays correct
+    rng = random.Random(0)
+    for trial in range(0, 20):
+        network = randomNetwork(rng, 6, 2, 3, 2, 2)
+        function = truthTable(network)
+        lg_function = createGenerator(function, 2, 3, 2)
+        lg_function.npnBudget = 1
+        representative, transform = npnCanonical(lg_function)
+        stored = lg_function._Logic_Generator__npnTransformNetwork(network.sources, network.tables, network.final, transform, False)
+        assert LUT_Network(6, 2, *stored).simulate() == [expected for care, expected in representative]
+        sources, tables, final = lg_function._Logic_Generator__npnTransformNetwork(*stored, transform, True)
+        assert LUT_Network(6, 2, sources, tables, final).mismatches(function) == []
+
+@pytest.mark.parametrize('m_no_inputs', [2, 5, 8])
+def test_caseOrdersArePermutations(m_no_inputs):
+    # every case order adds each case exactly once
+    rng = random.Random(m_no_inputs)
+    function = [[rng.choice([True, False, None]) for case in range(0, 2 ** m_no_inputs)] for g_out in range(0, 2)]
+    lg = createGenerator(function, 2, 2)
+    for case_order in ['ascending', 'descending', 'gray', 'random', 'balanced', 'diverse', 'hardest']:
+        for seed in range(0, 3):
+            assert sorted(lg._Logic_Generator__createCaseOrder(case_order, seed)) == list(range(0, 2 ** m_no_inputs))
+
+@pytest.mark.parametrize('m_structure', STRUCTURES)
+def test_feasibilityCheckAcceptsKnownSolutions(m_structure):
+    #
+    # The feasibility check has no reason against a function that a network of the structure implements,
+    # and it lets the LUT that drives an output in that network drive it
+    #
+    no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs = m_structure
+    rng = random.Random(repr(m_structure))
+    for trial in range(0, 20):
+        network = randomNetwork(rng, no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs)
+        lg = createGenerator(truthTable(network, rng, 0.1 if trial % 2 else 0.0), no_LUT, LUT_inputs, LUT_outputs)
+        assert lg._Logic_Generator__checkFeasibility() is None
+        for g_out in range(0, no_outputs):
+            assert network.final[g_out] // LUT_outputs in lg._Logic_Generator__final_LUTs[g_out]
+
+def test_feasibilityCheckKeepsInputsOfStartingGuesses():
+    # f = A ^ (B & C) ^ D does not depend on F, but a starting guess connects F to input 0 of LUT 0
+    def guess(m_no_LUT, m_LUT_inputs, m_LUT_outputs, m_no_inputs, m_no_outputs, m_input_index_length, m_index_final_output, m_index_LUT_inputs, m_index_LUT_outputs):
+        return [m_index_LUT_inputs[5] == True]
+    lg = Logic_Generator()
+    lg.benchmark = True
+    lg.setVersion('basic')
+    lg.no_LUT = 2
+    lg.LUT_inputs = 4
+    lg.no_inputs = 6
+    lg.runSolver(lambda m_list_in, m_no_out=0: bool(m_list_in[0] ^ (m_list_in[1] & m_list_in[2]) ^ m_list_in[3]), guess)
+    assert lg.result is not None
+    assert lg.result.sources[0][0] == 5
+    assert lg.verifyResult() == []
+
+@pytest.mark.parametrize('m_structure', STRUCTURES)
+def test_evaluatorMatchesSimulate(m_structure):
+    # the compiled NumPy evaluator returns the packed outputs of simulate (output 0 = MSB), also over several chunks
+    np = pytest.importorskip('numpy')
+    no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs = m_structure
+    rng = random.Random(repr(m_structure))
+    for trial in range(0, 10):
+        network = randomNetwork(rng, no_inputs, no_LUT, LUT_inputs, LUT_outputs, no_outputs)
+        namespace = {}
+        exec(network.toSource('evaluate', 16), namespace)
+        cases = np.array(rng.sample(range(0, 2 ** no_inputs), 2 ** no_inputs))
+        expected = [sum(((bits >> int(case)) & 1) << (no_outputs - 1 - g_out) for g_out, bits in enumerate(network.simulate())) for case in cases]
+        assert namespace['evaluate'](cases).tolist() == expected
+        assert network.compile()(cases).tolist() == expected
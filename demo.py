@@ -27,12 +27,40 @@ if __name__ == '__main__':
     #
     # change parameters of LG if needed and fit them to your specific problem
     #
-    lg.setVersion('parallel')       # Version can be basic, inc or parallel, recommended: parallel
+    lg.setVersion('parallel')       # Version can be basic, inc, parallel, cegis or portfolio, recommended: parallel
     lg.setExecutionMode('F')        # Mode can be F or ZV, recommended: F
+    lg.setInputSelection('onehot')  # LUT-input selection can be onehot or binary (multiplexer tree over select_length bits), recommended: onehot
+    lg.setLutEncoding('minterm')    # LUT truth tables can be evaluated as a sum of minterms (minterm) or as a multiplexer tree over the Loutx bits (mux)
+    lg.setAmoEncoding('auto')       # Encoding of the at-most-one constraints, can be auto, pairwise, sequential, commander or product, recommended: auto
+    lg.setEncoder('pythonic')       # Encoder can be pythonic (cvc5 expressions) or clauses (numbered variables and integer clauses), clauses only for basic and inc
+    lg.setBackend('cvc5')           # Backend of the clause encoder can be cvc5 (in this process), dimacs or smtlib (write the problem and run solverCommand on it)
+    lg.setCaseOrder('ascending')    # Order in which inc and parallel add the cases: ascending, descending, gray, random, balanced, diverse or hardest (cases that refuted structures in previous runs first)
     lg.printConfig = True           # should a LUT-structure be printed if one is found, recommended: True
     lg.benchmark = False            # if True, only output the final meassured time, recommended: False
+    lg.symmetryBreaking = False     # if True, only one ordering of permutable LUT-inputs and independent LUTs is searched, starting guesses must connect LUT-inputs in ascending order
+    lg.batchedOutput = False        # if True, calcOutput is called once for all cases (see calcMuxBatched), needs NumPy
     lg.no_processes = 4             # How many parallel Processes should be started, only applicable if version == parallel
     lg.depth = 2                    # How many parameters should set different processes appart, must be fitted to no_processes
+    lg.progressInterval = 1.0       # Minimum time in s between two progress reports of the parallel processes
+    lg.dynamicCubes = False         # if True, the parallel version splits the search space into cubes at runtime, depth is ignored
+    lg.cubeSplitTime = 1.0          # Minimum time in s a process works on a cube before it is split for an idle process
+    lg.cegisCounterexamples = 4     # How many wrong cases are added to the working set per solver call, only applicable if version == cegis
+    lg.incBatchTime = 0.1           # Target time in s of one solver call of the inc version, batches of cases grow while the calls are faster and shrink otherwise, 0: one case per call
+    lg.incBatchResources = 10 ** 5  # Resource units (reproducible-resource-limit of cvc5) after which a solver call of the inc version on more than one case is stopped and repeated with half of the cases, 0: no limit
+    lg.caseOrderSeed = 0            # Seed of the case order random (and default seed of the portfolio configurations)
+    lg.decompositionGuesses = False # if True, a decomposition of the truth table proposes LUT-inputs that are tried first (as assumptions of the solver, dropped if they prevent a solution)
+    lg.feasibilityCheck = True      # if True, the truth table is checked against the LUT-structure before the solver runs: impossible structures end as unsat, global inputs no output depends on are not connected (only without starting guesses)
+    lg.feasibilityCheckBudget = 2 ** 20 # Maximum number of steps the feasibility check spends on the cofactors of one output and LUT, larger decompositions are not checked (also limits the search of decompositionGuesses)
+    lg.portfolio = []               # configurations of the processes if version == portfolio, e.g. [{'exe_mode': 'ZV', 'case_order': 'random', 'seed': 1, 'options': {'sat-solver': 'cadical'}}], empty: no_processes different defaults
+    lg.cancelTimeout = 1.0          # Time in s the processes of a worker pool get to end a cancelled job before they are terminated and replaced
+    lg.cacheDir = None              # directory of the on-disk encoding cache (e.g. '.lg_cache'), None: no cache, only applicable if version == basic or inc with the encoder pythonic, also keeps the statistics of the case order hardest
+    lg.cacheMaxSize = 256 * 2 ** 20 # Maximum size of the encoding cache (and the result database) in bytes, the least recently used entries are removed first
+    lg.resultDatabase = False       # if True, results are stored in cacheDir per NPN class (input permutation / negation, output negation) and equivalent functions are answered without the solver, only without starting guesses
+    lg.npnBudget = 2 ** 12          # Maximum number of candidate transformations the NPN canonicalization of resultDatabase tries for inputs with equal cofactor counts
+    lg.dimacsFile = None            # file the clause encoder writes the clauses to in DIMACS format (e.g. 'problem.cnf'), None: no file, only applicable if encoder == clauses
+    lg.smtlibFile = None            # file the clause encoder writes the problem to in SMT-LIB2 format (e.g. 'problem.smt2'), None: no file, only applicable if encoder == clauses
+    lg.solverCommand = None         # solver binary and its arguments for the backends dimacs and smtlib (e.g. ['kissat', '-q']), None: the problem is only written to dimacsFile / smtlibFile
+    lg.evaluatorFile = None         # file the found LUT-structure is written to as a Python/NumPy module with evaluate(cases) (e.g. 'network.py'), None: no file
 
     lg.no_LUT = 2                   # numer of generated LUTs
     lg.LUT_inputs = 4               # numer of generated inputs per LUT
@@ -49,6 +77,7 @@ if __name__ == '__main__':
     # write a calcOutput-function, that needs to be given to the LG when running
     # it. From a list of inputs and the number of the output, return if this
     # output should be True or False for that input-configuration
+    # return None if the output does not matter for that input-configuration (don't care)
     #
     def calcMux(m_list_in, m_no_out = 1):
         if bool(m_list_in[0]) and bool(m_list_in[1]):
@@ -59,6 +88,17 @@ if __name__ == '__main__':
             return bool(m_list_in[4])
         return bool(m_list_in[5])
 
+    #
+    # alternatively write a batched calcOutput-function and set lg.batchedOutput = True
+    # it is called only once with a NumPy-array of shape (2 ** no_inputs, no_inputs) holding
+    # the inputs of all cases and returns a boolean matrix of shape (2 ** no_inputs, no_outputs)
+    # don't cares are None in an object matrix or NaN in a float matrix
+    #
+    def calcMuxBatched(m_array_in):
+        a, b = m_array_in[:, 0], m_array_in[:, 1]
+        out = (a & b & m_array_in[:, 2]) | (a & ~b & m_array_in[:, 3]) | (~a & b & m_array_in[:, 4]) | (~a & ~b & m_array_in[:, 5])
+        return (out & 1).astype(bool).reshape(-1, 1)
+
     #
     # write starting-guesses for the solver. If not wanted, return an empty list []
     # a common example is to connect the first inputs to the first LUT
@@ -76,5 +116,42 @@ if __name__ == '__main__':
     # starting-guesses nd parameters
     #    
     lg.runSolver(calcMux, defaultStartingGuesses)
+
+    #
+    # the found LUT-structure is kept in lg.result (None if there is no solution) and can be evaluated without the solver
+    # simulate() returns one bitset per global output (bit 'case' is the output in that case), verifyResult() the first
+    # cases in which it differs from the truth table (an empty list if it is correct)
+    #
+    if lg.result is not None:
+        lg.log("Outputs: " + str([bin(out) for out in lg.result.simulate()]))
+        lg.log("Mismatches: " + str(lg.verifyResult()))
+
+    #
+    # compile() turns the found LUT-structure into a NumPy function that evaluates batches of cases (input 0 = MSB),
+    # e.g. from a memory-mapped array np.load('cases.npy', mmap_mode='r'), and returns the packed outputs (output 0 = MSB)
+    # toSource() returns the code of that function, it is written to evaluatorFile after runSolver
+    #
+    if lg.result is not None and np is not None:
+        evaluate = lg.result.compile()
+        lg.log("Outputs of the cases 0 ... 7: " + str(evaluate(np.arange(8))))
+
+    #
+    # enumerateSolutions yields up to the given number of LUT-structures that differ in their used connections,
+    # each one with the time of its solver call. The problem is encoded once and the solver is kept between the solutions
+    # with m_modulo_symmetry = True, structures that only differ in the order of the inputs of a LUT count as one
+    #
+    for network, solve_time in lg.enumerateSolutions(calcMux, defaultStartingGuesses, 3):
+        lg.log("Alternative structure " + str(network.sources) + " found in " + str(solve_time) + " s")
+
+    #
+    # to solve many problems in a row (e.g. a sweep over LUT sizes), use the LG as a context manager
+    # the processes of the parallel and the portfolio version are then kept alive between the calls of runSolver
+    # and reuse the encoding of a problem they already worked on (the dynamic cubes still start their own processes)
+    #
+    with lg:
+        for lut_inputs in range(2, 5):
+            lg.LUT_inputs = lut_inputs
+            lg.updateInputIndexLength()
+            lg.runSolver(calcMux, defaultStartingGuesses)
     
 